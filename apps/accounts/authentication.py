@@ -1,10 +1,22 @@
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import AccessToken
+from .tokens import get_token_version
+from .user_cache import get_cached_user
 
 
 class CookieJWTAuthentication(JWTAuthentication):
-    """쿠키에서 JWT 토큰을 읽어 인증하는 클래스"""
+    """
+    쿠키에서 JWT 토큰을 읽어 인증하는 클래스
+
+    - 사용자 정보는 user_cache(프로세스 메모리 + Redis)에서 조회
+    - 뷰에 stateless_authentication = True 를 지정하면 토큰의 user_id만 담은 TokenUser를
+      request.user로 사용 (비밀번호 변경 토큰 폐기 검사용 DB 조회는 생략하지만
+      삭제/비활성 사용자 거부는 캐시된 사용자로 똑같이 검사)
+    - 토큰의 token_version이 사용자의 현재 버전과 다르면(비밀번호 변경/비활성화 이후 발급 전 토큰) 거부
+    """
 
     def authenticate(self, request):
         # 먼저 쿠키에서 토큰 확인
@@ -13,9 +25,55 @@ class CookieJWTAuthentication(JWTAuthentication):
         if access_token:
             try:
                 validated_token = AccessToken(access_token)
-                return self.get_user(validated_token), validated_token
+                return self.resolve_user(request, validated_token), validated_token
             except TokenError:
                 pass
 
         # 쿠키에 없으면 기본 헤더 인증 시도 (Bearer 토큰)
-        return super().authenticate(request)
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return self.resolve_user(request, validated_token), validated_token
+
+    def resolve_user(self, request, validated_token):
+        parser_context = getattr(request, 'parser_context', None) or {}
+        view = parser_context.get('view')
+
+        if getattr(view, 'stateless_authentication', False):
+            self.get_active_cached_user(validated_token)
+            return JWTStatelessUserAuthentication.get_user(self, validated_token)
+
+        return self.get_user(validated_token)
+
+    def get_user(self, validated_token):
+        # 비밀번호 변경 토큰 폐기 검사는 비밀번호 해시가 필요하므로 DB 조회
+        if api_settings.CHECK_REVOKE_TOKEN:
+            user = super().get_user(validated_token)
+            if user.token_version != get_token_version(validated_token):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+            return user
+
+        return self.get_active_cached_user(validated_token)
+
+    def get_active_cached_user(self, validated_token):
+        """캐시에서 사용자 조회 (없거나 토큰 버전이 다르거나 비활성이면 AuthenticationFailed)"""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id, get_token_version(validated_token))
+
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
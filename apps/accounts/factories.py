@@ -0,0 +1,28 @@
+from datetime import timezone
+import factory
+from django.contrib.auth.hashers import make_password
+from .models import User
+
+SYNTHETIC_PASSWORD = 'synthetic-password'
+
+_password_hash = None
+
+
+def synthetic_password_hash():
+    """대량 생성 시 사용자마다 해시하지 않도록 한 번만 계산"""
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = make_password(SYNTHETIC_PASSWORD)
+    return _password_hash
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+
+    email = factory.Sequence(lambda n: f'synthetic{n}@example.com')
+    nickname = factory.Faker('name', locale='ko_KR')
+    password = factory.LazyFunction(synthetic_password_hash)
+    date_joined = factory.Faker('date_time_between', start_date='-2y', end_date='-1y', tzinfo=timezone.utc)
+    created_at = factory.SelfAttribute('date_joined')
+    updated_at = factory.SelfAttribute('date_joined')
@@ -0,0 +1,63 @@
+"""
+last_login 일괄 저장
+
+로그인마다 users 행을 갱신하지 않고 Redis hash에 사용자별 마지막 로그인 시각만 모아 두었다가
+Celery beat 태스크(flush_last_login)가 주기적으로 한 번에 저장합니다.
+같은 주기 안의 여러 로그인은 마지막 시각 하나로 합쳐집니다.
+"""
+import logging
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from config.redis_client import get_redis
+from .user_cache import invalidate_users_on_commit
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = 'accounts:last_login:pending'
+PROCESSING_KEY = 'accounts:last_login:processing'
+
+
+def record_login(user_id, when=None):
+    """로그인 시각 기록 (Redis 장애 시 바로 DB에 저장)"""
+    when = when or timezone.now()
+
+    try:
+        get_redis().hset(PENDING_KEY, user_id, when.timestamp())
+    except Exception as e:
+        logger.warning(f"last_login 기록 실패, DB에 바로 저장: {str(e)}")
+        get_user_model().objects.filter(pk=user_id).update(last_login=when)
+        invalidate_users_on_commit([user_id])
+
+
+def flush_last_logins():
+    """
+    모아 둔 로그인 시각을 일괄 저장
+
+    Returns:
+        int: 처리한 로그인 기록 수
+    """
+    client = get_redis()
+    User = get_user_model()
+    batch_size = getattr(settings, 'LAST_LOGIN_FLUSH_BATCH_SIZE', 500)
+
+    # 이전 실행이 중간에 실패해 남은 데이터가 없을 때만 새로 가져옴
+    if not client.exists(PROCESSING_KEY):
+        if not client.exists(PENDING_KEY):
+            return 0
+        # rename은 원자적이므로 이후 로그인은 새 pending hash에 기록됨
+        client.rename(PENDING_KEY, PROCESSING_KEY)
+
+    entries = client.hgetall(PROCESSING_KEY)
+    users = [
+        User(pk=int(user_id), last_login=datetime.fromtimestamp(float(timestamp), tz=dt_timezone.utc))
+        for user_id, timestamp in entries.items()
+    ]
+
+    User.objects.bulk_update(users, ['last_login'], batch_size=batch_size)
+    # bulk_update는 post_save를 보내지 않으므로 사용자 캐시를 직접 무효화
+    invalidate_users_on_commit(user.pk for user in users)
+    client.delete(PROCESSING_KEY)
+
+    return len(users)
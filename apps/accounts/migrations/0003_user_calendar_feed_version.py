@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_nickname"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="calendar_feed_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
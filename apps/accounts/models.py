@@ -28,6 +28,10 @@ class User(AbstractUser):
     username = None
     email = models.EmailField(unique=True, db_index=True)
     nickname = models.CharField(max_length=50, blank=False, default='익명')
+    # 캘린더 구독 토큰 버전 (올리면 기존 구독 URL 폐기)
+    calendar_feed_version = models.PositiveIntegerField(default=0)
+    # JWT 토큰 버전 (비밀번호 변경/비활성화 시 올려서 기존 토큰 폐기)
+    token_version = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -39,6 +43,26 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 비활성화 여부 판단용 (불러올 때의 값)
+        instance._loaded_is_active = instance.__dict__.get('is_active', True)
+        return instance
+
+    def save(self, *args, **kwargs):
+        # set_password() 후 저장하거나 비활성화하면 토큰 버전을 올려 이전에 발급한 JWT 거부
+        # (check_password()의 해시 업그레이드는 _password를 비운 뒤 저장하므로 제외)
+        deactivated = not self.is_active and getattr(self, '_loaded_is_active', False)
+        if self.pk and (self._password is not None or deactivated):
+            self.token_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+
+        super().save(*args, **kwargs)
+        self._loaded_is_active = self.is_active
+
     class Meta:
         db_table = 'users'
         verbose_name = 'User'
@@ -1,6 +1,12 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from .token_registry import blacklist_token, is_blacklisted
+from .tokens import get_token_version
+from .user_cache import get_cached_user
 
 User = get_user_model()
 
@@ -54,3 +60,47 @@ class LoginSerializer(serializers.Serializer):
         write_only=True,
         style={'input_type': 'password'}
     )
+
+
+class CookieTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh 토큰 재발급 Serializer
+
+    body의 refresh 또는 refresh_token 쿠키를 사용하고,
+    회전된 토큰의 폐기 여부는 Redis 레지스트리(token_registry)로 관리합니다.
+    토큰 버전이 사용자의 현재 버전과 다르거나 비활성 사용자면 재발급하지 않습니다.
+    레지스트리 장애 시 재발급하지 않고 503을 반환합니다.
+    """
+    refresh = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        raw_token = attrs.get('refresh')
+        if not raw_token:
+            request = self.context.get('request')
+            raw_token = request.COOKIES.get('refresh_token') if request else None
+        if not raw_token:
+            raise InvalidToken('Refresh 토큰이 없습니다')
+
+        refresh = self.token_class(raw_token)
+
+        if is_blacklisted(refresh):
+            raise InvalidToken('Token is blacklisted')
+
+        user = get_cached_user(refresh.get(api_settings.USER_ID_CLAIM), get_token_version(refresh))
+        if user is None or not user.is_active:
+            raise InvalidToken('Token is revoked')
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # 이미 회전에 사용된 토큰이면 재사용으로 보고 거부
+            if api_settings.BLACKLIST_AFTER_ROTATION and not blacklist_token(refresh):
+                raise InvalidToken('Token is blacklisted')
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data['refresh'] = str(refresh)
+
+        return data
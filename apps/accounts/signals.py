@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .user_cache import invalidate_user_versions_on_commit
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """프로필 수정, 비활성화, 삭제 시 커밋 후 인증 사용자 캐시 무효화"""
+    # 토큰 버전이 올라간 경우 이전 버전 키도 지워 이전 토큰이 캐시로 인증되지 않도록 함
+    versions = {instance.token_version, max(instance.token_version - 1, 0)}
+    invalidate_user_versions_on_commit((instance.pk, version) for version in versions)
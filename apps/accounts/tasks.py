@@ -0,0 +1,19 @@
+from celery import shared_task
+from .login_tracker import flush_last_logins
+
+
+@shared_task
+def flush_last_login():
+    # Redis에 모아 둔 로그인 시각을 users.last_login에 일괄 저장하는 Celery task
+    try:
+        count = flush_last_logins()
+        return {
+            'success': True,
+            'updated_count': count,
+            'message': f'{count}건의 last_login을 저장했습니다.'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'last_login 저장 중 오류가 발생했습니다: {str(e)}'
+        }
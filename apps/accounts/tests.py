@@ -1,3 +1,244 @@
+from unittest import mock
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from .factories import UserFactory
+from .login_tracker import flush_last_logins, record_login
+from .token_registry import is_blacklisted
+from .tokens import VersionedRefreshToken
+from .user_cache import get_cached_user, invalidate_users
 
-# Create your tests here.
+
+class FakeRedis:
+    """login_tracker가 사용하는 hash 명령만 흉내 낸 Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[str(field).encode()] = str(value).encode()
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def rename(self, src, dst):
+        self.data[dst] = self.data.pop(src)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class UserCacheTests(TestCase):
+    """인증 사용자 캐시 무효화 검사"""
+
+    def setUp(self):
+        self.user = UserFactory()
+        invalidate_users([self.user.id])
+
+    def test_cached_user(self):
+        get_cached_user(self.user.id, 0)
+        with self.assertNumQueries(0):
+            cached = get_cached_user(self.user.id, 0)
+        self.assertEqual(cached.email, self.user.email)
+        self.assertIsNone(get_cached_user(self.user.id + 1000, 0))
+
+    def test_invalidated_after_commit(self):
+        get_cached_user(self.user.id, 0)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.nickname = '변경'
+            self.user.save()
+            # 커밋 전에는 기존 값 유지 (다른 요청이 변경 전 값을 다시 캐시하지 않도록)
+            self.assertNotEqual(get_cached_user(self.user.id, 0).nickname, '변경')
+
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(get_cached_user(self.user.id, 0).nickname, '변경')
+
+    def test_token_version_in_key(self):
+        self.assertIsNotNone(get_cached_user(self.user.id, 0))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('new-password')
+            self.user.save()
+
+        self.assertEqual(self.user.token_version, 1)
+        # 이전 버전 키는 무효화되고, DB에서도 버전이 달라 찾지 못함
+        self.assertIsNone(get_cached_user(self.user.id, 0))
+        self.assertIsNotNone(get_cached_user(self.user.id, 1))
+
+        # 비밀번호 해시 업그레이드 등 비밀번호 변경이 아닌 저장은 버전 유지
+        self.user.nickname = '변경'
+        self.user.save()
+        self.assertEqual(self.user.token_version, 1)
+
+    def test_invalidated_after_last_login_flush(self):
+        get_cached_user(self.user.id, 0)
+        when = timezone.now()
+
+        with mock.patch('apps.accounts.login_tracker.get_redis', side_effect=ConnectionError), \
+                self.assertLogs('apps.accounts.login_tracker', 'WARNING'):
+            # Redis 장애 시 QuerySet.update()로 바로 저장하는 경로
+            with self.captureOnCommitCallbacks(execute=True):
+                record_login(self.user.id, when)
+
+        self.assertEqual(get_cached_user(self.user.id, 0).last_login, when)
+
+
+class StatelessAuthenticationTests(TestCase):
+    """stateless_authentication 뷰의 인증 검사"""
+
+    url = '/api/v1/events/my/'
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+    def test_cached_user_without_query(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        # 사용자 조회 없이 이벤트 목록 쿼리만 실행
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_inactive_user_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_password_change_revokes_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {VersionedRefreshToken.for_user(self.user).access_token}')
+        self.assertEqual(client.get(self.url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('new-password')
+            self.user.save()
+
+        self.assertEqual(client.get(self.url).status_code, 401)
+
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {VersionedRefreshToken.for_user(self.user).access_token}')
+        self.assertEqual(client.get(self.url).status_code, 200)
+
+    def test_reactivated_user_old_token_rejected(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save(update_fields=['is_active'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = True
+            self.user.save()
+
+        # 비활성화 전에 발급된 토큰은 다시 활성화되어도 사용 불가
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_deleted_user_rejected(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+
+class TokenRefreshTests(TestCase):
+    """refresh 토큰 회전과 레지스트리 장애 처리 검사"""
+
+    url = '/api/v1/auth/token/refresh/'
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client = APIClient()
+
+    def test_rotated_token_cannot_be_reused(self):
+        response = self.client.post(self.url, {'refresh': str(self.refresh)})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(is_blacklisted(self.refresh))
+        rotated = response.data['refresh']
+
+        self.assertEqual(self.client.post(self.url, {'refresh': str(self.refresh)}).status_code, 401)
+        # 새로 받은 토큰은 사용 가능
+        self.assertEqual(self.client.post(self.url, {'refresh': rotated}).status_code, 200)
+
+    def test_registry_unavailable_fails_closed(self):
+        with mock.patch('apps.accounts.token_registry.cache') as cache, \
+                self.assertLogs('apps.accounts.token_registry', 'ERROR'):
+            cache.get.side_effect = ConnectionError('redis down')
+            response = self.client.post(self.url, {'refresh': str(self.refresh)})
+        self.assertEqual(response.status_code, 503)
+
+        with mock.patch('apps.accounts.token_registry.cache') as cache, \
+                self.assertLogs('apps.accounts.token_registry', 'ERROR'):
+            cache.get.return_value = None
+            cache.add.side_effect = ConnectionError('redis down')
+            response = self.client.post(self.url, {'refresh': str(self.refresh)})
+        self.assertEqual(response.status_code, 503)
+
+        # 장애가 끝나면 같은 토큰으로 재발급 가능 (회전이 기록되지 않았으므로)
+        self.assertEqual(self.client.post(self.url, {'refresh': str(self.refresh)}).status_code, 200)
+
+    def test_password_change_revokes_refresh(self):
+        refresh = VersionedRefreshToken.for_user(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('new-password')
+            self.user.save()
+
+        self.assertEqual(self.client.post(self.url, {'refresh': str(refresh)}).status_code, 401)
+
+        response = self.client.post(self.url, {'refresh': str(VersionedRefreshToken.for_user(self.user))})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(AccessToken(response.data['access'])['token_version'], 1)
+
+    def test_logout_during_registry_outage(self):
+        self.client.cookies['refresh_token'] = str(self.refresh)
+
+        with mock.patch('apps.accounts.token_registry.cache') as cache, \
+                self.assertLogs('apps.accounts.token_registry', 'ERROR'):
+            cache.add.side_effect = ConnectionError('redis down')
+            response = self.client.post('/api/v1/auth/logout/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cookies['refresh_token'].value, '')
+
+
+class LastLoginBatchTests(TestCase):
+    """last_login 일괄 저장 검사"""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch('apps.accounts.login_tracker.get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.users = UserFactory.create_batch(3)
+
+    def test_flush(self):
+        first = timezone.now()
+        last = first + timezone.timedelta(minutes=5)
+
+        with self.assertNumQueries(0):
+            record_login(self.users[0].id, first)
+            record_login(self.users[0].id, last)
+            record_login(self.users[1].id, first)
+
+        get_cached_user(self.users[0].id, 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_last_logins(), 2)
+
+        self.users[0].refresh_from_db()
+        self.users[2].refresh_from_db()
+        self.assertEqual(self.users[0].last_login, last)  # 같은 주기의 로그인은 마지막 시각만 저장
+        self.assertIsNone(self.users[2].last_login)
+        self.assertEqual(get_cached_user(self.users[0].id, 0).last_login, last)
+        self.assertEqual(self.redis.data, {})
+        self.assertEqual(flush_last_logins(), 0)
@@ -0,0 +1,67 @@
+"""
+Redis 기반 Refresh 토큰 레지스트리
+
+회전(rotation)되었거나 로그아웃으로 폐기된 refresh 토큰의 jti를
+토큰 만료 시각까지만 Redis에 보관합니다. 만료된 기록은 TTL로 자동 삭제되므로
+블랙리스트 테이블처럼 계속 커지지 않습니다.
+
+Redis 장애 시에는 폐기된 토큰을 구분할 수 없으므로 조회/기록 모두
+TokenRegistryUnavailable(503)로 실패합니다. (fail-closed)
+"""
+import logging
+import time
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRegistryUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '토큰 상태를 확인할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'token_registry_unavailable'
+
+
+def _blacklist_key(jti):
+    return f"jwt:blacklist:{jti}"
+
+
+def _remaining_seconds(token):
+    return int(token['exp'] - time.time())
+
+
+def blacklist_token(token):
+    """
+    토큰 폐기 기록
+
+    Returns:
+        bool: 새로 폐기했으면 True, 이미 폐기된 토큰이면 False
+
+    Raises:
+        TokenRegistryUnavailable: Redis 장애
+    """
+    ttl = _remaining_seconds(token)
+    if ttl <= 0:
+        return False
+
+    try:
+        # add는 키가 없을 때만 저장하므로 같은 토큰의 동시 회전 요청 중 하나만 성공
+        return cache.add(_blacklist_key(token['jti']), 1, ttl)
+    except Exception as e:
+        logger.error(f"토큰 폐기 기록 실패 ({token['jti']}): {str(e)}")
+        raise TokenRegistryUnavailable()
+
+
+def is_blacklisted(token):
+    """
+    토큰 폐기 여부
+
+    Raises:
+        TokenRegistryUnavailable: Redis 장애
+    """
+    try:
+        return cache.get(_blacklist_key(token['jti'])) is not None
+    except Exception as e:
+        logger.error(f"토큰 폐기 여부 조회 실패 ({token['jti']}): {str(e)}")
+        raise TokenRegistryUnavailable()
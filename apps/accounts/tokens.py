@@ -0,0 +1,25 @@
+"""
+JWT 토큰
+
+사용자 토큰 버전(User.token_version)을 token_version 클레임으로 넣어
+비밀번호 변경/비활성화 후에는 이전에 발급한 토큰을 거부합니다.
+access 토큰은 refresh 토큰의 클레임을 복사하므로 재발급해도 버전이 유지됩니다.
+"""
+from rest_framework_simplejwt.tokens import RefreshToken
+
+TOKEN_VERSION_CLAIM = 'token_version'
+
+
+class VersionedRefreshToken(RefreshToken):
+    """token_version 클레임을 담은 refresh 토큰"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+def get_token_version(token):
+    """토큰의 버전 (클레임 도입 전에 발급된 토큰은 기존 사용자 기본값인 0)"""
+    return token.get(TOKEN_VERSION_CLAIM, 0)
@@ -0,0 +1,130 @@
+"""
+인증 사용자 캐시
+
+JWT 인증 요청마다 users 테이블을 조회하지 않도록 사용자 필드 값을
+프로세스 메모리(짧은 TTL)와 Redis에 캐시합니다.
+캐시 키에 토큰 버전(User.token_version)을 넣고 DB 조회도 버전으로 걸러서,
+비밀번호 변경/비활성화로 버전이 바뀐 뒤에는 이전 토큰으로 사용자를 찾지 못합니다.
+프로필 수정/비활성화/삭제 시 signals에서 커밋 후 무효화합니다.
+시그널을 보내지 않는 QuerySet.update()/bulk_update() 경로는 invalidate_users_on_commit()을 직접 호출합니다.
+"""
+import threading
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, transaction
+from config.cache_utils import cache_get, cache_set, cache_delete_many
+
+# 캐시에 저장하는 필드 구성이 바뀌면 올려서 기존 캐시 무시
+USER_CACHE_VERSION = 3
+
+_local_cache = {}
+_local_lock = threading.Lock()
+
+
+def _cache_key(user_id, token_version):
+    return f"auth:user:v{USER_CACHE_VERSION}:{user_id}:{token_version}"
+
+
+def _cached_field_names():
+    # 비밀번호 해시는 캐시하지 않음 (필요하면 지연 로딩)
+    return [
+        field.attname for field in get_user_model()._meta.concrete_fields
+        if field.attname != 'password'
+    ]
+
+
+def _get_local(key):
+    entry = _local_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _set_local(key, values):
+    ttl = getattr(settings, 'AUTH_USER_LOCAL_CACHE_TTL', 5)
+    max_size = getattr(settings, 'AUTH_USER_LOCAL_CACHE_SIZE', 10000)
+
+    with _local_lock:
+        if len(_local_cache) >= max_size:
+            _local_cache.clear()
+        _local_cache[key] = (time.monotonic() + ttl, values)
+
+
+def get_cached_user(user_id, token_version):
+    """
+    사용자 조회 (프로세스 캐시 → Redis → DB 순서)
+
+    Args:
+        token_version: 토큰의 token_version 클레임 (현재 사용자 버전과 다르면 None)
+
+    Returns:
+        User: password 필드가 지연 로딩되는 User 인스턴스 (없으면 None)
+    """
+    User = get_user_model()
+    field_names = _cached_field_names()
+    key = _cache_key(user_id, token_version)
+
+    values = _get_local(key)
+
+    if values is None:
+        values = cache_get(key)
+
+        if values is None:
+            values = User.objects.filter(
+                **{settings.SIMPLE_JWT.get('USER_ID_FIELD', 'id'): user_id},
+                token_version=token_version,
+            ).values_list(*field_names).first()
+
+            if values is None:
+                return None
+
+            cache_set(key, values, getattr(settings, 'AUTH_USER_CACHE_TTL', 300))
+
+        _set_local(key, values)
+
+    # 요청마다 새 인스턴스를 만들어 요청 간 상태 공유 방지
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+def invalidate_user_versions(entries):
+    """
+    (사용자 ID, 토큰 버전) 목록의 캐시 무효화
+
+    다른 프로세스의 메모리 캐시는 AUTH_USER_LOCAL_CACHE_TTL 이내에 만료됩니다.
+    """
+    keys = [_cache_key(user_id, token_version) for user_id, token_version in entries]
+    if not keys:
+        return
+
+    with _local_lock:
+        for key in keys:
+            _local_cache.pop(key, None)
+    cache_delete_many(keys)
+
+
+def invalidate_users(user_ids):
+    """여러 사용자 캐시를 한 번에 무효화 (현재 토큰 버전은 DB에서 조회)"""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+
+    invalidate_user_versions(
+        get_user_model().objects.filter(pk__in=user_ids).values_list('pk', 'token_version')
+    )
+
+
+def invalidate_users_on_commit(user_ids):
+    """
+    트랜잭션 커밋 후 무효화
+
+    커밋 전에 지우면 동시에 들어온 요청이 변경 전 값을 다시 캐시할 수 있습니다.
+    """
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: invalidate_users(user_ids))
+
+
+def invalidate_user_versions_on_commit(entries):
+    """(사용자 ID, 토큰 버전) 목록을 트랜잭션 커밋 후 무효화"""
+    entries = list(entries)
+    transaction.on_commit(lambda: invalidate_user_versions(entries))
@@ -2,10 +2,15 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.views import TokenRefreshView
 from django.contrib.auth import authenticate
 from django.conf import settings
 from drf_spectacular.utils import extend_schema, OpenApiExample
-from .serializers import UserRegistrationSerializer, UserSerializer, LoginSerializer
+from .serializers import UserRegistrationSerializer, UserSerializer, LoginSerializer, CookieTokenRefreshSerializer
+from .token_registry import TokenRegistryUnavailable, blacklist_token
+from .tokens import VersionedRefreshToken
+from .login_tracker import record_login
 
 
 def set_token_cookies(response, refresh_token, access_token):
@@ -52,7 +57,7 @@ class RegisterView(generics.CreateAPIView):
         user = serializer.save()
 
         #jwt 토큰 설정
-        refresh = RefreshToken.for_user(user)
+        refresh = VersionedRefreshToken.for_user(user)
 
         response = Response({
             'user': UserSerializer(user).data,
@@ -92,8 +97,11 @@ class LoginView(generics.GenericAPIView): #로그인뷰
                 'detail': '비활성화된 계정입니다'
             }, status=status.HTTP_403_FORBIDDEN)
 
+        # last_login은 모아서 일괄 저장
+        record_login(user.id)
+
         #JWT 토큰
-        refresh = RefreshToken.for_user(user)
+        refresh = VersionedRefreshToken.for_user(user)
 
         response = Response({
             'user': UserSerializer(user).data,
@@ -113,12 +121,38 @@ class LogoutView(generics.GenericAPIView):
         description='쿠키의 토큰을 삭제합니다.',
     )
     def post(self, request, *args, **kwargs):
+        # refresh 토큰 폐기 (만료 시각까지만 Redis에 기록)
+        refresh_token = request.COOKIES.get('refresh_token')
+        if refresh_token:
+            try:
+                blacklist_token(RefreshToken(refresh_token))
+            except (TokenError, TokenRegistryUnavailable):
+                # 레지스트리 장애(오류 로그는 token_registry에서 기록)여도 쿠키는 삭제
+                pass
+
         response = Response({'message': '로그아웃 되었습니다.'}, status=status.HTTP_200_OK)
         response.delete_cookie('access_token', path='/')
         response.delete_cookie('refresh_token', path='/')
         return response
 
 
+class CookieTokenRefreshView(TokenRefreshView):
+    serializer_class = CookieTokenRefreshSerializer
+
+    @extend_schema(
+        tags=['Auth'],
+        summary='토큰 재발급',
+        description='refresh 토큰(body 또는 쿠키)으로 access 토큰을 재발급합니다. 회전된 refresh 토큰은 다시 사용할 수 없습니다.',
+        auth=[],  # 인증 불필요
+    )
+    def post(self, request, *args, **kwargs):
+        response = super().post(request, *args, **kwargs)
+
+        # httpOnly 쿠키로 토큰 갱신
+        refresh_token = response.data.get('refresh') or request.COOKIES.get('refresh_token') or request.data.get('refresh')
+        return set_token_cookies(response, refresh_token, response.data['access'])
+
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
 
     serializer_class = UserSerializer
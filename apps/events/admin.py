@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Event, TimeSlot
+from .models import Event, TimeSlot, ArchivedEvent
 
 
 @admin.register(Event)
@@ -16,3 +16,11 @@ class TimeSlotAdmin(admin.ModelAdmin):
     list_filter = ['event']
     search_fields = ['event__title']
     readonly_fields = ['event', 'start_datetime', 'end_datetime']
+
+
+@admin.register(ArchivedEvent)
+class ArchivedEventAdmin(admin.ModelAdmin):
+    list_display = ['event_id', 'title', 'reason', 'participant_count', 'slot_count', 'event_created_at', 'archived_at']
+    list_filter = ['reason']
+    search_fields = ['title', 'slug']
+    readonly_fields = [field.name for field in ArchivedEvent._meta.fields]
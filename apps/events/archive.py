@@ -0,0 +1,216 @@
+"""
+이벤트 보관(archive) 및 원본 행 정리
+
+삭제(soft delete)된 지 ARCHIVE_DELETED_AFTER_DAYS일이 지난 이벤트와
+종료일로부터 ARCHIVE_EXPIRED_AFTER_DAYS일이 지난 미확정 이벤트를 이벤트당 JSON 스냅샷 1행(ArchivedEvent)으로 보관하고,
+타임슬롯/참가자/가능 시간/이벤트 행을 청크 단위로 삭제합니다.
+
+최종 시간이 확정된 이벤트는 캘린더 구독 피드에 계속 나와야 하므로 기간이 지나도 보관하지 않습니다.
+(보관하면 피드에서 사라져 구독한 캘린더에서도 일정이 지워짐, 방장이 삭제한 뒤에만 보관)
+
+- 스냅샷을 먼저 커밋한 뒤 삭제하므로 중간에 중단돼도 다음 실행에서 삭제만 이어서 진행
+- 삭제는 청크(기본 5000행)마다 별도 트랜잭션으로 실행하여 잠금을 짧게 유지
+- 가능 시간은 event_id 조건으로 삭제하므로 PostgreSQL에서는 해당 파티션만 조회
+  (이후 참가자/슬롯 삭제 시 CASCADE로 나가는 participant_id/time_slot_id 조건 DELETE는
+  이미 비운 뒤라 파티션별 인덱스 조회만 하고 삭제할 행은 없음)
+- 청크 삭제는 QuerySet.delete()를 사용하므로 캐시 무효화 시그널(events.signals)이 그대로 동작
+"""
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from apps.participants.models import Participant, ParticipantAvailability
+from .models import Event, TimeSlot, FinalChoice, ArchivedEvent
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+EVENT_FIELDS = [
+    'id', 'slug', 'title', 'description', 'created_by_id',
+    'date_start', 'date_end', 'time_start', 'time_end', 'timezone', 'deadline_at',
+    'is_deleted', 'created_at', 'updated_at',
+]
+
+
+def get_deleted_after():
+    return timedelta(days=getattr(settings, 'ARCHIVE_DELETED_AFTER_DAYS', 7))
+
+
+def get_expired_after():
+    return timedelta(days=getattr(settings, 'ARCHIVE_EXPIRED_AFTER_DAYS', 180))
+
+
+def archivable_events(now=None):
+    """
+    보관 대상 이벤트
+
+    - 삭제된 지(updated_at 기준) ARCHIVE_DELETED_AFTER_DAYS일이 지난 이벤트
+    - 종료일(없으면 생성일)로부터 ARCHIVE_EXPIRED_AFTER_DAYS일이 지난 이벤트 중 최종 시간이 확정되지 않은 이벤트
+    """
+    now = now or timezone.now()
+    expired_before = now - get_expired_after()
+    expired = Q(date_end__lt=timezone.localdate(expired_before)) | Q(date_end__isnull=True, created_at__lt=expired_before)
+
+    return Event.objects.filter(
+        Q(is_deleted=True, updated_at__lt=now - get_deleted_after())
+        | (expired & Q(final_choice__isnull=True))
+    ).order_by('id')
+
+
+def build_snapshots(event_ids):
+    """
+    이벤트별 스냅샷 생성 (이벤트 수와 관계없이 쿼리 5번)
+
+    슬롯은 시작 시각 순서의 목록으로 저장하고, 가능 시간과 최종 선택은 슬롯 순번으로 참조합니다.
+    참가자 연락처(이메일, 전화번호)는 보관하지 않습니다.
+
+    Returns:
+        dict: {event_id: ArchivedEvent (저장 전)}
+    """
+    events = {row['id']: row for row in Event.objects.filter(id__in=event_ids).values(*EVENT_FIELDS)}
+
+    slots = {event_id: [] for event_id in events}
+    ordinals = {}
+    for slot_id, event_id, start, end in TimeSlot.objects.filter(event_id__in=events).order_by(
+        'event_id', 'start_datetime'
+    ).values_list('id', 'event_id', 'start_datetime', 'end_datetime'):
+        ordinals[slot_id] = len(slots[event_id])
+        slots[event_id].append([start, end])
+
+    participants = {event_id: [] for event_id in events}
+    by_id = {}
+    for row in Participant.objects.filter(event_id__in=events).order_by('event_id', 'created_at', 'id').values(
+        'id', 'event_id', 'user_id', 'nickname', 'created_at'
+    ):
+        entry = {
+            'nickname': row['nickname'],
+            'user_id': row['user_id'],
+            'created_at': row['created_at'],
+            'available': [],
+        }
+        by_id[row['id']] = entry
+        participants[row['event_id']].append(entry)
+
+    for participant_id, slot_id in ParticipantAvailability.objects.filter(
+        event_id__in=events, is_available=True
+    ).order_by().values_list('participant_id', 'time_slot_id').iterator(chunk_size=10000):
+        if participant_id in by_id and slot_id in ordinals:
+            by_id[participant_id]['available'].append(ordinals[slot_id])
+
+    for entry in by_id.values():
+        entry['available'].sort()
+
+    final_choices = {
+        row['event_id']: {
+            'slot': ordinals.get(row['slot_id']),
+            'chosen_by_id': row['chosen_by_id'],
+            'created_at': row['created_at'],
+        }
+        for row in FinalChoice.objects.filter(event_id__in=events).values('event_id', 'slot_id', 'chosen_by_id', 'created_at')
+    }
+
+    archives = {}
+    for event_id, event in events.items():
+        archives[event_id] = ArchivedEvent(
+            event_id=event_id,
+            slug=event['slug'],
+            title=event['title'],
+            created_by_id=event['created_by_id'],
+            reason=ArchivedEvent.REASON_DELETED if event['is_deleted'] else ArchivedEvent.REASON_EXPIRED,
+            slot_count=len(slots[event_id]),
+            participant_count=len(participants[event_id]),
+            event_created_at=event['created_at'],
+            data={
+                'version': SNAPSHOT_VERSION,
+                'event': {key: value for key, value in event.items() if key != 'id'},
+                'slots': slots[event_id],
+                'participants': participants[event_id],
+                'final_choice': final_choices.get(event_id),
+            },
+        )
+    return archives
+
+
+def delete_in_chunks(queryset, chunk_size):
+    """
+    queryset의 행을 pk chunk_size개씩 별도 트랜잭션으로 삭제
+
+    하위 테이블을 먼저 비우므로 CASCADE 수집은 빈 조회만 하고,
+    시그널이 없는 모델은 queryset 조건을 유지한 DELETE ... WHERE <조건> AND id IN 한 번으로 삭제됩니다.
+    """
+    model = queryset.model
+    deleted = 0
+
+    while True:
+        with transaction.atomic():
+            ids = list(queryset.order_by().values_list('pk', flat=True)[:chunk_size])
+            if not ids:
+                break
+            # queryset 조건(event_id 등)을 유지해야 파티션 테이블에서 해당 파티션만 조회
+            deleted += queryset.filter(pk__in=ids).delete()[1].get(model._meta.label, 0)
+
+    return deleted
+
+
+def purge_events(event_ids, chunk_size):
+    """
+    이벤트와 하위 행 삭제 (외래 키 방향에 맞춰 하위 테이블부터)
+
+    캘린더 블록/슬롯 그리드 캐시는 Event, FinalChoice, TimeSlot 삭제 시그널에서 무효화됩니다.
+
+    Returns:
+        dict: 테이블별 삭제 건수
+    """
+    return {
+        'availabilities': delete_in_chunks(ParticipantAvailability.objects.filter(event_id__in=event_ids), chunk_size),
+        'final_choices': delete_in_chunks(FinalChoice.objects.filter(event_id__in=event_ids), chunk_size),
+        'participants': delete_in_chunks(Participant.objects.filter(event_id__in=event_ids), chunk_size),
+        'time_slots': delete_in_chunks(TimeSlot.objects.filter(event_id__in=event_ids), chunk_size),
+        'events': delete_in_chunks(Event.objects.filter(id__in=event_ids), chunk_size),
+    }
+
+
+def archive_events(limit=None, batch_size=None, chunk_size=None, now=None):
+    """
+    보관 대상 이벤트를 batch_size개씩 스냅샷 저장 후 삭제
+
+    이미 스냅샷이 있는 이벤트(이전 실행이 삭제 도중 중단된 경우)는 스냅샷을 덮어쓰지 않고 삭제만 진행합니다.
+
+    Args:
+        limit: 최대 처리 이벤트 수 (None이면 전부)
+        batch_size: 한 번에 스냅샷을 만드는 이벤트 수 (기본: ARCHIVE_BATCH_SIZE)
+        chunk_size: 삭제 청크 크기 (기본: ARCHIVE_DELETE_CHUNK_SIZE)
+
+    Returns:
+        dict: {'archived': 새로 보관한 이벤트 수, 'deleted': 테이블별 삭제 건수}
+    """
+    batch_size = batch_size or getattr(settings, 'ARCHIVE_BATCH_SIZE', 100)
+    chunk_size = chunk_size or getattr(settings, 'ARCHIVE_DELETE_CHUNK_SIZE', 5000)
+    now = now or timezone.now()
+
+    result = {'archived': 0, 'deleted': {}}
+    processed = 0
+
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        event_ids = list(archivable_events(now).values_list('id', flat=True)[:size])
+        if not event_ids:
+            break
+
+        already_archived = set(ArchivedEvent.objects.filter(event_id__in=event_ids).values_list('event_id', flat=True))
+        archives = build_snapshots([event_id for event_id in event_ids if event_id not in already_archived])
+
+        with transaction.atomic():
+            ArchivedEvent.objects.bulk_create(archives.values())
+        result['archived'] += len(archives)
+
+        for table, count in purge_events(event_ids, chunk_size).items():
+            result['deleted'][table] = result['deleted'].get(table, 0) + count
+
+        processed += len(event_ids)
+        logger.info(f"이벤트 보관: {processed}개 처리, 삭제 {result['deleted']}")
+
+    return result
@@ -0,0 +1,266 @@
+"""
+일정 조율 API 벤치마크
+
+합성 이벤트(일수 × 시간 범위 × 참가자 수 × 가능 비율)를 만들고
+타임슬롯 생성, 가능 시간 제출, 요약/추천/대시보드 조회를 프로세스 안에서 반복 측정합니다.
+모든 데이터는 트랜잭션 롤백으로 정리되므로 실제 DB에 남지 않습니다.
+"""
+import json
+import random
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from datetime import time as dt_time, timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+from config.renderers import FastJSONRenderer
+from apps.participants.models import Participant, ParticipantAvailability
+from apps.participants.serializers import SubmitAvailabilitySerializer
+from .models import Event
+from .serializers import EventSerializer, EventSummarySerializer
+from .views import TimeRecommendationView, EventDashboardView
+
+BASELINE_DIR = settings.BASE_DIR / 'benchmarks' / 'baselines'
+
+User = get_user_model()
+
+
+@dataclass
+class Scale:
+    days: int = 7
+    start_hour: int = 9
+    end_hour: int = 21
+    participants: int = 30
+    fill: float = 0.5
+    seed: int = 42
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summarize(durations, query_counts):
+    return {
+        'iterations': len(durations),
+        'p50_ms': _percentile(durations, 50) * 1000,
+        'p95_ms': _percentile(durations, 95) * 1000,
+        'p99_ms': _percentile(durations, 99) * 1000,
+        'mean_ms': statistics.fmean(durations) * 1000,
+        'max_ms': max(durations) * 1000,
+        'queries': max(query_counts),
+    }
+
+
+def _measure(func, iterations, warmup):
+    """func를 warmup + iterations 번 실행하여 소요 시간과 쿼리 수 측정 (매 실행은 savepoint 롤백)"""
+    durations = []
+    query_counts = []
+
+    for index in range(warmup + iterations):
+        try:
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    func()
+                    elapsed = time.perf_counter() - started
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        if index >= warmup:
+            durations.append(elapsed)
+            query_counts.append(len(queries))
+
+    return _summarize(durations, query_counts)
+
+
+def _new_event(user, scale, title):
+    today = timezone.localdate()
+    return Event.objects.create(
+        title=title,
+        created_by=user,
+        date_start=today,
+        date_end=today + timedelta(days=scale.days - 1),
+        time_start=dt_time(scale.start_hour, 0),
+        time_end=dt_time(scale.end_hour, 0),
+        timezone='Asia/Seoul',
+    )
+
+
+def seed_event(scale):
+    """
+    합성 이벤트 생성
+
+    Returns:
+        tuple: (생성자, 이벤트, 참가자 목록, 슬롯 ID 목록)
+    """
+    rng = random.Random(scale.seed)
+
+    user = User.objects.create_user(
+        email=f'bench-{scale.seed}@example.com',
+        password=None,
+    )
+    event = _new_event(user, scale, 'benchmark')
+    EventSerializer().create_time_slots(event)
+    slot_ids = list(event.time_slots.values_list('id', flat=True))
+
+    participants = Participant.objects.bulk_create([
+        Participant(event=event, nickname=f'p{index:05d}', email=f'p{index}@example.com')
+        for index in range(scale.participants)
+    ])
+
+    per_participant = round(len(slot_ids) * scale.fill)
+    ParticipantAvailability.objects.bulk_create([
+        ParticipantAvailability(participant=participant, time_slot_id=slot_id, event=event, is_available=True)
+        for participant in participants
+        for slot_id in rng.sample(slot_ids, per_participant)
+    ], batch_size=1000)
+
+    return user, event, participants, slot_ids
+
+
+def run_benchmarks(scale, iterations=20, warmup=2, only=None):
+    """
+    시나리오별 벤치마크 실행
+
+    Returns:
+        dict: {시나리오 이름: {iterations, p50_ms, p95_ms, p99_ms, mean_ms, max_ms, queries}}
+    """
+    rng = random.Random(scale.seed)
+    factory = APIRequestFactory()
+    results = {}
+
+    try:
+        with transaction.atomic():
+            user, event, participants, slot_ids = seed_event(scale)
+            per_participant = round(len(slot_ids) * scale.fill)
+
+            def create_time_slots():
+                EventSerializer().create_time_slots(_new_event(user, scale, 'benchmark-slots'))
+
+            def submit_availability():
+                participant = rng.choice(participants)
+                serializer = SubmitAvailabilitySerializer(
+                    data={'available_slot_ids': rng.sample(slot_ids, per_participant)},
+                    context={'participant': participant}
+                )
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+
+            def event_summary():
+                instance = Event.objects.get(pk=event.pk)
+                EventSummarySerializer(instance, context={'min_participants': 1, 'only_all_available': False}).data
+
+            recommend_view = TimeRecommendationView.as_view()
+            dashboard_view = EventDashboardView.as_view()
+
+            def recommend_time():
+                response = recommend_view(factory.get(f'/api/v1/events/{event.pk}/recommend-time'), event_id=event.pk)
+                response.render()
+                assert response.status_code == 200, response.status_code
+
+            def get_dashboard():
+                """대시보드 응답 본문 (큰 이벤트의 스트리밍 응답은 끝까지 읽음)"""
+                request = factory.get(f'/api/v1/events/{event.pk}/dashboard')
+                force_authenticate(request, user=user)
+                response = dashboard_view(request, event_id=event.pk)
+                assert response.status_code == 200, response.status_code
+
+                if response.streaming:
+                    return b''.join(response.streaming_content)
+                return response.render().content
+
+            def dashboard():
+                get_dashboard()
+
+            # 렌더러 비교: 대시보드 응답 데이터를 한 번 만들어 두고 JSON 직렬화만 측정
+            # (스트리밍 응답에는 .data가 없으므로 응답 본문을 파싱한 값을 사용)
+            dashboard_data = {}
+
+            def render_dashboard(renderer):
+                def render():
+                    if 'data' not in dashboard_data:
+                        dashboard_data['data'] = json.loads(get_dashboard())
+                    renderer.render(dashboard_data['data'])
+                return render
+
+            scenarios = {
+                'create_time_slots': create_time_slots,
+                'submit_availability': submit_availability,
+                'event_summary': event_summary,
+                'recommend_time': recommend_time,
+                'dashboard': dashboard,
+                'render_dashboard_stdlib': render_dashboard(JSONRenderer()),
+                'render_dashboard_fast': render_dashboard(FastJSONRenderer()),
+            }
+
+            for name, func in scenarios.items():
+                if only and name not in only:
+                    continue
+                results[name] = _measure(func, iterations, warmup)
+
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+    return results
+
+
+def baseline_path(name):
+    return BASELINE_DIR / f'{name}.json'
+
+
+def save_baseline(name, scale, results):
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        'scale': asdict(scale),
+        'database': connection.vendor,
+        'created_at': timezone.now().isoformat(),
+        'results': results,
+    }
+    path = baseline_path(name)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+    return path
+
+
+def load_baseline(name):
+    path = baseline_path(name)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def compare(baseline, results, threshold=0.2):
+    """
+    기준값 대비 회귀 검사
+
+    p95가 threshold 비율 이상 느려지거나 쿼리 수가 늘어나면 회귀로 판단합니다.
+
+    Returns:
+        list: [(시나리오, 설명), ...]
+    """
+    regressions = []
+
+    for name, current in results.items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+
+        if current['queries'] > previous['queries']:
+            regressions.append((name, f"쿼리 수 {previous['queries']} → {current['queries']}"))
+
+        if previous['p95_ms'] and current['p95_ms'] > previous['p95_ms'] * (1 + threshold):
+            regressions.append((name, f"p95 {previous['p95_ms']:.1f}ms → {current['p95_ms']:.1f}ms"))
+
+    return regressions
@@ -0,0 +1,45 @@
+from datetime import time, timedelta, timezone as dt_timezone
+import factory
+from .models import Event, TimeSlot, FinalChoice
+
+
+class EventFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Event
+
+    slug = factory.Sequence(lambda n: f'synthetic-{n}')
+    title = factory.Faker('catch_phrase', locale='ko_KR')
+    description = factory.Faker('sentence', locale='ko_KR')
+    created_by = factory.SubFactory('apps.accounts.factories.UserFactory')
+
+    date_start = factory.Faker('date_between', start_date='-1y', end_date='+60d')
+    date_end = factory.LazyAttribute(lambda o: o.date_start + timedelta(days=o.days - 1))
+    time_start = factory.Faker('random_element', elements=[time(8, 0), time(9, 0), time(10, 0), time(13, 0)])
+    time_end = factory.LazyAttribute(lambda o: time(min(o.time_start.hour + o.hours, 23), 0))
+    timezone = 'Asia/Seoul'
+
+    created_at = factory.Faker('date_time_between', start_date='-1y', end_date='now', tzinfo=dt_timezone.utc)
+    updated_at = factory.SelfAttribute('created_at')
+
+    class Params:
+        days = 7
+        hours = 8
+
+
+class TimeSlotFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = TimeSlot
+
+    event = factory.SubFactory(EventFactory)
+    start_datetime = factory.Faker('date_time_between', start_date='-1y', end_date='+60d', tzinfo=dt_timezone.utc)
+    end_datetime = factory.LazyAttribute(lambda o: o.start_datetime + timedelta(minutes=30))
+
+
+class FinalChoiceFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = FinalChoice
+
+    event = factory.SubFactory(EventFactory)
+    slot = factory.SubFactory(TimeSlotFactory, event=factory.SelfAttribute('..event'))
+    chosen_by = factory.SelfAttribute('event.created_by')
+    created_at = factory.LazyAttribute(lambda o: o.event.created_at)
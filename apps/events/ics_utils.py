@@ -0,0 +1,169 @@
+"""
+iCalendar (.ics) 생성 유틸리티
+
+확정된 이벤트의 VEVENT 블록을 이벤트 단위로 렌더링해 캐시하고,
+단일 이벤트 다운로드와 사용자별 구독 피드가 같은 블록을 재사용합니다.
+이벤트/FinalChoice 변경 시 signals에서 캐시를 무효화합니다.
+"""
+import hashlib
+from django.conf import settings
+from django.core import signing
+from config.cache_utils import cache_get_many, cache_set_many, cache_delete
+from .qr_utils import get_share_url
+
+ICS_VERSION = 1
+ICS_DATETIME_FORMAT = '%Y%m%dT%H%M%SZ'
+ICS_LINE_LIMIT = 75  # octets
+CALENDAR_FEED_SALT = 'apps.events.calendar-feed'
+
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Pizza Scheduler//Event Calendar//KO\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+)
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+
+def escape_text(value):
+    """RFC 5545 TEXT 값 이스케이프"""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line):
+    """75 octets 단위로 줄 접기 (UTF-8 멀티바이트 문자는 자르지 않음)"""
+    if len(line.encode('utf-8')) <= ICS_LINE_LIMIT:
+        return line
+
+    parts = []
+    current = []
+    size = 0
+    limit = ICS_LINE_LIMIT
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > limit:
+            parts.append(''.join(current))
+            current = []
+            size = 0
+            limit = ICS_LINE_LIMIT - 1  # 이어지는 줄은 앞의 공백 1 octet 포함
+        current.append(char)
+        size += char_size
+    parts.append(''.join(current))
+    return '\r\n '.join(parts)
+
+
+def vevent_cache_key(event_id):
+    return f"ics:v{ICS_VERSION}:vevent:{event_id}"
+
+
+def vevent_version(event_updated_at, final_choice_id):
+    """캐시된 블록이 최신인지 확인하기 위한 버전 값"""
+    return f"{event_updated_at.timestamp()}:{final_choice_id}"
+
+
+def render_vevent(event, final_choice):
+    """확정된 이벤트 하나의 VEVENT 블록 생성"""
+    final_slot = final_choice.slot
+
+    # UID 생성 (고유 식별자)
+    uid = f"event-{event.id}-finalchoice-{final_choice.id}@pizzascheduler"
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{final_choice.created_at.strftime(ICS_DATETIME_FORMAT)}",
+        f"LAST-MODIFIED:{max(event.updated_at, final_choice.created_at).strftime(ICS_DATETIME_FORMAT)}",
+        f"DTSTART:{final_slot.start_datetime.strftime(ICS_DATETIME_FORMAT)}",
+        f"DTEND:{final_slot.end_datetime.strftime(ICS_DATETIME_FORMAT)}",
+        f"SUMMARY:{escape_text(event.title)}",
+        f"DESCRIPTION:{escape_text(event.description or '')}",
+        f"URL:{get_share_url(event.slug)}",
+        "STATUS:CONFIRMED",
+        "SEQUENCE:0",
+        "END:VEVENT",
+    ]
+    return ''.join(fold_line(line) + "\r\n" for line in lines)
+
+
+def get_vevents(events):
+    """
+    이벤트 목록의 VEVENT 블록 반환 (캐시 우선, 누락분만 렌더링 후 저장)
+
+    Args:
+        events: final_choice__slot을 select_related 한 이벤트 목록
+    """
+    keys = {event.id: vevent_cache_key(event.id) for event in events}
+    cached = cache_get_many(list(keys.values()))
+
+    blocks = []
+    missing = {}
+    for event in events:
+        version = vevent_version(event.updated_at, event.final_choice.id)
+        entry = cached.get(keys[event.id])
+        if entry and entry[0] == version:
+            blocks.append(entry[1])
+        else:
+            block = render_vevent(event, event.final_choice)
+            missing[keys[event.id]] = (version, block)
+            blocks.append(block)
+
+    if missing:
+        timeout = getattr(settings, 'ICS_CACHE_TIMEOUT', 7 * 24 * 3600)
+        cache_set_many(missing, timeout)
+
+    return blocks
+
+
+def invalidate_vevent(event_id):
+    cache_delete(vevent_cache_key(event_id))
+
+
+def render_calendar(blocks, name=None):
+    return ''.join(iter_calendar(blocks, name=name))
+
+
+def iter_calendar(blocks, name=None):
+    yield CALENDAR_HEADER
+    if name:
+        yield fold_line(f"X-WR-CALNAME:{escape_text(name)}") + "\r\n"
+    for block in blocks:
+        yield block
+    yield CALENDAR_FOOTER
+
+
+def calendar_etag(versions):
+    """(이벤트 ID, 버전) 목록으로 피드 ETag 계산"""
+    source = f"{ICS_VERSION}|" + '|'.join(f"{event_id}={version}" for event_id, version in versions)
+    return '"' + hashlib.sha1(source.encode('utf-8')).hexdigest() + '"'
+
+
+def make_feed_token(user):
+    """
+    사용자별 캘린더 구독 URL 토큰
+
+    사용자 ID와 구독 토큰 버전(calendar_feed_version)을 서명합니다.
+    버전을 올리면 이전에 발급한 구독 URL은 모두 무효가 됩니다.
+    """
+    return signing.Signer(salt=CALENDAR_FEED_SALT).sign(f"{user.id}:{user.calendar_feed_version}")
+
+
+def read_feed_token(token):
+    """
+    구독 토큰에서 (사용자 ID, 토큰 버전) 추출 (유효하지 않으면 None)
+
+    버전 도입 전에 발급한 토큰(사용자 ID만 서명)은 버전 0으로 취급하므로
+    처음 재발급하기 전까지만 유효합니다.
+    """
+    try:
+        value = signing.Signer(salt=CALENDAR_FEED_SALT).unsign(token)
+        user_id, _, version = value.partition(':')
+        return int(user_id), int(version or 0)
+    except (signing.BadSignature, ValueError):
+        return None
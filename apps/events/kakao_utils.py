@@ -5,6 +5,7 @@ import json
 import logging
 import requests
 from django.conf import settings
+from apps.monitoring.metrics import instrumented_post
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,7 @@ def send_kakao_message_to_user(user_id, template_id, template_args):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = instrumented_post('kakao', 'talk_memo', url, headers=headers, json=data)
         return response.status_code == 200
     except Exception as e:
         print(f"카카오톡 메시지 발송 실패: {e}")
@@ -160,7 +161,7 @@ def send_kakao_alimtalk(phone_number, template_code, template_args):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = instrumented_post('kakao', 'alimtalk', url, headers=headers, json=payload, timeout=10)
 
         if response.status_code == 200:
             logger.info(f"알림톡 발송 성공: {phone_number}")
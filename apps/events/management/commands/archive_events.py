@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+from apps.events.archive import archivable_events, archive_events
+
+
+class Command(BaseCommand):
+    help = '삭제/기간 만료(미확정) 이벤트를 JSON 스냅샷으로 보관하고 원본 행(타임슬롯, 참가자, 가능 시간)을 청크 단위로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='보관 대상 이벤트 수만 출력')
+        parser.add_argument('--limit', type=int, default=None, help='최대 처리 이벤트 수 (기본: 전부)')
+        parser.add_argument('--batch-size', type=int, default=None, help='스냅샷 배치 크기 (기본: ARCHIVE_BATCH_SIZE)')
+        parser.add_argument('--chunk-size', type=int, default=None, help='삭제 청크 크기 (기본: ARCHIVE_DELETE_CHUNK_SIZE)')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            counts = archivable_events().aggregate(
+                total=Count('id'),
+                deleted=Count('id', filter=Q(is_deleted=True)),
+            )
+            self.stdout.write(
+                f"보관 대상 이벤트: {counts['total']}개 "
+                f"(삭제됨 {counts['deleted']}개, 기간 만료 {counts['total'] - counts['deleted']}개)"
+            )
+            return
+
+        result = archive_events(
+            limit=options['limit'],
+            batch_size=options['batch_size'],
+            chunk_size=options['chunk_size'],
+        )
+
+        deleted = ', '.join(f'{table} {count}' for table, count in result['deleted'].items()) or '없음'
+        self.stdout.write(self.style.SUCCESS(f"이벤트 {result['archived']}개를 보관했습니다. (삭제: {deleted})"))
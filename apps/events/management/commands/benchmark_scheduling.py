@@ -0,0 +1,87 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from apps.events.benchmark import Scale, run_benchmarks, save_baseline, load_baseline, compare
+
+SCENARIOS = (
+    'create_time_slots', 'submit_availability', 'event_summary', 'recommend_time', 'dashboard',
+    'render_dashboard_stdlib', 'render_dashboard_fast',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '합성 이벤트로 일정 조율 API(타임슬롯 생성, 가능 시간 제출, 요약, 추천, 대시보드)를 벤치마크합니다. '
+        '생성한 데이터는 모두 롤백됩니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7, help='이벤트 일수')
+        parser.add_argument('--start-hour', type=int, default=9, help='하루 시작 시각')
+        parser.add_argument('--end-hour', type=int, default=21, help='하루 종료 시각')
+        parser.add_argument('--participants', type=int, default=30, help='참가자 수')
+        parser.add_argument('--fill', type=float, default=0.5, help='참가자별 가능 슬롯 비율 (0.0 ~ 1.0)')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--iterations', type=int, default=20, help='시나리오별 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=2, help='측정 전 예열 횟수')
+        parser.add_argument('--only', nargs='+', choices=SCENARIOS, help='실행할 시나리오')
+        parser.add_argument('--save-baseline', metavar='NAME', help='결과를 benchmarks/baselines/NAME.json 으로 저장')
+        parser.add_argument('--compare', metavar='NAME', help='기준값과 비교하여 회귀 시 실패')
+        parser.add_argument('--threshold', type=float, default=0.2, help='p95 회귀 허용 비율 (기본 20%%)')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        if options['end_hour'] <= options['start_hour']:
+            raise CommandError('종료 시각이 시작 시각보다 늦어야 합니다.')
+        if not 0.0 <= options['fill'] <= 1.0:
+            raise CommandError('--fill 은 0.0 ~ 1.0 사이여야 합니다.')
+        if options['iterations'] < 1:
+            raise CommandError('--iterations 는 1 이상이어야 합니다.')
+
+        scale = Scale(
+            days=options['days'],
+            start_hour=options['start_hour'],
+            end_hour=options['end_hour'],
+            participants=options['participants'],
+            fill=options['fill'],
+            seed=options['seed'],
+        )
+
+        baseline = None
+        if options['compare']:
+            baseline = load_baseline(options['compare'])
+            if baseline is None:
+                raise CommandError(f"기준값을 찾을 수 없습니다: {options['compare']}")
+
+        results = run_benchmarks(scale, iterations=options['iterations'], warmup=options['warmup'], only=options['only'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+        else:
+            slots = scale.days * (scale.end_hour - scale.start_hour) * 2
+            self.stdout.write(
+                f"scale: {scale.days}일 × {scale.start_hour}~{scale.end_hour}시 ({slots}슬롯) × "
+                f"{scale.participants}명 × fill {scale.fill}"
+            )
+            header = f"{'scenario':<24} {'p50ms':>9} {'p95ms':>9} {'p99ms':>9} {'mean':>9} {'max':>9} {'queries':>8}"
+            self.stdout.write(header)
+            self.stdout.write('-' * len(header))
+            for name, row in results.items():
+                self.stdout.write(
+                    f"{name:<24} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} "
+                    f"{row['mean_ms']:>9.2f} {row['max_ms']:>9.2f} {row['queries']:>8}"
+                )
+
+        if options['save_baseline']:
+            path = save_baseline(options['save_baseline'], scale, results)
+            self.stdout.write(self.style.SUCCESS(f'기준값을 저장했습니다: {path}'))
+
+        if baseline is not None:
+            if baseline['scale'] != vars(scale):
+                self.stdout.write(self.style.WARNING('기준값과 규모 설정이 달라 비교 결과가 정확하지 않을 수 있습니다.'))
+
+            regressions = compare(baseline, results, threshold=options['threshold'])
+            if regressions:
+                for name, detail in regressions:
+                    self.stdout.write(self.style.ERROR(f'{name}: {detail}'))
+                raise CommandError(f'{len(regressions)}건의 성능 회귀가 발견되었습니다.')
+            self.stdout.write(self.style.SUCCESS('기준값 대비 성능 회귀가 없습니다.'))
@@ -0,0 +1,146 @@
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import OuterRef
+from apps.events.models import Event, TimeSlot
+from apps.participants.models import Participant, ParticipantAvailability
+from apps.participants.partitions import TABLE as AVAILABILITY_TABLE
+
+PARTITION_PATTERN = re.compile(rf'\b{AVAILABILITY_TABLE}_(?:p\d+|default)\b')
+
+
+def leading_column_indexes(model, column):
+    """column으로 시작하는 인덱스 이름 (외래 키 인덱스처럼 이름이 자동 생성된 경우)"""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return {
+        name for name, info in constraints.items()
+        if info['index'] and info['columns'] and info['columns'][0] == column
+    }
+
+
+def hot_queries(event, participant):
+    """
+    (이름, 쿼리셋, 사용해도 되는 인덱스 이름 집합) 목록
+
+    views.py / serializers.py의 실제 조회 조건과 같게 유지합니다.
+    """
+    slot_counts = ParticipantAvailability.objects.filter(
+        event_id=event.id,
+        time_slot_id=OuterRef('pk'),
+        is_available=True
+    ).values('time_slot_id')
+
+    return [
+        (
+            '이벤트별 가능 시간 (대시보드/추천)',
+            ParticipantAvailability.objects.filter(
+                event=event,
+                is_available=True
+            ).order_by('id').values_list('time_slot_id', 'participant_id', 'participant__nickname'),
+            leading_column_indexes(ParticipantAvailability, 'event_id'),
+        ),
+        (
+            '슬롯별 가능 인원 (상세/요약)',
+            TimeSlot.objects.filter(event=event).filter(pk__in=slot_counts),
+            {'availability_event_slot_idx'},
+        ),
+        (
+            '참가자별 가능 슬롯 (가능 시간 조회)',
+            ParticipantAvailability.objects.filter(
+                event_id=participant.event_id,
+                participant=participant,
+                is_available=True
+            ).values_list('time_slot_id', flat=True),
+            {'availability_participant_idx'},
+        ),
+        (
+            '내 이벤트 목록',
+            Event.objects.filter(
+                created_by_id=event.created_by_id,
+                is_deleted=False
+            ).order_by('-created_at')[:10],
+            {'event_owner_recent_idx'},
+        ),
+        (
+            '이벤트 참가자 목록',
+            Participant.objects.filter(event_id=event.id).order_by('-created_at')[:10],
+            {'participant_event_recent_idx'},
+        ),
+    ]
+
+
+def index_names(cursor, expected):
+    """인덱스와 파티션별로 생성된 하위 인덱스 이름 (PostgreSQL)"""
+    cursor.execute(
+        """
+        WITH RECURSIVE tree(oid) AS (
+            SELECT oid FROM pg_class WHERE relname = ANY(%s)
+            UNION ALL
+            SELECT i.inhrelid FROM pg_inherits i JOIN tree ON i.inhparent = tree.oid
+        )
+        SELECT c.relname FROM tree JOIN pg_class c ON c.oid = tree.oid
+        """,
+        [list(expected)]
+    )
+    return {row[0] for row in cursor.fetchall()} | set(expected)
+
+
+class Command(BaseCommand):
+    help = '주요 조회 쿼리의 실행 계획(EXPLAIN)을 출력하고 의도한 인덱스 사용과 파티션 프루닝 여부를 검사합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event-id', type=int, help='검사에 사용할 이벤트 ID (기본: 참가자가 있는 최근 이벤트)')
+        parser.add_argument('--analyze', action='store_true', help='EXPLAIN ANALYZE 실행 (PostgreSQL)')
+        parser.add_argument(
+            '--no-seqscan', action='store_true',
+            help='순차 스캔을 비활성화하고 검사 (데이터가 적어 플래너가 순차 스캔을 고를 때, PostgreSQL)'
+        )
+        parser.add_argument('--verbose-plan', action='store_true', help='실행 계획 전체 출력')
+
+    def handle(self, *args, **options):
+        participant = Participant.objects.filter(event__is_deleted=False, event__created_by__isnull=False)
+        if options['event_id']:
+            participant = participant.filter(event_id=options['event_id'])
+        participant = participant.select_related('event').order_by('-id').first()
+
+        if participant is None:
+            raise CommandError('참가자가 있는 이벤트가 없습니다. generate_synthetic_data 로 데이터를 먼저 생성하세요.')
+
+        is_postgres = connection.vendor == 'postgresql'
+        explain_options = {'analyze': True} if options['analyze'] and is_postgres else {}
+        failures = []
+
+        with transaction.atomic():
+            if options['no_seqscan'] and is_postgres:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for name, queryset, expected in hot_queries(participant.event, participant):
+                plan = queryset.explain(**explain_options)
+
+                if is_postgres:
+                    with connection.cursor() as cursor:
+                        names = index_names(cursor, expected)
+                else:
+                    names = expected
+                used = any(re.search(rf'\b{re.escape(name)}\b', plan) for name in names)
+
+                # 이벤트 조건이 있는 가능 시간 조회는 파티션 하나만 읽어야 함
+                partitions = set(PARTITION_PATTERN.findall(plan))
+                pruned = len(partitions) <= 1
+                ok = used and pruned
+
+                style = self.style.SUCCESS if ok else self.style.ERROR
+                detail = f', 파티션 {len(partitions)}개' if partitions else ''
+                self.stdout.write(style(f"[{'OK' if ok else 'MISS'}] {name} → {', '.join(sorted(expected))}{detail}"))
+                if options['verbose_plan'] or not ok:
+                    for line in plan.splitlines():
+                        self.stdout.write(f'    {line}')
+
+                if not ok:
+                    failures.append(name)
+
+        if failures:
+            raise CommandError(f'{len(failures)}개 쿼리가 의도한 인덱스를 사용하지 않습니다.')
+        self.stdout.write(self.style.SUCCESS('모든 주요 쿼리가 의도한 인덱스를 사용합니다.'))
@@ -0,0 +1,72 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from apps.events.synthetic import SyntheticConfig, SyntheticDataGenerator, synthetic_events, clear_synthetic_data
+
+
+class Command(BaseCommand):
+    help = (
+        '인덱스/집계 성능 검증용 합성 데이터(사용자, 이벤트, 타임슬롯, 참가자, 가능 시간)를 대량 생성합니다. '
+        '예: --events 10000 --participants 10 --fill 0.3 → 가능 시간 약 100만 건'
+    )
+
+    def add_arguments(self, parser):
+        defaults = SyntheticConfig()
+        parser.add_argument('--users', type=int, default=defaults.users, help='사용자 수')
+        parser.add_argument('--events', type=int, default=defaults.events, help='이벤트 수')
+        parser.add_argument('--max-days', type=int, default=defaults.max_days, help='이벤트 최대 일수')
+        parser.add_argument('--max-hours', type=int, default=defaults.max_hours, help='하루 최대 시간 범위')
+        parser.add_argument('--participants', type=int, default=defaults.participants, help='이벤트당 평균 참가자 수')
+        parser.add_argument('--fill', type=float, default=defaults.fill, help='참가자별 평균 가능 슬롯 비율 (0.0 ~ 1.0)')
+        parser.add_argument('--registered-ratio', type=float, default=defaults.registered_ratio, help='회원 참가자 비율')
+        parser.add_argument('--final-ratio', type=float, default=defaults.final_ratio, help='최종 시간 확정 이벤트 비율')
+        parser.add_argument('--seed', type=int, default=defaults.seed, help='난수 시드')
+        parser.add_argument('--batch-size', type=int, default=defaults.batch_size, help='COPY/bulk_create 배치 크기')
+        parser.add_argument('--clear', action='store_true', help='기존 합성 데이터를 삭제한 뒤 생성')
+        parser.add_argument('--clear-only', action='store_true', help='기존 합성 데이터만 삭제')
+        parser.add_argument(
+            '--allow-production', action='store_true',
+            help='DEBUG=False 환경에서도 실행 (운영 DB에 합성 사용자/이벤트를 만들거나 지우므로 주의)'
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['allow_production']:
+            raise CommandError('DEBUG=False 환경에서는 실행하지 않습니다. 의도한 경우 --allow-production 옵션을 사용하세요.')
+
+        if options['clear'] or options['clear_only']:
+            deleted = clear_synthetic_data()
+            self.stdout.write(f'기존 합성 데이터 삭제: {deleted}')
+            if options['clear_only']:
+                return
+
+        if options['users'] < 1 or options['events'] < 0:
+            raise CommandError('--users 는 1 이상, --events 는 0 이상이어야 합니다.')
+        if options['max_days'] < 1 or not 2 <= options['max_hours'] <= 15:
+            raise CommandError('--max-days 는 1 이상, --max-hours 는 2 ~ 15 사이여야 합니다.')
+        if not 0.0 <= options['fill'] <= 1.0:
+            raise CommandError('--fill 은 0.0 ~ 1.0 사이여야 합니다.')
+
+        seed = options['seed']
+        if synthetic_events(seed).exists():
+            raise CommandError(f'시드 {seed}로 생성한 데이터가 이미 있습니다. --clear 옵션으로 삭제 후 다시 실행하세요.')
+
+        config = SyntheticConfig(
+            users=options['users'],
+            events=options['events'],
+            max_days=options['max_days'],
+            max_hours=options['max_hours'],
+            participants=options['participants'],
+            fill=options['fill'],
+            registered_ratio=options['registered_ratio'],
+            final_ratio=options['final_ratio'],
+            seed=seed,
+            batch_size=options['batch_size'],
+        )
+
+        started = time.perf_counter()
+        counts = SyntheticDataGenerator(config, progress=self.stdout.write).run()
+        elapsed = time.perf_counter() - started
+
+        for name, count in counts.items():
+            self.stdout.write(f'{name:<16} {count:>10,}')
+        self.stdout.write(self.style.SUCCESS(f'합성 데이터 생성 완료 ({elapsed:.1f}초)'))
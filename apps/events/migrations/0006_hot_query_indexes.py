@@ -0,0 +1,21 @@
+# Generated by Django 4.2.17 on 2026-10-19 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0005_finalchoice"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_by", "-created_at"],
+                name="event_owner_recent_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.17 on 2026-10-19 13:15
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("events", "0006_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.BigIntegerField(unique=True)),
+                ("slug", models.CharField(db_index=True, max_length=255)),
+                ("title", models.CharField(max_length=255)),
+                (
+                    "reason",
+                    models.CharField(
+                        choices=[("deleted", "삭제됨"), ("expired", "기간 만료")],
+                        max_length=20,
+                    ),
+                ),
+                ("slot_count", models.PositiveIntegerField(default=0)),
+                ("participant_count", models.PositiveIntegerField(default=0)),
+                ("event_created_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "data",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="archived_events",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Event",
+                "verbose_name_plural": "Archived Events",
+                "db_table": "archived_events",
+                "ordering": ["-archived_at"],
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.text import slugify
 import uuid
 
@@ -35,6 +36,14 @@ class Event(models.Model):
         verbose_name = 'Event'
         verbose_name_plural = 'Events'
         ordering = ['-created_at']
+        indexes = [
+            # 내 이벤트 목록 (created_by, is_deleted=False, -created_at)
+            models.Index(
+                fields=['created_by', '-created_at'],
+                condition=models.Q(is_deleted=False),
+                name='event_owner_recent_idx',
+            ),
+        ]
 
 
 class TimeSlot(models.Model):
@@ -67,3 +76,38 @@ class FinalChoice(models.Model):
         verbose_name = 'Final Choice'
         verbose_name_plural = 'Final Choices'
         ordering = ['-created_at']
+
+
+class ArchivedEvent(models.Model):
+    """
+    보관 처리된 이벤트 (이벤트 1개 = JSON 스냅샷 1행)
+
+    원본 이벤트와 타임슬롯, 참가자, 가능 시간 행은 보관 후 삭제됩니다.
+    """
+    REASON_DELETED = 'deleted'
+    REASON_EXPIRED = 'expired'
+    REASON_CHOICES = [
+        (REASON_DELETED, '삭제됨'),
+        (REASON_EXPIRED, '기간 만료'),
+    ]
+
+    event_id = models.BigIntegerField(unique=True)
+    slug = models.CharField(max_length=255, db_index=True)
+    title = models.CharField(max_length=255)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, related_name='archived_events', null=True, blank=True)
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES)
+    slot_count = models.PositiveIntegerField(default=0)
+    participant_count = models.PositiveIntegerField(default=0)
+    event_created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+
+    def __str__(self):
+        return f"{self.title} ({self.get_reason_display()})"
+
+    class Meta:
+        db_table = 'archived_events'
+        verbose_name = 'Archived Event'
+        verbose_name_plural = 'Archived Events'
+        ordering = ['-archived_at']
+
@@ -0,0 +1,14 @@
+from rest_framework.negotiation import DefaultContentNegotiation
+
+
+class QueryFormatContentNegotiation(DefaultContentNegotiation):
+    """
+    format 쿼리 파라미터를 렌더러 선택이 아닌 뷰 옵션으로 쓰는 API용 콘텐츠 협상
+
+    DRF는 ?format= 값과 일치하는 렌더러가 없으면 404를 반환하므로,
+    이런 뷰에서는 항상 첫 번째 렌더러(JSON)로 오류 응답을 렌더링합니다.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderer = renderers[0]
+        return renderer, renderer.media_type
@@ -0,0 +1,147 @@
+"""
+QR 코드 렌더링 유틸리티
+
+QR 이미지는 이벤트 slug(공유 URL), 크기, 형식에만 의존하므로
+(slug, size, format) 단위로 캐시하고 ETag로 조건부 요청을 처리합니다.
+"""
+import hashlib
+from io import BytesIO
+import qrcode
+from django.conf import settings
+from config.cache_utils import cache_get, cache_set
+
+QR_MIN_SIZE = 5
+QR_MAX_SIZE = 30
+QR_DEFAULT_SIZE = 10
+QR_BORDER = 4
+QR_FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+# 렌더링 결과가 바뀌는 변경 시 올려서 기존 캐시/ETag 무효화
+QR_RENDER_VERSION = 1
+
+
+def get_share_url(slug):
+    """이벤트 공유 URL (프론트엔드)"""
+    frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')
+    return f"{frontend_url}/e/{slug}"
+
+
+def clamp_size(size):
+    """QR 코드 크기를 허용 범위로 제한 (잘못된 값이면 기본값)"""
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        size = QR_DEFAULT_SIZE
+    return max(QR_MIN_SIZE, min(QR_MAX_SIZE, size))
+
+
+def build_qr(data, size):
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=size,
+        border=QR_BORDER,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+def render_png(data, size):
+    """PIL로 PNG 이미지 생성"""
+    img = build_qr(data, size).make_image(fill_color="black", back_color="white")
+
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def iter_svg(data, size):
+    """
+    PIL 없이 QR 매트릭스를 SVG 텍스트로 스트리밍
+
+    모듈 1칸을 viewBox 단위 1로 두고 행 단위로 path 데이터를 생성합니다.
+    """
+    matrix = build_qr(data, size).get_matrix()
+    modules = len(matrix)
+    pixels = modules * size
+
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{pixels}" height="{pixels}" '
+        f'viewBox="0 0 {modules} {modules}" shape-rendering="crispEdges">'
+        f'<rect width="{modules}" height="{modules}" fill="#fff"/>'
+        '<path fill="#000" d="'
+    )
+
+    for y, row in enumerate(matrix):
+        parts = []
+        x = 0
+        while x < modules:
+            if not row[x]:
+                x += 1
+                continue
+            # 연속된 검은 모듈을 하나의 사각형으로 병합
+            start = x
+            while x < modules and row[x]:
+                x += 1
+            parts.append(f'M{start} {y}h{x - start}v1h-{x - start}z')
+        if parts:
+            yield ''.join(parts)
+
+    yield '"/></svg>\n'
+
+
+def qr_cache_key(slug, size, image_format):
+    # FRONTEND_URL이 바뀌면 이전 공유 URL로 만든 이미지를 쓰지 않도록 URL 해시 포함 (ETag와 같은 기준)
+    url_hash = hashlib.sha1(get_share_url(slug).encode('utf-8')).hexdigest()[:12]
+    return f"qr:v{QR_RENDER_VERSION}:{image_format}:{size}:{slug}:{url_hash}"
+
+
+def qr_etag(slug, size, image_format):
+    """렌더링 없이 계산 가능한 ETag (공유 URL이 바뀌면 함께 바뀜)"""
+    source = f"{QR_RENDER_VERSION}|{get_share_url(slug)}|{size}|{image_format}"
+    return '"' + hashlib.sha1(source.encode('utf-8')).hexdigest() + '"'
+
+
+def get_cached_qr(slug, size, image_format):
+    """캐시된 QR 이미지 바이트 (없으면 None)"""
+    return cache_get(qr_cache_key(slug, size, image_format))
+
+
+def store_qr(slug, size, image_format, content):
+    timeout = getattr(settings, 'QR_CACHE_TIMEOUT', 30 * 24 * 3600)
+    cache_set(qr_cache_key(slug, size, image_format), content, timeout)
+
+
+def render_qr(slug, size, image_format):
+    """QR 이미지를 렌더링해 캐시에 저장하고 바이트로 반환"""
+    share_url = get_share_url(slug)
+
+    if image_format == 'svg':
+        content = ''.join(iter_svg(share_url, size)).encode('utf-8')
+    else:
+        content = render_png(share_url, size)
+
+    store_qr(slug, size, image_format, content)
+    return content
+
+
+def stream_svg_and_store(slug, size):
+    """SVG를 스트리밍하면서 전송이 끝나면 캐시에 저장"""
+    parts = []
+    for chunk in iter_svg(get_share_url(slug), size):
+        parts.append(chunk)
+        yield chunk
+    store_qr(slug, size, 'svg', ''.join(parts).encode('utf-8'))
+
+
+def get_qr_image(slug, size, image_format):
+    """캐시 우선으로 QR 이미지 바이트 반환"""
+    content = get_cached_qr(slug, size, image_format)
+    if content is None:
+        content = render_qr(slug, size, image_format)
+    return content
@@ -2,9 +2,15 @@
 from rest_framework import serializers
 from django.conf import settings
 from datetime import datetime, timedelta
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 import pytz
+from apps.participants.models import Participant, ParticipantAvailability
 from .models import Event, TimeSlot, FinalChoice
+from .slot_format import get_slot_formatter
+from .slot_rows import SlotSummaryRow, SlotSummaryWithAllAvailableRow, slot_rows
+from .slot_grid import get_slot_grid, invalidate_slot_grid_on_commit
 
 
 class TimeSlotSerializer(serializers.ModelSerializer):
@@ -17,13 +23,11 @@ class TimeSlotSerializer(serializers.ModelSerializer):
 
     def get_start_datetime_local(self, obj):
         """이벤트의 타임존으로 변환된 시작 시간"""
-        tz = pytz.timezone(obj.event.timezone)
-        return obj.start_datetime.astimezone(tz).isoformat()
+        return get_slot_formatter(obj.event).isoformat(obj.start_datetime)
 
     def get_end_datetime_local(self, obj):
         """이벤트의 타임존으로 변환된 종료 시간"""
-        tz = pytz.timezone(obj.event.timezone)
-        return obj.end_datetime.astimezone(tz).isoformat()
+        return get_slot_formatter(obj.event).isoformat(obj.end_datetime)
 
 
 class EventSerializer(serializers.ModelSerializer):
@@ -44,8 +48,9 @@ class EventSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug', 'created_at', 'organizer_id', 'url', 'time_slots_count', 'share_url', 'qr_code_url']
 
     def get_time_slots_count(self, obj):
-        """생성된 타임슬롯 개수"""
-        return obj.time_slots.count()
+        """생성된 타임슬롯 개수 (생성 직후에는 create에서 기록한 값 사용)"""
+        count = getattr(obj, 'time_slots_count', None)
+        return obj.time_slots.count() if count is None else count
 
     def get_url(self, obj):
         frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')
@@ -85,39 +90,84 @@ class EventSerializer(serializers.ModelSerializer):
         event = super().create(validated_data)
 
         # TimeSlot 자동 생성
-        self.create_time_slots(event)
+        event.time_slots_count = self.create_time_slots(event)
 
         return event
 
     def create_time_slots(self, event):
         """
         이벤트의 날짜/시간 범위 내에서 30분 단위로 TimeSlot 생성
+
+        Returns:
+            int: 생성한 슬롯 수
         """
-        tz = pytz.timezone(event.timezone)
-        current_date = event.date_start
+        time_slots = TimeSlot.objects.bulk_create([
+            TimeSlot(
+                event=event,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime
+            )
+            for start_datetime, end_datetime in iter_slot_ranges(event)
+        ])
+
+        # bulk_create는 시그널을 보내지 않으므로 슬롯 그리드 캐시 직접 무효화
+        invalidate_slot_grid_on_commit(event.id)
+        return len(time_slots)
+
+
+def iter_slot_ranges(event):
+    """
+    이벤트의 날짜/시간 범위를 30분 단위 (시작, 종료) 쌍으로 반환
+    """
+    tz = pytz.timezone(event.timezone)
+    current_date = event.date_start
+
+    while current_date <= event.date_end:
+        # 해당 날짜의 시작 시간과 종료 시간 생성
+        start_dt = datetime.combine(current_date, event.time_start)
+        end_dt = datetime.combine(current_date, event.time_end)
+
+        # 타임존 적용
+        start_dt = tz.localize(start_dt)
+        end_dt = tz.localize(end_dt)
+
+        # 30분 단위로 슬롯 생성
+        current_time = start_dt
+        while current_time < end_dt:
+            slot_end = current_time + timedelta(minutes=30)
+            yield current_time, slot_end
+            current_time = slot_end
+
+        # 다음 날짜로
+        current_date += timedelta(days=1)
+
+
+def with_available_count(event):
+    """
+    이벤트의 슬롯별 가능 인원을 한 번의 쿼리로 집계 (slot.available_count)
+
+    event_id 조건을 상수로 넘겨 가능 시간 테이블의 해당 파티션만 조회합니다.
+    """
+    available_counts = ParticipantAvailability.objects.filter(
+        event_id=event.id,
+        time_slot_id=OuterRef('pk'),
+        is_available=True
+    ).order_by().values('time_slot_id').annotate(count=Count('id')).values('count')
+
+    return event.time_slots.annotate(
+        available_count=Coalesce(Subquery(available_counts), Value(0))
+    )
 
-        while current_date <= event.date_end:
-            # 해당 날짜의 시작 시간과 종료 시간 생성
-            start_dt = datetime.combine(current_date, event.time_start)
-            end_dt = datetime.combine(current_date, event.time_end)
 
-            # 타임존 적용
-            start_dt = tz.localize(start_dt)
-            end_dt = tz.localize(end_dt)
+def _count_by_event(queryset):
+    """OuterRef('pk') 이벤트의 행 수 서브쿼리 (JOIN + GROUP BY와 달리 다른 집계와 곱해지지 않음)"""
+    counts = queryset.filter(event_id=OuterRef('pk')).order_by().values('event_id').annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(counts), Value(0))
 
-            # 30분 단위로 슬롯 생성
-            current_time = start_dt
-            while current_time < end_dt:
-                slot_end = current_time + timedelta(minutes=30)
-                TimeSlot.objects.create(
-                    event=event,
-                    start_datetime=current_time,
-                    end_datetime=slot_end
-                )
-                current_time = slot_end
 
-            # 다음 날짜로
-            current_date += timedelta(days=1)
+def with_participant_count(queryset):
+    """이벤트별 참가자 수 주석 (event.participant_count)"""
+    return queryset.annotate(participant_count=_count_by_event(Participant.objects.all()))
 
 
 class SlotSummarySerializer(serializers.Serializer):
@@ -129,21 +179,17 @@ class SlotSummarySerializer(serializers.Serializer):
     total_participants = serializers.SerializerMethodField()
 
     def get_date(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.start_datetime.astimezone(tz)
-        return local_dt.strftime('%Y-%m-%d')
+        return get_slot_formatter(obj.event).date(obj.start_datetime)
 
     def get_start_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.start_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.start_datetime)
 
     def get_end_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.end_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.end_datetime)
 
     def get_available_count(self, obj):
+        if hasattr(obj, 'available_count'):
+            return obj.available_count
         return obj.availabilities.filter(is_available=True).count()
 
     def get_total_participants(self, obj):
@@ -151,7 +197,7 @@ class SlotSummarySerializer(serializers.Serializer):
 
 
 class EventDetailSerializer(serializers.ModelSerializer):
-    organizer_id = serializers.IntegerField(source='created_by.id', read_only=True)
+    organizer_id = serializers.IntegerField(source='created_by_id', read_only=True)
     is_closed = serializers.SerializerMethodField()
     participants_count = serializers.SerializerMethodField()
     slots = serializers.SerializerMethodField()
@@ -174,13 +220,9 @@ class EventDetailSerializer(serializers.ModelSerializer):
         return obj.participants.count()
 
     def get_slots(self, obj):
-        total_participants = obj.participants.count()
-        time_slots = obj.time_slots.all().prefetch_related('availabilities')
-        return SlotSummarySerializer(
-            time_slots,
-            many=True,
-            context={'total_participants': total_participants}
-        ).data
+        # SlotSummarySerializer와 같은 형식을 DRF 필드 처리 없이 생성
+        build = SlotSummaryRow(obj, obj.participants.count())
+        return [build(row) for row in slot_rows(with_available_count(obj))]
 
 
 class MyEventListSerializer(serializers.ModelSerializer):
@@ -195,7 +237,9 @@ class MyEventListSerializer(serializers.ModelSerializer):
         ]
 
     def get_participant_count(self, obj):
-        return obj.participants.count()
+        # 목록 조회는 with_participant_count 주석 값 사용
+        count = getattr(obj, 'participant_count', None)
+        return obj.participants.count() if count is None else count
 
 
 class EventUpdateSerializer(serializers.ModelSerializer):
@@ -239,21 +283,17 @@ class SlotSummaryWithAllAvailableSerializer(serializers.Serializer):
     is_all_available = serializers.SerializerMethodField()
 
     def get_date(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.start_datetime.astimezone(tz)
-        return local_dt.strftime('%Y-%m-%d')
+        return get_slot_formatter(obj.event).date(obj.start_datetime)
 
     def get_start_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.start_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.start_datetime)
 
     def get_end_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.end_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.end_datetime)
 
     def get_available_count(self, obj):
+        if hasattr(obj, 'available_count'):
+            return obj.available_count
         return obj.availabilities.filter(is_available=True).count()
 
     def get_is_all_available(self, obj):
@@ -268,113 +308,94 @@ class EventSummarySerializer(serializers.Serializer):
     slots = serializers.SerializerMethodField()
     best_slots = serializers.SerializerMethodField()
 
-    def get_total_participants(self, obj):
-        return obj.participants.count()
-
-    def get_slots(self, obj):
-        total_participants = self.get_total_participants(obj)
-        time_slots = obj.time_slots.all().prefetch_related('availabilities')
-
-        # 필터링
-        min_participants = self.context.get('min_participants', 1)
-        only_all_available = self.context.get('only_all_available', False)
-
-        filtered_slots = []
-        for slot in time_slots:
-            available_count = slot.availabilities.filter(is_available=True).count()
+    def _memo(self, obj):
+        # many=True로 재사용될 수 있으므로 이벤트별로 저장
+        return self.__dict__.setdefault('_summary_memo', {}).setdefault(obj.pk, {})
 
-            if available_count < min_participants:
-                continue
-
-            if only_all_available and available_count != total_participants:
-                continue
+    def get_total_participants(self, obj):
+        memo = self._memo(obj)
+        if 'total_participants' not in memo:
+            memo['total_participants'] = obj.participants.count()
+        return memo['total_participants']
 
-            filtered_slots.append(slot)
+    def get_filtered_slots(self, obj):
+        """
+        필터 조건에 맞는 슬롯 (slots, best_slots에서 한 번만 조회)
 
-        return SlotSummaryWithAllAvailableSerializer(
-            filtered_slots,
-            many=True,
-            context={'total_participants': total_participants}
-        ).data
+        SlotSummaryWithAllAvailableSerializer와 같은 형식의 dict를 DRF 필드 처리 없이 생성합니다.
+        """
+        memo = self._memo(obj)
+        if 'filtered_slots' in memo:
+            return memo['filtered_slots']
 
-    def get_best_slots(self, obj):
         total_participants = self.get_total_participants(obj)
-        time_slots = obj.time_slots.all().prefetch_related('availabilities')
+        build = SlotSummaryWithAllAvailableRow(obj, total_participants)
 
         # 필터링
         min_participants = self.context.get('min_participants', 1)
         only_all_available = self.context.get('only_all_available', False)
 
         filtered_slots = []
-        for slot in time_slots:
-            available_count = slot.availabilities.filter(is_available=True).count()
-
+        for row in slot_rows(with_available_count(obj)):
+            available_count = row[3]
             if available_count < min_participants:
                 continue
 
             if only_all_available and available_count != total_participants:
                 continue
 
-            filtered_slots.append(slot)
+            filtered_slots.append(build(row))
+
+        memo['filtered_slots'] = filtered_slots
+        return filtered_slots
+
+    def get_slots(self, obj):
+        return self.get_filtered_slots(obj)
 
+    def get_best_slots(self, obj):
         # available_count로 정렬 (내림차순)
-        sorted_slots = sorted(
-            filtered_slots,
-            key=lambda s: s.availabilities.filter(is_available=True).count(),
+        return sorted(
+            self.get_filtered_slots(obj),
+            key=lambda s: s['available_count'],
             reverse=True
         )
 
-        return SlotSummaryWithAllAvailableSerializer(
-            sorted_slots,
-            many=True,
-            context={'total_participants': total_participants}
-        ).data
-
 
 class FinalChoiceSerializer(serializers.Serializer):
     slot_id = serializers.IntegerField(write_only=True)
-    event_id = serializers.IntegerField(source='event.id', read_only=True)
+    event_id = serializers.IntegerField(read_only=True)
     date = serializers.SerializerMethodField()
     start_time = serializers.SerializerMethodField()
     end_time = serializers.SerializerMethodField()
-    chosen_by = serializers.IntegerField(source='chosen_by.id', read_only=True)
+    chosen_by = serializers.IntegerField(source='chosen_by_id', read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
 
     def get_date(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.slot.start_datetime.astimezone(tz)
-        return local_dt.strftime('%Y-%m-%d')
+        return get_slot_formatter(obj.event).date(obj.slot.start_datetime)
 
     def get_start_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.slot.start_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.slot.start_datetime)
 
     def get_end_time(self, obj):
-        tz = pytz.timezone(obj.event.timezone)
-        local_dt = obj.slot.end_datetime.astimezone(tz)
-        return local_dt.strftime('%H:%M')
+        return get_slot_formatter(obj.event).time(obj.slot.end_datetime)
 
     def validate_slot_id(self, value):
         """슬롯 ID 유효성 검사"""
-        if not TimeSlot.objects.filter(id=value).exists():
+        grid = get_slot_grid(self.context.get('event'))
+        if value not in grid and not TimeSlot.objects.filter(id=value).exists():
             raise serializers.ValidationError("유효하지 않은 슬롯 ID입니다")
         return value
 
     def validate(self, attrs):
         """전체 유효성 검사"""
-        request = self.context.get('request')
         event = self.context.get('event')
 
-        # 슬롯이 해당 이벤트에 속하는지 확인
+        # 슬롯이 해당 이벤트에 속하는지 확인 (캐시한 슬롯 그리드에서 슬롯 시각까지 가져옴)
         slot_id = attrs.get('slot_id')
-        try:
-            slot = TimeSlot.objects.get(id=slot_id)
-            if slot.event != event:
-                raise serializers.ValidationError("해당 슬롯은 이 이벤트에 속하지 않습니다")
-            attrs['slot'] = slot
-        except TimeSlot.DoesNotExist:
-            raise serializers.ValidationError("유효하지 않은 슬롯 ID입니다")
+        grid = get_slot_grid(event)
+        if slot_id not in grid:
+            raise serializers.ValidationError("해당 슬롯은 이 이벤트에 속하지 않습니다")
+        attrs['slot'] = grid.time_slot(slot_id, event)
 
         return attrs
 
@@ -479,6 +500,20 @@ class HeatmapSlotSerializer(serializers.Serializer):
     availability_rate = serializers.FloatField()  # 가능 비율 (%)
 
 
+class CompactHeatmapSlotSerializer(serializers.Serializer):
+    """히트맵용 타임슬롯 Serializer (compact: 참가자는 participants 목록의 인덱스로 표시)"""
+    slot_id = serializers.IntegerField()
+    start_datetime = serializers.DateTimeField()
+    end_datetime = serializers.DateTimeField()
+    start_datetime_local = serializers.CharField()
+    end_datetime_local = serializers.CharField()
+    available_count = serializers.IntegerField()
+    available_participant_indexes = serializers.ListField(
+        child=serializers.IntegerField()
+    )
+    availability_rate = serializers.FloatField()  # 가능 비율 (%)
+
+
 class DashboardStatsSerializer(serializers.Serializer):
     """대시보드 통계 Serializer"""
     total_participants = serializers.IntegerField()
@@ -498,6 +533,11 @@ class EventDashboardSerializer(serializers.Serializer):
     heatmap = HeatmapSlotSerializer(many=True)
 
 
+class CompactEventDashboardSerializer(EventDashboardSerializer):
+    """이벤트 대시보드 응답 Serializer (format=compact)"""
+    heatmap = CompactHeatmapSlotSerializer(many=True)
+
+
 class CalendarExportSerializer(serializers.Serializer):
     """캘린더 내보내기 정보 Serializer"""
     event_id = serializers.IntegerField()
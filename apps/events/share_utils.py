@@ -0,0 +1,99 @@
+"""
+이벤트 공유 정보(카카오톡 템플릿, 이메일 문구, QR 이미지) 생성 유틸리티
+
+이벤트 생성 직후 공유 요청이 몰리므로 Celery 태스크에서 미리 만들어 캐시에 저장하고,
+공유 API는 저장된 결과를 그대로 반환합니다.
+"""
+from django.conf import settings
+from config.cache_utils import cache_get, cache_set
+from .kakao_utils import get_kakao_share_link
+from .qr_utils import get_share_url, get_cached_qr, render_qr
+
+# 미리 생성해 둘 QR 코드 (크기, 형식)
+SHARE_QR_VARIANTS = [
+    (10, 'png'),
+    (10, 'svg'),
+    (20, 'png'),
+    (20, 'svg'),
+]
+
+SHARE_BUNDLE_VERSION = 1
+
+
+def share_bundle_cache_key(event):
+    # 이벤트 수정 시 updated_at이 바뀌므로 자동으로 새 키를 사용
+    return f"share:v{SHARE_BUNDLE_VERSION}:{event.id}:{event.updated_at.timestamp()}"
+
+
+def build_share_bundle(event):
+    """요청과 무관한 공유 정보 생성"""
+    share_url = get_share_url(event.slug)
+
+    # 카카오톡 공유용 정보
+    kakao_title = f"📅 {event.title}"
+    kakao_description = f"{event.description[:100]}..." if len(event.description) > 100 else event.description
+
+    # 카카오톡 SDK용 템플릿 객체 (프론트엔드에서 바로 사용 가능)
+    kakao_template = get_kakao_share_link(event.slug, event.title, kakao_description, share_url)
+
+    # 이메일 공유용 정보
+    email_subject = f"[일정 조율 초대] {event.title}"
+    email_body = f"""
+안녕하세요!
+
+'{event.title}' 일정 조율에 초대합니다.
+
+📅 기간: {event.date_start} ~ {event.date_end}
+⏰ 시간: {event.time_start.strftime('%H:%M')} ~ {event.time_end.strftime('%H:%M')}
+
+아래 링크에서 참가 가능한 시간을 선택해주세요:
+{share_url}
+
+감사합니다!
+"""
+
+    return {
+        'event_id': event.id,
+        'event_title': event.title,
+        'event_slug': event.slug,
+        'share_url': share_url,
+        'kakao_title': kakao_title,
+        'kakao_description': kakao_description,
+        'kakao_image_url': None,  # 나중에 이벤트 이미지 추가 가능
+        'kakao_template': kakao_template,
+        'email_subject': email_subject,
+        'email_body': email_body,
+    }
+
+
+def store_share_bundle(event):
+    bundle = build_share_bundle(event)
+    timeout = getattr(settings, 'SHARE_ASSETS_CACHE_TIMEOUT', 7 * 24 * 3600)
+    cache_set(share_bundle_cache_key(event), bundle, timeout)
+    return bundle
+
+
+def get_share_bundle(event):
+    """저장된 공유 정보 반환 (없으면 생성 후 저장)"""
+    bundle = cache_get(share_bundle_cache_key(event))
+    if bundle is None:
+        bundle = store_share_bundle(event)
+    return bundle
+
+
+def generate_share_assets(event):
+    """
+    공유 정보와 자주 쓰는 크기의 QR 이미지를 미리 생성
+
+    Returns:
+        int: 새로 렌더링한 QR 이미지 수
+    """
+    store_share_bundle(event)
+
+    rendered = 0
+    for size, image_format in SHARE_QR_VARIANTS:
+        if get_cached_qr(event.slug, size, image_format) is None:
+            render_qr(event.slug, size, image_format)
+            rendered += 1
+
+    return rendered
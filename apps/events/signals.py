@@ -0,0 +1,42 @@
+from weakref import WeakKeyDictionary
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Event, FinalChoice, TimeSlot
+from .ics_utils import invalidate_vevent
+from .slot_grid import invalidate_slot_grid_on_commit
+
+# delete() 호출(origin)별로 무효화를 예약한 이벤트 id (슬롯 수만큼 중복 예약하지 않도록)
+_slot_grid_pending = WeakKeyDictionary()
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_caches(sender, instance, **kwargs):
+    """이벤트 변경 시 캐시된 캘린더 블록 무효화"""
+    invalidate_vevent(instance.id)
+
+
+@receiver(post_save, sender=FinalChoice)
+@receiver(post_delete, sender=FinalChoice)
+def invalidate_final_choice_caches(sender, instance, **kwargs):
+    """최종 시간 확정/취소 시 캐시된 캘린더 블록 무효화"""
+    invalidate_vevent(instance.event_id)
+
+
+@receiver(post_save, sender=TimeSlot)
+def invalidate_time_slot_caches(sender, instance, **kwargs):
+    """슬롯 추가/수정 시 (커밋 후) 슬롯 그리드 캐시 무효화"""
+    invalidate_slot_grid_on_commit(instance.event_id)
+
+
+@receiver(post_delete, sender=TimeSlot)
+def invalidate_deleted_time_slot_caches(sender, instance, origin=None, **kwargs):
+    """슬롯 삭제 시 (커밋 후) 슬롯 그리드 캐시 무효화, 쿼리셋 일괄 삭제는 이벤트별로 한 번만"""
+    if origin is None:
+        invalidate_slot_grid_on_commit(instance.event_id)
+        return
+
+    pending = _slot_grid_pending.setdefault(origin, set())
+    if instance.event_id not in pending:
+        pending.add(instance.event_id)
+        invalidate_slot_grid_on_commit(instance.event_id)
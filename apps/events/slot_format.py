@@ -0,0 +1,50 @@
+"""
+슬롯 시각 표시 문자열 (이벤트 타임존 기준)
+
+슬롯 수천 개를 직렬화할 때 필드마다 pytz.timezone() + astimezone() + strftime()을 반복하지 않도록
+이벤트 버전(id, 타임존, updated_at)별 SlotFormatter를 재사용하고, 시각별 변환 결과를 메모이제이션합니다.
+같은 이벤트의 슬롯은 요청이 달라도 같은 시각을 반복하므로 두 번째 요청부터는 변환 없이 문자열을 꺼냅니다.
+"""
+from functools import lru_cache
+import pytz
+
+
+class SlotFormatter:
+    """한 이벤트의 슬롯 시각 → (날짜 'YYYY-MM-DD', 시각 'HH:MM', ISO 8601) 변환"""
+
+    def __init__(self, tz_name):
+        self.tz = pytz.timezone(tz_name)
+        self._cache = {}
+
+    def local(self, value):
+        cached = self._cache.get(value)
+        if cached is None:
+            local_dt = value.astimezone(self.tz)
+            cached = (
+                f'{local_dt.year:04d}-{local_dt.month:02d}-{local_dt.day:02d}',
+                f'{local_dt.hour:02d}:{local_dt.minute:02d}',
+                local_dt.isoformat(),
+            )
+            self._cache[value] = cached
+        return cached
+
+    def date(self, value):
+        return self.local(value)[0]
+
+    def time(self, value):
+        return self.local(value)[1]
+
+    def isoformat(self, value):
+        return self.local(value)[2]
+
+
+@lru_cache(maxsize=256)
+def _formatter(event_id, tz_name, version):
+    return SlotFormatter(tz_name)
+
+
+def get_slot_formatter(event):
+    """
+    이벤트 버전별 SlotFormatter (이벤트 수정 시 updated_at이 바뀌어 새로 생성)
+    """
+    return _formatter(event.pk, event.timezone, event.updated_at)
@@ -0,0 +1,103 @@
+"""
+이벤트 슬롯 그리드 캐시
+
+이벤트의 슬롯을 시작 시각 순서로 나열한 그리드(슬롯 id ↔ 순번 ↔ (시작, 종료))를 캐시합니다.
+가능 시간 제출(구간/비트맵 변환, 슬롯 ID 검증)과 최종 시간 확정의 슬롯 검증이
+이벤트 크기와 관계없이 슬롯을 다시 조회하지 않도록 합니다.
+
+슬롯을 만들거나 수정/삭제하면 커밋 후 무효화합니다. (TimeSlot post_save/post_delete 시그널,
+시그널을 보내지 않는 bulk_create 경로는 invalidate_slot_grid_on_commit() 직접 호출)
+캐시 값에는 이벤트 created_at을 버전으로 함께 저장해 같은 id로 다시 만들어진 이벤트의 그리드를 쓰지 않습니다.
+"""
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from config.cache_utils import cache_get, cache_set, cache_delete
+from .models import TimeSlot
+
+SLOT_GRID_FIELDS = ('id', 'start_datetime', 'end_datetime')
+
+
+class SlotGrid:
+    """시작 시각 순으로 정렬한 이벤트 슬롯 (순번 0부터)"""
+    __slots__ = ('rows', 'slot_ids', 'ordinals')
+
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+        self.slot_ids = tuple(row[0] for row in self.rows)
+        self.ordinals = {slot_id: ordinal for ordinal, slot_id in enumerate(self.slot_ids)}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, slot_id):
+        return slot_id in self.ordinals
+
+    def ordinal(self, slot_id):
+        """슬롯 id → 순번 (이벤트의 슬롯이 아니면 None)"""
+        return self.ordinals.get(slot_id)
+
+    def bounds(self, slot_id):
+        """슬롯 id → (start_datetime, end_datetime)"""
+        _, start_datetime, end_datetime = self.rows[self.ordinals[slot_id]]
+        return start_datetime, end_datetime
+
+    def time_slot(self, slot_id, event):
+        """슬롯 id → 조회 없이 만든 TimeSlot 인스턴스"""
+        start_datetime, end_datetime = self.bounds(slot_id)
+        slot = TimeSlot.from_db(
+            DEFAULT_DB_ALIAS,
+            ['id', 'event_id', 'start_datetime', 'end_datetime'],
+            [slot_id, event.id, start_datetime, end_datetime],
+        )
+        slot.event = event
+        return slot
+
+    def ids_for_ranges(self, ranges):
+        """
+        [시작 순번, 끝 순번] 구간 목록 (끝 포함) → 그리드 순서의 슬롯 id 목록
+
+        구간이 겹치면 한 번만 포함합니다. 범위 검사는 호출하는 쪽에서 합니다.
+        """
+        selected = bytearray(len(self.slot_ids))
+        for start, end in ranges:
+            selected[start:end + 1] = b'\x01' * (end - start + 1)
+        return [slot_id for slot_id, flag in zip(self.slot_ids, selected) if flag]
+
+    def ids_for_bitmap(self, bitmap):
+        """그리드 순서의 '0'/'1' 문자열 → 슬롯 id 목록"""
+        return [slot_id for slot_id, flag in zip(self.slot_ids, bitmap) if flag == '1']
+
+
+def slot_grid_cache_key(event_id):
+    return f"slot_grid:{event_id}"
+
+
+def get_slot_grid(event):
+    """이벤트 슬롯 그리드 (캐시 미스 시 (id, 시작, 종료)만 한 번 조회)"""
+    key = slot_grid_cache_key(event.id)
+    version = event.created_at.isoformat()
+
+    entry = cache_get(key)
+    if entry and entry[0] == version:
+        return SlotGrid(entry[1])
+
+    rows = list(
+        TimeSlot.objects.filter(event_id=event.id).order_by('start_datetime', 'id').values_list(*SLOT_GRID_FIELDS)
+    )
+    # 슬롯 생성 중에 조회된 빈 그리드는 캐시하지 않음
+    if rows:
+        cache_set(key, (version, rows), settings.SLOT_GRID_CACHE_TIMEOUT)
+    return SlotGrid(rows)
+
+
+def invalidate_slot_grid(event_id):
+    cache_delete(slot_grid_cache_key(event_id))
+
+
+def invalidate_slot_grid_on_commit(event_id):
+    """
+    트랜잭션 커밋 후 무효화
+
+    커밋 전에 지우면 동시에 들어온 요청이 커밋 전 슬롯 목록을 다시 캐시할 수 있습니다.
+    """
+    transaction.on_commit(lambda: invalidate_slot_grid(event_id))
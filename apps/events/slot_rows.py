@@ -0,0 +1,61 @@
+"""
+슬롯 목록 응답용 경량 행 빌더
+
+이벤트 상세/요약의 슬롯 목록은 API에서 가장 큰 응답이라 DRF Serializer의 필드별 처리 비용이 대부분을 차지합니다.
+values_list() 튜플 (id, start_datetime, end_datetime, available_count)에서 바로 dict를 만들어 이를 우회합니다.
+
+출력 형식은 SlotSummarySerializer, SlotSummaryWithAllAvailableSerializer와 같아야 하며 (필드 순서 포함)
+apps/events/tests.py의 SlotRowParityTests가 이를 검사합니다.
+"""
+from .slot_format import get_slot_formatter
+
+SLOT_ROW_FIELDS = ('id', 'start_datetime', 'end_datetime', 'available_count')
+
+
+def slot_rows(time_slots):
+    """with_available_count() 쿼리셋 → (id, start_datetime, end_datetime, available_count) 튜플 목록"""
+    return list(time_slots.values_list(*SLOT_ROW_FIELDS))
+
+
+class SlotSummaryRow:
+    """SlotSummarySerializer와 같은 dict 생성"""
+    __slots__ = ('formatter', 'total_participants')
+
+    def __init__(self, event, total_participants):
+        self.formatter = get_slot_formatter(event)
+        self.total_participants = total_participants
+
+    def __call__(self, row):
+        slot_id, start_datetime, end_datetime, available_count = row
+        local = self.formatter.local
+        date, start_time, _ = local(start_datetime)
+        return {
+            'slot_id': slot_id,
+            'date': date,
+            'start_time': start_time,
+            'end_time': local(end_datetime)[1],
+            'available_count': available_count,
+            'total_participants': self.total_participants,
+        }
+
+
+class SlotSummaryWithAllAvailableRow:
+    """SlotSummaryWithAllAvailableSerializer와 같은 dict 생성"""
+    __slots__ = ('formatter', 'total_participants')
+
+    def __init__(self, event, total_participants):
+        self.formatter = get_slot_formatter(event)
+        self.total_participants = total_participants
+
+    def __call__(self, row):
+        slot_id, start_datetime, end_datetime, available_count = row
+        local = self.formatter.local
+        date, start_time, _ = local(start_datetime)
+        return {
+            'slot_id': slot_id,
+            'date': date,
+            'start_time': start_time,
+            'end_time': local(end_datetime)[1],
+            'available_count': available_count,
+            'is_all_available': available_count == self.total_participants and self.total_participants > 0,
+        }
@@ -3,38 +3,116 @@ Solapi SMS 발송 유틸리티
 """
 import hashlib
 import hmac
+import threading
 import time
 import uuid
 import requests
 import logging
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.conf import settings
+from urllib3.exceptions import NewConnectionError
+from apps.monitoring.metrics import instrumented_post, observe_histogram
 
 logger = logging.getLogger(__name__)
 
+SOLAPI_SEND_URL = "https://api.solapi.com/messages/v4/send"
+SOLAPI_SEND_MANY_URL = "https://api.solapi.com/messages/v4/send-many"
 
-def get_solapi_headers():
+
+class SolapiSigner:
     """
-    Solapi API 인증 헤더 생성
+    Solapi HMAC-SHA256 인증 헤더 생성기
+
+    - API 시크릿으로 키를 설정한 HMAC 객체를 한 번만 만들고 copy()로 재사용
+    - Solapi는 같은 salt/서명의 재사용을 거부하므로 헤더는 캐시하지 않고 요청마다 새 date/salt로 서명
+      (병렬로 보내는 청크도 각각 다른 서명)
+    - 서명 횟수, 서명 소요 시간을 stats로 노출
+    """
+
+    def __init__(self, api_key, api_secret):
+        self.api_key = api_key
+        self._hmac = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self._lock = threading.Lock()
+        self.stats = {
+            'signatures': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0,
+        }
+
+    def headers(self):
+        started = time.perf_counter()
+
+        date = time.strftime('%Y-%m-%dT%H:%M:%S%z')
+        salt = str(uuid.uuid4())
+
+        mac = self._hmac.copy()
+        mac.update((date + salt).encode('utf-8'))
+        signature = mac.hexdigest()
+
+        headers = {
+            'Authorization': f'HMAC-SHA256 apiKey={self.api_key}, date={date}, salt={salt}, signature={signature}',
+            'Content-Type': 'application/json'
+        }
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.stats['signatures'] += 1
+            self.stats['total_seconds'] += elapsed
+            self.stats['max_seconds'] = max(self.stats['max_seconds'], elapsed)
+
+        # 워커 간 집계용 지표 (Redis 기록은 lock 밖에서)
+        observe_histogram('solapi_signing_seconds', ('solapi',), elapsed)
+        return headers
+
+
+_signer = None
+_signer_lock = threading.Lock()
+
+
+def get_solapi_signer():
+    """
+    현재 설정에 맞는 SolapiSigner 반환 (설정이 바뀌지 않으면 같은 인스턴스 재사용)
     """
+    global _signer
+
     api_key = getattr(settings, 'SOLAPI_API_KEY', '')
     api_secret = getattr(settings, 'SOLAPI_API_SECRET', '')
 
     if not api_key or not api_secret:
         return None
 
-    date = time.strftime('%Y-%m-%dT%H:%M:%S%z')
-    salt = str(uuid.uuid4())
+    config = (api_key, api_secret)
 
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        (date + salt).encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    with _signer_lock:
+        if _signer is None or _signer[0] != config:
+            _signer = (config, SolapiSigner(api_key, api_secret))
+        return _signer[1]
 
-    return {
-        'Authorization': f'HMAC-SHA256 apiKey={api_key}, date={date}, salt={salt}, signature={signature}',
-        'Content-Type': 'application/json'
-    }
+
+def get_signing_stats():
+    """
+    서명 지표 조회 (signatures, total_seconds, max_seconds, avg_seconds)
+    """
+    signer = _signer[1] if _signer else None
+    if signer is None:
+        return {'signatures': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'avg_seconds': 0.0}
+
+    stats = dict(signer.stats)
+    stats['avg_seconds'] = stats['total_seconds'] / stats['signatures'] if stats['signatures'] else 0.0
+    return stats
+
+
+def get_solapi_headers():
+    """
+    Solapi API 인증 헤더 생성
+    """
+    signer = get_solapi_signer()
+
+    if signer is None:
+        return None
+
+    return signer.headers()
 
 
 def normalize_phone_number(phone):
@@ -96,8 +174,6 @@ def send_sms(phone_number, message):
     message_bytes = len(message.encode('utf-8'))
     msg_type = 'LMS' if message_bytes > 90 else 'SMS'
 
-    url = "https://api.solapi.com/messages/v4/send"
-
     payload = {
         "message": {
             "to": normalized_phone,
@@ -108,7 +184,7 @@ def send_sms(phone_number, message):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = instrumented_post('solapi', 'send', SOLAPI_SEND_URL, headers=headers, json=payload, timeout=10)
         result = response.json()
 
         if response.status_code == 200:
@@ -140,20 +216,181 @@ def send_sms(phone_number, message):
         }
 
 
+def _chunked(items, size):
+    """리스트를 size 단위 청크로 분할"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class RateLimiter:
+    """
+    초당 요청 수를 제한하는 토큰 버킷 (스레드 안전)
+
+    rate_per_second 가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate_per_second, burst=None):
+        self.rate = float(rate_per_second)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def _is_connect_error(error):
+    """요청이 서버에 전달되기 전에 실패했는지 (연결 실패만 재발송해도 중복 발송되지 않음)"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _failed_by_index(chunk, failed_messages):
+    """
+    메시지 단위 실패 목록 → {메시지 인덱스: 사유}
+
+    실패 항목에는 수신번호만 있으므로, 같은 번호가 여러 번 있으면 청크 순서대로 하나씩 대응시킵니다.
+    """
+    indexes_by_to = defaultdict(deque)
+    for index, message in chunk:
+        indexes_by_to[message['to']].append(index)
+
+    failed = {}
+    for item in failed_messages:
+        indexes = indexes_by_to.get(item.get('to'))
+        if indexes:
+            failed[indexes.popleft()] = item.get('statusMessage', '발송 실패')
+    return failed
+
+
+def _post_send_many(chunk, limiter):
+    """
+    send-many API 1회 호출
+
+    send-many는 멱등하지 않으므로 요청이 전달되지 않았거나 처리되지 않은 경우(연결 실패, 429, 5xx)만 재시도합니다.
+    응답 대기 중 타임아웃/연결 끊김은 이미 발송되었을 수 있으므로 재시도하지 않고 결과 불명으로 처리합니다.
+
+    Args:
+        chunk: [(인덱스, 메시지 dict), ...]
+        limiter: RateLimiter
+
+    Returns:
+        tuple: (실패한 메시지 {인덱스: 사유} 또는 None, 오류 메시지, 재시도 가능 여부, 결과 불명 여부)
+    """
+    headers = get_solapi_headers()
+    if not headers:
+        return None, 'Solapi API 키가 설정되지 않았습니다.', False, False
+
+    timeout = getattr(settings, 'SOLAPI_REQUEST_TIMEOUT', 30)
+    payload = {
+        "messages": [message for _, message in chunk]
+    }
+
+    limiter.acquire()
+
+    try:
+        response = instrumented_post('solapi', 'send_many', SOLAPI_SEND_MANY_URL, headers=headers, json=payload, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        if _is_connect_error(e):
+            logger.error(f"SMS 일괄 발송 연결 실패 ({len(chunk)}건): {str(e)}")
+            return None, f'SMS 발송 중 오류: {str(e)}', True, False
+        logger.error(f"SMS 일괄 발송 결과 불명 ({len(chunk)}건, 재시도하지 않음): {str(e)}")
+        return None, 'SMS 발송 결과 확인 불가 (응답 타임아웃, 중복 발송 방지를 위해 재시도하지 않음)', False, True
+
+    try:
+        result = response.json()
+    except ValueError:
+        result = {}
+
+    if response.status_code != 200:
+        error_msg = result.get('errorMessage', '알 수 없는 오류')
+        retryable = response.status_code == 429 or response.status_code >= 500
+        logger.error(f"SMS 일괄 발송 실패 ({response.status_code}): {error_msg}")
+        return None, f'SMS 발송 실패: {error_msg}', retryable, False
+
+    # 메시지 단위 실패 목록 (잘못된 번호 등은 재시도하지 않음)
+    return _failed_by_index(chunk, result.get('failedMessageList') or []), None, False, False
+
+
+def _dispatch_chunks(chunks):
+    """
+    청크들을 제한된 동시성과 속도로 발송하고, 실패한 청크만 재시도
+
+    Returns:
+        dict: {청크 인덱스: (실패 메시지 {인덱스: 사유} 또는 None, 오류 메시지, 결과 불명 여부)}
+    """
+    max_concurrency = max(1, getattr(settings, 'SOLAPI_MAX_CONCURRENCY', 4))
+    max_retries = max(0, getattr(settings, 'SOLAPI_MAX_RETRIES', 2))
+    retry_backoff = getattr(settings, 'SOLAPI_RETRY_BACKOFF', 1.0)
+    limiter = RateLimiter(getattr(settings, 'SOLAPI_RATE_LIMIT', 10))
+
+    outcomes = {}
+    pending = list(range(len(chunks)))
+    attempt = 0
+
+    while pending:
+        retry = []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as executor:
+            futures = {
+                executor.submit(_post_send_many, chunks[index], limiter): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                failed, error, retryable, unknown = future.result()
+
+                if error and retryable and attempt < max_retries:
+                    retry.append(index)
+                else:
+                    outcomes[index] = (failed, error, unknown)
+
+        pending = sorted(retry)
+        if pending:
+            attempt += 1
+            logger.warning(f"SMS 일괄 발송 실패 청크 재시도 ({attempt}/{max_retries}): {len(pending)}개")
+            time.sleep(retry_backoff * (2 ** (attempt - 1)))
+
+    return outcomes
+
+
 def send_sms_batch(phone_numbers, message):
     """
     여러 수신자에게 SMS 일괄 발송
 
+    수신자 목록을 SOLAPI_BATCH_SIZE 단위로 나누어 send-many API로 발송합니다.
+    청크는 SOLAPI_MAX_CONCURRENCY 개까지 동시에, 초당 SOLAPI_RATE_LIMIT 건 이하로 요청하며
+    연결 실패/5xx/429로 실패한 청크만 SOLAPI_MAX_RETRIES 회까지 재시도합니다.
+    응답 타임아웃은 이미 발송되었을 수 있으므로 재시도하지 않고 결과 불명(unknown)으로 반환합니다.
+
     Args:
         phone_numbers: 전화번호 리스트
         message: 메시지 내용
 
     Returns:
-        dict: 발송 결과 {'success_count': int, 'fail_count': int, 'results': list}
+        dict: 발송 결과 {'success_count': int, 'fail_count': int, 'unknown_count': int, 'results': list}
     """
-    headers = get_solapi_headers()
-
-    if not headers:
+    if get_solapi_signer() is None:
         return {
             'success_count': 0,
             'fail_count': len(phone_numbers),
@@ -174,62 +411,68 @@ def send_sms_batch(phone_numbers, message):
     message_bytes = len(message.encode('utf-8'))
     msg_type = 'LMS' if message_bytes > 90 else 'SMS'
 
-    # 메시지 리스트 생성
+    # 메시지 리스트 생성 (원래 순서의 인덱스를 함께 보관)
+    results = [None] * len(phone_numbers)
     messages = []
-    for phone in phone_numbers:
+    for index, phone in enumerate(phone_numbers):
         normalized = normalize_phone_number(phone)
         if normalized:
-            messages.append({
+            messages.append((index, {
                 "to": normalized,
                 "from": from_number,
                 "text": message,
                 "type": msg_type
-            })
+            }))
+        else:
+            results[index] = {
+                'phone': phone,
+                'success': False,
+                'message': '유효하지 않은 전화번호입니다.'
+            }
 
     if not messages:
         return {
             'success_count': 0,
             'fail_count': len(phone_numbers),
             'total': len(phone_numbers),
-            'message': '유효한 전화번호가 없습니다.'
+            'message': '유효한 전화번호가 없습니다.',
+            'results': results
         }
 
-    url = "https://api.solapi.com/messages/v4/send-many"
+    batch_size = max(1, getattr(settings, 'SOLAPI_BATCH_SIZE', 500))
+    chunks = list(_chunked(messages, batch_size))
+    outcomes = _dispatch_chunks(chunks)
+
+    # 청크별 결과를 메시지 단위로 병합
+    for chunk_index, chunk in enumerate(chunks):
+        failed, error, unknown = outcomes[chunk_index]
+        for index, _ in chunk:
+            if error:
+                results[index] = {'phone': phone_numbers[index], 'success': False, 'message': error}
+                if unknown:
+                    results[index]['unknown'] = True
+            elif index in failed:
+                results[index] = {
+                    'phone': phone_numbers[index],
+                    'success': False,
+                    'message': f"SMS 발송 실패: {failed[index]}"
+                }
+            else:
+                results[index] = {'phone': phone_numbers[index], 'success': True, 'message': 'SMS 발송 성공'}
+
+    success_count = sum(1 for result in results if result['success'])
+    unknown_count = sum(1 for result in results if result.get('unknown'))
+    fail_count = len(results) - success_count
+
+    logger.info(
+        f"SMS 일괄 발송 완료: 성공 {success_count}, 실패 {fail_count} (결과 불명 {unknown_count}) (청크 {len(chunks)}개)"
+    )
 
-    payload = {
-        "messages": messages
+    return {
+        'success_count': success_count,
+        'fail_count': fail_count,
+        'unknown_count': unknown_count,
+        'total': len(phone_numbers),
+        'message': f'{success_count}건 발송 성공',
+        'results': results
     }
-
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        result = response.json()
-
-        if response.status_code == 200:
-            success_count = result.get('successCount', 0)
-            fail_count = result.get('failCount', 0)
-
-            logger.info(f"SMS 일괄 발송 완료: 성공 {success_count}, 실패 {fail_count}")
-
-            return {
-                'success_count': success_count,
-                'fail_count': fail_count,
-                'total': len(messages),
-                'message': f'{success_count}건 발송 성공'
-            }
-        else:
-            error_msg = result.get('errorMessage', '알 수 없는 오류')
-            return {
-                'success_count': 0,
-                'fail_count': len(messages),
-                'total': len(messages),
-                'message': f'SMS 발송 실패: {error_msg}'
-            }
-
-    except Exception as e:
-        logger.error(f"SMS 일괄 발송 중 오류: {str(e)}")
-        return {
-            'success_count': 0,
-            'fail_count': len(messages),
-            'total': len(messages),
-            'message': f'SMS 발송 중 오류: {str(e)}'
-        }
@@ -0,0 +1,250 @@
+"""
+대량 합성 데이터 생성
+
+factory-boy/Faker로 사용자, 이벤트, 타임슬롯, 참가자, 가능 시간을 만들어
+PostgreSQL에서는 COPY, 그 외 DB에서는 bulk_create로 배치 저장합니다.
+같은 시드는 같은 데이터(실행 시점 기준 상대 날짜)를 만듭니다.
+
+PostgreSQL에서는 id를 시퀀스에서 미리 받아 created_at 등 모든 컬럼을 그대로 저장하고,
+bulk_create 경로에서는 auto_now/auto_now_add 필드가 저장 시각으로 덮어써집니다.
+
+만든 사용자는 합성 전용 이메일 도메인(EMAIL_DOMAIN), 이벤트는 시드별 슬러그 접두사로 구분하고,
+정리할 때는 두 조건을 모두 만족하는 행(합성 사용자가 만든 합성 슬러그 이벤트)만 삭제합니다.
+"""
+import io
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+import factory.random
+from django.db import connection, transaction
+from apps.accounts.factories import UserFactory
+from apps.accounts.models import User
+from apps.participants.factories import ParticipantFactory
+from apps.participants.models import Participant, ParticipantAvailability
+from .archive import delete_in_chunks, purge_events
+from .factories import EventFactory
+from .models import Event, TimeSlot, FinalChoice, ArchivedEvent
+from .serializers import iter_slot_ranges
+
+SLUG_PREFIX = 'synthetic-'
+EMAIL_PREFIX = 'synthetic'
+EMAIL_DOMAIN = 'synthetic.invalid'  # 예약 TLD라 실제 사용자 이메일과 겹치지 않음
+
+
+@dataclass
+class SyntheticConfig:
+    users: int = 1000
+    events: int = 10000
+    max_days: int = 7
+    max_hours: int = 8
+    participants: int = 10  # 이벤트당 평균 참가자 수
+    fill: float = 0.3  # 참가자별 가능 슬롯 비율 (평균)
+    registered_ratio: float = 0.3  # 회원 참가자 비율
+    final_ratio: float = 0.2  # 최종 시간이 확정된 이벤트 비율
+    seed: int = 42
+    batch_size: int = 5000
+    events_per_chunk: int = 200
+
+
+def _copy_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _allocate_ids(model, objs):
+    """PostgreSQL 시퀀스에서 id를 미리 받아 할당 (COPY는 생성된 id를 돌려주지 않음)"""
+    table = model._meta.db_table
+    pk_column = model._meta.pk.column
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+            [table, pk_column, len(objs)]
+        )
+        for obj, (pk,) in zip(objs, cursor.fetchall()):
+            obj.pk = pk
+
+
+def _copy(model, objs):
+    fields = model._meta.concrete_fields
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+
+    buffer = io.StringIO()
+    for obj in objs:
+        buffer.write('\t'.join(_copy_value(getattr(obj, field.attname)) for field in fields))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN",
+            buffer
+        )
+
+
+def write(model, objs, batch_size):
+    """
+    객체 목록을 배치 저장 (저장 후 obj.pk 사용 가능)
+    """
+    if not objs:
+        return
+
+    if connection.vendor == 'postgresql':
+        for index in range(0, len(objs), batch_size):
+            batch = objs[index:index + batch_size]
+            _allocate_ids(model, batch)
+            _copy(model, batch)
+    else:
+        model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+class SyntheticDataGenerator:
+    """
+    이벤트 단위 청크로 합성 데이터 생성 (청크마다 트랜잭션 커밋, 메모리 사용량 일정)
+    """
+
+    def __init__(self, config, progress=None):
+        self.config = config
+        self.progress = progress or (lambda message: None)
+        self.rng = random.Random(config.seed)
+        self.counts = {'users': 0, 'events': 0, 'time_slots': 0, 'participants': 0, 'availabilities': 0, 'final_choices': 0}
+
+    def run(self):
+        factory.random.reseed_random(self.config.seed)
+
+        users = self.generate_users()
+
+        for start in range(0, self.config.events, self.config.events_per_chunk):
+            size = min(self.config.events_per_chunk, self.config.events - start)
+            with transaction.atomic():
+                self.generate_chunk(start, size, users)
+            self.progress(f"이벤트 {start + size}/{self.config.events}, 가능 시간 {self.counts['availabilities']}건")
+
+        return self.counts
+
+    def generate_users(self):
+        config = self.config
+        users = [
+            UserFactory.build(email=f'{EMAIL_PREFIX}{config.seed}-{index}@{EMAIL_DOMAIN}')
+            for index in range(config.users)
+        ]
+        with transaction.atomic():
+            write(User, users, config.batch_size)
+        self.counts['users'] = len(users)
+        self.progress(f'사용자 {len(users)}명')
+        return users
+
+    def generate_chunk(self, start, size, users):
+        config = self.config
+        rng = self.rng
+
+        events = [
+            EventFactory.build(
+                slug=f'{SLUG_PREFIX}{config.seed}-{start + index}',
+                created_by=rng.choice(users),
+                days=rng.randint(1, config.max_days),
+                hours=rng.randint(2, config.max_hours),
+            )
+            for index in range(size)
+        ]
+        write(Event, events, config.batch_size)
+
+        slots_by_event = {}
+        time_slots = []
+        for event in events:
+            event_slots = [
+                TimeSlot(event=event, start_datetime=start_datetime, end_datetime=end_datetime)
+                for start_datetime, end_datetime in iter_slot_ranges(event)
+            ]
+            slots_by_event[event.pk] = event_slots
+            time_slots.extend(event_slots)
+        write(TimeSlot, time_slots, config.batch_size)
+
+        participants = []
+        for event in events:
+            count = rng.randint(max(1, config.participants // 2), max(1, config.participants * 3 // 2))
+            for index in range(count):
+                user = rng.choice(users) if rng.random() < config.registered_ratio else None
+                participants.append(ParticipantFactory.build(
+                    event=event,
+                    user=user,
+                    nickname=f'참가자{index + 1}',
+                ))
+        write(Participant, participants, config.batch_size)
+
+        availabilities = []
+        for participant in participants:
+            event_slots = slots_by_event[participant.event.pk]
+            fill = min(1.0, max(0.0, rng.gauss(config.fill, config.fill / 3)))
+            for slot in rng.sample(event_slots, round(len(event_slots) * fill)):
+                availabilities.append(ParticipantAvailability(
+                    participant=participant,
+                    time_slot=slot,
+                    event=participant.event,
+                    is_available=True,
+                    created_at=participant.created_at,
+                ))
+
+            if len(availabilities) >= config.batch_size:
+                write(ParticipantAvailability, availabilities, config.batch_size)
+                self.counts['availabilities'] += len(availabilities)
+                availabilities = []
+        write(ParticipantAvailability, availabilities, config.batch_size)
+        self.counts['availabilities'] += len(availabilities)
+
+        final_choices = [
+            FinalChoice(
+                event=event,
+                slot=rng.choice(slots_by_event[event.pk]),
+                chosen_by=event.created_by,
+                created_at=event.created_at + timedelta(days=1),
+            )
+            for event in events
+            if rng.random() < config.final_ratio
+        ]
+        write(FinalChoice, final_choices, config.batch_size)
+
+        self.counts['events'] += len(events)
+        self.counts['time_slots'] += len(time_slots)
+        self.counts['participants'] += len(participants)
+        self.counts['final_choices'] += len(final_choices)
+
+
+def synthetic_users(seed=None):
+    prefix = EMAIL_PREFIX if seed is None else f'{EMAIL_PREFIX}{seed}-'
+    return User.objects.filter(email__startswith=prefix, email__endswith=f'@{EMAIL_DOMAIN}')
+
+
+def synthetic_events(seed=None):
+    prefix = SLUG_PREFIX if seed is None else f'{SLUG_PREFIX}{seed}-'
+    return Event.objects.filter(slug__startswith=prefix, created_by__in=synthetic_users(seed))
+
+
+def clear_synthetic_data(chunk_size=5000):
+    """
+    생성한 합성 데이터 삭제 (합성 사용자가 만든 합성 슬러그 이벤트만, 하위 테이블부터 청크 단위로 삭제)
+
+    보관 처리된 합성 이벤트(ArchivedEvent)도 함께 지웁니다.
+    created_by가 SET_NULL이라 사용자를 지우기 전에 먼저 삭제합니다.
+
+    Returns:
+        dict: 테이블별 삭제 건수
+    """
+    event_ids = list(synthetic_events().values_list('id', flat=True))
+    deleted = {}
+
+    # IN 목록이 너무 길어지지 않도록 이벤트 묶음 단위로 삭제
+    for start in range(0, len(event_ids), 500):
+        for table, count in purge_events(event_ids[start:start + 500], chunk_size).items():
+            deleted[table] = deleted.get(table, 0) + count
+
+    deleted['archived_events'] = delete_in_chunks(
+        ArchivedEvent.objects.filter(slug__startswith=SLUG_PREFIX, created_by__in=synthetic_users()), chunk_size
+    )
+    deleted['users'] = delete_in_chunks(synthetic_users(), chunk_size)
+
+    return deleted
@@ -1,11 +1,39 @@
 from celery import shared_task
-from django.core.mail import send_mail
 from django.conf import settings
+from apps.monitoring.metrics import send_mail
 from .models import Event, FinalChoice
 import pytz
 from datetime import datetime, timedelta
 
 
+@shared_task
+def generate_share_assets(event_id):
+    """
+    이벤트 생성 직후 공유 정보(카카오톡 템플릿, 이메일 문구)와 QR 이미지를 미리 생성하는 Celery task
+    """
+    from .share_utils import generate_share_assets as build_assets
+
+    try:
+        event = Event.objects.get(id=event_id, is_deleted=False)
+        rendered = build_assets(event)
+        return {
+            'success': True,
+            'rendered_qr_count': rendered,
+            'message': '공유 정보를 생성했습니다.'
+        }
+
+    except Event.DoesNotExist:
+        return {
+            'success': False,
+            'message': '이벤트를 찾을 수 없습니다.'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'공유 정보 생성 중 오류가 발생했습니다: {str(e)}'
+        }
+
+
 @shared_task
 def send_final_choice_email(event_id):
     # 확정된 시간을 참가자들에게 이메일로 발송하는 Celery task
@@ -245,6 +273,7 @@ def send_final_choice_sms(event_id):
                 'success': True,
                 'sent_count': result['success_count'],
                 'fail_count': result['fail_count'],
+                'unknown_count': result.get('unknown_count', 0),  # 응답 타임아웃으로 발송 여부 불명
                 'message': f"{result['success_count']}명에게 SMS를 발송했습니다."
             }
         else:
@@ -360,3 +389,23 @@ def schedule_reminder_sms(event_id):
         # 스케줄링 실패 시 무시
         pass
 
+
+
+@shared_task
+def archive_events():
+    # 삭제/기간 만료 이벤트를 스냅샷으로 보관하고 원본 행을 청크 단위로 삭제하는 Celery task
+    from .archive import archive_events as run_archive
+
+    try:
+        result = run_archive(limit=getattr(settings, 'ARCHIVE_MAX_EVENTS_PER_RUN', 5000))
+        return {
+            'success': True,
+            'archived_count': result['archived'],
+            'deleted': result['deleted'],
+            'message': f"{result['archived']}개의 이벤트를 보관했습니다."
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'이벤트 보관 중 오류가 발생했습니다: {str(e)}'
+        }
@@ -1,3 +1,804 @@
-from django.test import TestCase
+import gzip
+import hashlib
+import hmac
+import io
+import json
+import re
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+from xml.etree import ElementTree
+import pytz
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+try:
+    import brotli
+except ImportError:
+    brotli = None
+import requests
+from django.core import signing
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from config.parsers import FastJSONParser
+from config.renderers import FastJSONRenderer
+from apps.accounts.factories import UserFactory
+from apps.accounts.models import User
+from apps.participants.factories import ParticipantFactory
+from apps.participants.models import ParticipantAvailability
+from .archive import archive_events, build_snapshots, purge_events
+from .benchmark import Scale, run_benchmarks, seed_event
+from .factories import EventFactory, FinalChoiceFactory
+from .ics_utils import (
+    CALENDAR_FEED_SALT, ICS_LINE_LIMIT, escape_text, fold_line, make_feed_token, read_feed_token, vevent_cache_key,
+)
+from .models import Event, TimeSlot, FinalChoice, ArchivedEvent
+from .qr_utils import build_qr, get_cached_qr, get_share_url, qr_etag
+from .serializers import (
+    EventDetailSerializer, EventSerializer, EventSummarySerializer, FinalChoiceSerializer, SlotSummarySerializer,
+    SlotSummaryWithAllAvailableSerializer, with_available_count,
+)
+from .share_utils import SHARE_QR_VARIANTS
+from .slot_format import SlotFormatter
+from .tasks import generate_share_assets
+from .sms_utils import SOLAPI_SEND_MANY_URL, SolapiSigner, get_solapi_signer, send_sms_batch
+from .synthetic import SyntheticConfig, SyntheticDataGenerator, clear_synthetic_data, synthetic_events
+from .slot_grid import get_slot_grid, slot_grid_cache_key
+from .slot_rows import SlotSummaryRow, SlotSummaryWithAllAvailableRow, slot_rows
 
-# Create your tests here.
+# 규모가 달라도 쿼리 수가 같아야 하는 엔드포인트 (슬롯 수/참가자 수에 비례하면 N+1)
+SMALL = Scale(days=1, start_hour=9, end_hour=11, participants=2, fill=0.5, seed=1)
+LARGE = Scale(days=5, start_hour=9, end_hour=21, participants=12, fill=0.5, seed=2)
+
+
+class QueryCountTestCase(TestCase):
+    """엔드포인트별 DB 쿼리 수 상한 검사"""
+
+    def count_queries(self, request):
+        with CaptureQueriesContext(connection) as queries:
+            response = request()
+        self.assertEqual(response.status_code, 200, getattr(response, 'data', response))
+        return len(queries)
+
+    def assertConstantQueries(self, make_request, max_queries):
+        """
+        작은 이벤트와 큰 이벤트에서 쿼리 수가 같고 max_queries 이하인지 확인
+
+        Args:
+            make_request: (client, user, event, participants, slot_ids) -> response
+        """
+        counts = []
+        for scale in (SMALL, LARGE):
+            user, event, participants, slot_ids = seed_event(scale)
+            client = APIClient()
+            counts.append(self.count_queries(lambda: make_request(client, user, event, participants, slot_ids)))
+
+        self.assertEqual(counts[0], counts[1], f'규모에 따라 쿼리 수가 증가합니다: {counts}')
+        self.assertLessEqual(counts[1], max_queries)
+
+
+class EventQueryCountTests(QueryCountTestCase):
+
+    def test_create_time_slots(self):
+        # 슬롯 수와 관계없이 한 번의 INSERT로 생성
+        for days in (1, 5):
+            event = EventFactory(days=days, hours=8)
+            with self.assertNumQueries(1):
+                count = EventSerializer().create_time_slots(event)
+            self.assertEqual(count, days * 16)
+            self.assertEqual(event.time_slots.count(), count)
+
+    def test_event_detail(self):
+        self.assertConstantQueries(
+            lambda client, user, event, *_: client.get(f'/api/v1/events/{event.slug}/'),
+            max_queries=4,
+        )
+
+    def test_event_summary(self):
+        self.assertConstantQueries(
+            lambda client, user, event, *_: client.get(f'/api/v1/events/{event.id}/summary/'),
+            max_queries=3,
+        )
+
+    def test_recommend_time(self):
+        self.assertConstantQueries(
+            lambda client, user, event, *_: client.get(f'/api/v1/events/{event.id}/recommend-time'),
+            max_queries=4,
+        )
+
+    def test_dashboard(self):
+        def request(client, user, event, *_):
+            client.force_authenticate(user=user)
+            return client.get(f'/api/v1/events/{event.id}/dashboard')
+
+        self.assertConstantQueries(request, max_queries=5)
+
+
+class ArchiveTests(TestCase):
+
+    def test_archive_deleted_event(self):
+        user, event, participants, slot_ids = seed_event(SMALL)
+        FinalChoice.objects.create(event=event, slot_id=slot_ids[1], chosen_by=user)
+        Event.objects.filter(pk=event.pk).update(is_deleted=True, updated_at=timezone.now() - timedelta(days=30))
+        _, active_event, *_ = seed_event(Scale(days=1, participants=1, seed=3))
+
+        expected = {
+            participant.nickname: sorted(
+                slot_ids.index(slot_id)
+                for slot_id in participant.availabilities.values_list('time_slot_id', flat=True)
+            )
+            for participant in participants
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            result = archive_events(batch_size=1, chunk_size=2)
+
+        # 가능 시간 청크 삭제는 event_id 조건을 포함해 해당 파티션만 조회
+        deletes = [
+            q['sql'] for q in queries
+            if q['sql'].startswith('DELETE FROM "participant_availabilities"') and '"participant_availabilities"."id" IN' in q['sql']
+        ]
+        self.assertTrue(deletes)
+        self.assertTrue(all('"event_id" IN' in sql for sql in deletes), deletes)
+
+        self.assertEqual(result['archived'], 1)
+        archived = ArchivedEvent.objects.get(event_id=event.pk)
+        self.assertEqual(archived.reason, ArchivedEvent.REASON_DELETED)
+        self.assertEqual(len(archived.data['slots']), len(slot_ids))
+        self.assertEqual({p['nickname']: p['available'] for p in archived.data['participants']}, expected)
+        self.assertEqual(archived.data['final_choice']['slot'], 1)
+
+        self.assertFalse(Event.objects.filter(pk=event.pk).exists())
+        self.assertFalse(ParticipantAvailability.objects.filter(event_id=event.pk).exists())
+        self.assertFalse(TimeSlot.objects.filter(event_id=event.pk).exists())
+        self.assertTrue(Event.objects.filter(pk=active_event.pk).exists())
+
+    def test_archive_expired_event_keeps_final_choice(self):
+        user, expired, _, _ = seed_event(SMALL)
+        _, finalized, _, slot_ids = seed_event(Scale(days=1, participants=1, seed=3))
+        FinalChoice.objects.create(event=finalized, slot_id=slot_ids[0], chosen_by=finalized.created_by)
+        long_ago = timezone.localdate() - timedelta(days=400)
+        Event.objects.filter(pk__in=[expired.pk, finalized.pk]).update(date_start=long_ago, date_end=long_ago)
+
+        # 삭제 시그널로 슬롯 그리드 캐시가 무효화되는지 확인
+        get_slot_grid(expired)
+        self.assertIsNotNone(cache.get(slot_grid_cache_key(expired.pk)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = archive_events()
+
+        self.assertEqual(result['archived'], 1)
+        self.assertEqual(result['deleted']['events'], 1)
+        self.assertEqual(result['deleted']['time_slots'], ArchivedEvent.objects.get().slot_count)
+        self.assertEqual(ArchivedEvent.objects.get().reason, ArchivedEvent.REASON_EXPIRED)
+        self.assertFalse(Event.objects.filter(pk=expired.pk).exists())
+        self.assertIsNone(cache.get(slot_grid_cache_key(expired.pk)))
+        # 확정된 이벤트는 캘린더 구독 피드에 남도록 보관하지 않음
+        self.assertTrue(Event.objects.filter(pk=finalized.pk).exists())
+
+
+class SyntheticDataTests(TestCase):
+    """합성 데이터 생성/정리 검사"""
+
+    def test_clear_only_synthetic_rows(self):
+        config = SyntheticConfig(users=3, events=4, max_days=1, max_hours=2, participants=2, seed=7, events_per_chunk=2)
+        counts = SyntheticDataGenerator(config).run()
+        self.assertEqual(synthetic_events(7).count(), counts['events'])
+
+        # 보관 처리된 합성 이벤트
+        archived = synthetic_events(7).first()
+        ArchivedEvent.objects.bulk_create(build_snapshots([archived.id]).values())
+        purge_events([archived.id], chunk_size=100)
+
+        # 합성 데이터와 같은 슬러그/이메일 형식을 쓰는 실제 데이터
+        real_user = UserFactory(email='synthetic7-99@example.com')
+        real_event = EventFactory(slug='synthetic-7-99', created_by=real_user)
+        real_archive = ArchivedEvent.objects.create(
+            event_id=real_event.id + 1000, slug='synthetic-7-100', title='실제', created_by=real_user,
+            reason=ArchivedEvent.REASON_DELETED, event_created_at=timezone.now(), data={},
+        )
+
+        deleted = clear_synthetic_data(chunk_size=3)
+
+        self.assertEqual(deleted['events'], 3)
+        self.assertEqual(deleted['archived_events'], 1)
+        self.assertEqual(deleted['users'], 3)
+        self.assertEqual(list(Event.objects.values_list('id', flat=True)), [real_event.id])
+        self.assertEqual(list(User.objects.values_list('id', flat=True)), [real_user.id])
+        self.assertEqual(list(ArchivedEvent.objects.values_list('id', flat=True)), [real_archive.id])
+        self.assertFalse(TimeSlot.objects.exists())
+
+    def test_command_requires_flag_without_debug(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_synthetic_data', '--clear-only')
+
+        call_command('generate_synthetic_data', '--clear-only', '--allow-production', stdout=io.StringIO())
+
+
+class MyEventListQueryCountTests(TestCase):
+
+    def test_my_event_list(self):
+        user = UserFactory()
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        counts = []
+        for events in (1, 20):
+            for event in EventFactory.create_batch(events, created_by=user):
+                ParticipantFactory.create_batch(3, event=event)
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get('/api/v1/events/my/?size=100')
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(all(item['participant_count'] == 3 for item in response.data['items']))
+            counts.append(len(queries))
+
+        self.assertEqual(counts[0], counts[1], f'이벤트 수에 따라 쿼리 수가 증가합니다: {counts}')
+
+
+class SlotFormatterTests(TestCase):
+
+    def test_matches_pytz_conversion(self):
+        # 서머타임 전환(2026-03-08)을 포함한 구간
+        formatter = SlotFormatter('America/New_York')
+        tz = pytz.timezone('America/New_York')
+        start = datetime(2026, 3, 7, 12, 0, tzinfo=dt_timezone.utc)
+
+        for index in range(96):
+            value = start + timedelta(minutes=30 * index)
+            local_dt = value.astimezone(tz)
+            expected = (local_dt.strftime('%Y-%m-%d'), local_dt.strftime('%H:%M'), local_dt.isoformat())
+            self.assertEqual(formatter.local(value), expected)
+            self.assertEqual(formatter.local(value), expected)  # 메모이제이션된 값
+
+
+class SlotRowParityTests(TestCase):
+    """경량 행 빌더가 기존 Serializer와 같은 응답(필드 순서 포함)을 만드는지 검사"""
+
+    def setUp(self):
+        _, self.event, participants, _ = seed_event(Scale(days=2, participants=6, fill=0.6, seed=8))
+        self.total_participants = len(participants)
+        self.time_slots = with_available_count(self.event)
+
+    def assertSameRows(self, rows, expected):
+        self.assertEqual([list(row.items()) for row in rows], [list(row.items()) for row in expected])
+
+    def test_slot_summary_row(self):
+        expected = SlotSummarySerializer(
+            self.time_slots, many=True, context={'total_participants': self.total_participants}
+        ).data
+        build = SlotSummaryRow(self.event, self.total_participants)
+        self.assertSameRows([build(row) for row in slot_rows(self.time_slots)], expected)
+        self.assertSameRows(EventDetailSerializer(self.event).data['slots'], expected)
+
+    def test_slot_summary_with_all_available_row(self):
+        expected = SlotSummaryWithAllAvailableSerializer(
+            self.time_slots, many=True, context={'total_participants': self.total_participants}
+        ).data
+        build = SlotSummaryWithAllAvailableRow(self.event, self.total_participants)
+        self.assertSameRows([build(row) for row in slot_rows(self.time_slots)], expected)
+
+        summary = EventSummarySerializer(self.event, context={'min_participants': 0}).data
+        self.assertSameRows(summary['slots'], expected)
+        self.assertSameRows(summary['best_slots'], sorted(expected, key=lambda s: s['available_count'], reverse=True))
+
+
+class FastJSONRendererTests(TestCase):
+    """orjson 렌더러/파서가 DRF 기본 JSONRenderer/JSONParser와 같은 결과를 내는지 검사"""
+
+    DATA = {
+        'title': '피자 모임 🍕',
+        'separator': 'a\u2028b\u2029c',
+        'price': Decimal('12.50'),
+        'utc': datetime(2026, 3, 8, 6, 30, 0, 123456, tzinfo=dt_timezone.utc),
+        'local': pytz.timezone('Asia/Seoul').localize(datetime(2026, 3, 8, 15, 30)),
+        'date': date(2026, 3, 8),
+        'time': time(9, 30, 0, 123456),
+        'counts': {1: 2, 3: 4},
+        'nested': [{'nickname': '참가자1', 'rate': 33.3, 'ok': True, 'none': None}],
+    }
+
+    def test_render_matches_stdlib(self):
+        self.assertEqual(FastJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA))
+        self.assertEqual(
+            FastJSONRenderer().render(self.DATA, 'application/json; indent=4'),
+            JSONRenderer().render(self.DATA, 'application/json; indent=4'),
+        )
+
+    def test_render_without_orjson(self):
+        with mock.patch('config.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA))
+
+    def test_parse(self):
+        body = '{"nickname": "참가자", "available_slot_ids": [1, 2, 3]}'.encode()
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
+
+
+class BenchmarkTests(TestCase):
+    """벤치마크 시나리오 실행 검사"""
+
+    @override_settings(STREAMING_JSON_MIN_ITEMS=1)
+    def test_streaming_dashboard(self):
+        # 대시보드가 스트리밍 응답을 반환하는 규모에서도 모든 시나리오가 실행되어야 함
+        results = run_benchmarks(Scale(days=1, participants=3, seed=11), iterations=1, warmup=0)
+
+        self.assertEqual(set(results), {
+            'create_time_slots', 'submit_availability', 'event_summary', 'recommend_time',
+            'dashboard', 'render_dashboard_stdlib', 'render_dashboard_fast',
+        })
+        self.assertFalse(Event.objects.exists())
+
+
+class DashboardResponseTests(TestCase):
+    """대시보드 응답 압축/스트리밍 검사"""
+
+    def setUp(self):
+        self.user, self.event, *_ = seed_event(Scale(days=2, participants=6, fill=0.6, seed=9))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = f'/api/v1/events/{self.event.id}/dashboard'
+
+    def test_gzip(self):
+        plain = self.client.get(self.url)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.content)), plain.json())
+
+    def test_gzip_refused(self):
+        # gzip;q=0, identity만 허용하면 압축하지 않음 (GZipMiddleware는 "gzip" 문자열만 보고 압축함)
+        for header in ('gzip;q=0', 'identity', 'gzip;q=0, identity', '*;q=0, identity'):
+            response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=header)
+            self.assertFalse(response.has_header('Content-Encoding'), header)
+            self.assertIn('Accept-Encoding', response['Vary'])
+
+        if brotli is None:
+            return
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip;q=0, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+
+    @skipUnless(brotli, 'Brotli 미설치')
+    def test_brotli(self):
+        expected = self.client.get(self.url).json()
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(brotli.decompress(response.content)), expected)
+
+        with override_settings(STREAMING_JSON_MIN_ITEMS=1):
+            response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(brotli.decompress(b''.join(response.streaming_content))), expected)
+
+    def test_compressed_qr_revalidates(self):
+        # 압축 응답의 약한 ETag(W/"...")로 재요청해도 304
+        url = f'/api/v1/events/{self.event.id}/qr-code?format=svg'
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].startswith('W/'))
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(COMPRESSION_MIN_SIZE=10 ** 9)
+    def test_small_response_not_compressed(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streaming_matches_normal_response(self):
+        expected = self.client.get(self.url).json()
+
+        with override_settings(STREAMING_JSON_MIN_ITEMS=1):
+            response = self.client.get(self.url)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), expected)
+
+    def test_compact_heatmap(self):
+        full = self.client.get(self.url).json()
+        response = self.client.get(self.url, {'format': 'compact'})
+        self.assertEqual(response.status_code, 200)
+        compact = response.json()
+
+        participants = compact['participants']
+        for compact_slot, full_slot in zip(compact['heatmap'], full['heatmap'], strict=True):
+            indexes = compact_slot.pop('available_participant_indexes')
+            expected = full_slot.pop('available_participants')
+            self.assertEqual(
+                [{'participant_id': participants[i]['participant_id'], 'nickname': participants[i]['nickname']} for i in indexes],
+                expected,
+            )
+            self.assertEqual(compact_slot, full_slot)
+        self.assertLess(len(response.content), len(self.client.get(self.url).content))
+
+        self.assertEqual(self.client.get(self.url, {'format': 'xml'}).status_code, 400)
+
+
+class QRCodeTests(TestCase):
+    """QR 코드 캐시/ETag/SVG 렌더링 검사"""
+
+    def setUp(self):
+        cache.clear()
+        self.event = EventFactory()
+        self.url = f'/api/v1/events/{self.event.id}/qr-code'
+        self.client = APIClient()
+
+    def test_png_cached_and_revalidated(self):
+        response = self.client.get(self.url, {'size': 100})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertTrue(response.content.startswith(b'\x89PNG'))
+        # 크기는 허용 범위(5~30)로 제한
+        self.assertEqual(response['ETag'], qr_etag(self.event.slug, 30, 'png'))
+
+        with mock.patch('apps.events.qr_utils.render_png') as render_png:
+            cached = self.client.get(self.url, {'size': 30})
+            not_modified = self.client.get(self.url, {'size': 30}, HTTP_IF_NONE_MATCH=response['ETag'])
+        render_png.assert_not_called()
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+
+        # 다른 크기는 다른 이미지
+        other = self.client.get(self.url, {'size': 5}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(other.status_code, 200)
+
+    def test_svg(self):
+        response = self.client.get(self.url, {'format': 'svg', 'size': 8})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        body = b''.join(response.streaming_content)
+
+        # 스트리밍이 끝나면 캐시에 저장되어 다음 요청은 같은 본문을 바로 반환
+        cached = self.client.get(self.url, {'format': 'svg', 'size': 8})
+        self.assertFalse(cached.streaming)
+        self.assertEqual(cached.content, body)
+
+        # path의 사각형(M x y h w ...)이 QR 매트릭스의 검은 모듈과 정확히 일치
+        root = ElementTree.fromstring(body)
+        matrix = build_qr(get_share_url(self.event.slug), 8).get_matrix()
+        self.assertEqual(root.get('width'), str(len(matrix) * 8))
+        dark = set()
+        for x, y, width in re.findall(r'M(\d+) (\d+)h(\d+)', root.find('{http://www.w3.org/2000/svg}path').get('d')):
+            dark.update((int(x) + offset, int(y)) for offset in range(int(width)))
+        self.assertEqual(dark, {(x, y) for y, row in enumerate(matrix) for x, value in enumerate(row) if value})
+
+    def test_share_url_change_rerenders(self):
+        with override_settings(FRONTEND_URL='https://old.example.com'):
+            old = self.client.get(self.url, {'format': 'svg', 'size': 8})
+            old_body = b''.join(old.streaming_content)
+            self.assertIsNotNone(get_cached_qr(self.event.slug, 8, 'svg'))
+
+        with override_settings(FRONTEND_URL='https://new.example.com'):
+            self.assertIsNone(get_cached_qr(self.event.slug, 8, 'svg'))
+            response = self.client.get(self.url, {'format': 'svg', 'size': 8})
+            self.assertTrue(response.streaming)
+            self.assertNotEqual(b''.join(response.streaming_content), old_body)
+            self.assertNotEqual(response['ETag'], old['ETag'])
+
+    def test_invalid_format(self):
+        response = self.client.get(self.url, {'format': 'gif'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+
+class ShareAssetsTests(TestCase):
+    """이벤트 공유 정보/QR 이미지 미리 생성 검사"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def create_event(self):
+        return self.client.post('/api/v1/events/', {
+            'title': '회의', 'description': '',
+            'date_start': '2030-01-01', 'date_end': '2030-01-01',
+            'time_start': '09:00', 'time_end': '10:00',
+        }, format='json')
+
+    def test_create_schedules_assets_after_commit(self):
+        with mock.patch('apps.events.views.generate_share_assets.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.create_event()
+
+        self.assertEqual(response.status_code, 201, response.data)
+        delay.assert_called_once_with(response.data['id'])
+
+    def test_schedule_failure_ignored(self):
+        with mock.patch('apps.events.views.generate_share_assets.delay', side_effect=ConnectionError('broker down')):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.create_event()
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_generate_share_assets(self):
+        event = EventFactory(created_by=self.user)
+
+        result = generate_share_assets(event.id)
+        self.assertEqual(result['rendered_qr_count'], len(SHARE_QR_VARIANTS))
+        for size, image_format in SHARE_QR_VARIANTS:
+            self.assertIsNotNone(get_cached_qr(event.slug, size, image_format))
+
+        # 이미 생성된 이미지는 다시 렌더링하지 않음
+        self.assertEqual(generate_share_assets(event.id)['rendered_qr_count'], 0)
+        self.assertFalse(generate_share_assets(event.id + 1000)['success'])
+
+    def test_share_info_uses_stored_bundle(self):
+        event = EventFactory(created_by=self.user, title='처음 제목')
+        generate_share_assets(event.id)
+        url = f'/api/v1/events/{event.id}/share-info'
+
+        with mock.patch('apps.events.share_utils.build_share_bundle') as build:
+            response = self.client.get(url)
+        build.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email_subject'], '[일정 조율 초대] 처음 제목')
+        self.assertTrue(response.data['qr_code_url'].endswith(f'/api/v1/events/{event.id}/qr-code'))
+
+        # 이벤트를 수정하면 updated_at이 바뀌어 새 공유 정보 사용
+        event.title = '바뀐 제목'
+        event.save()
+        self.assertEqual(self.client.get(url).data['email_subject'], '[일정 조율 초대] 바뀐 제목')
+
+
+class SlotGridTests(TestCase):
+    """슬롯 그리드 캐시와 이를 사용하는 슬롯 검증 검사"""
+
+    def setUp(self):
+        self.user, self.event, self.participants, self.slot_ids = seed_event(SMALL)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_grid_matches_time_slots(self):
+        slots = list(self.event.time_slots.order_by('start_datetime'))
+        grid = get_slot_grid(self.event)
+
+        with self.assertNumQueries(0):
+            grid = get_slot_grid(self.event)
+        self.assertEqual(len(grid), len(slots))
+        for ordinal, slot in enumerate(slots):
+            self.assertEqual(grid.ordinal(slot.id), ordinal)
+            self.assertEqual(grid.bounds(slot.id), (slot.start_datetime, slot.end_datetime))
+        self.assertIsNone(grid.ordinal(-1))
+
+    def test_grid_invalidated_on_slot_changes(self):
+        get_slot_grid(self.event)
+        removed = TimeSlot.objects.get(id=self.slot_ids[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            removed.delete()
+        self.assertNotIn(removed.id, get_slot_grid(self.event))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            added = TimeSlot.objects.create(
+                event=self.event, start_datetime=removed.start_datetime, end_datetime=removed.end_datetime
+            )
+        self.assertEqual(get_slot_grid(self.event).ordinal(added.id), 0)
+
+        # 쿼리셋 일괄 삭제는 이벤트별로 한 번만 예약
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            TimeSlot.objects.filter(event=self.event).delete()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(get_slot_grid(self.event)), 0)
+
+    def test_final_choice_validation_uses_grid(self):
+        _, other_event, *_ = seed_event(Scale(days=1, participants=1, seed=3))
+        other_slot_id = other_event.time_slots.values_list('id', flat=True).first()
+
+        def validate(slot_id):
+            serializer = FinalChoiceSerializer(data={'slot_id': slot_id}, context={'event': self.event})
+            return serializer.is_valid(), serializer
+
+        self.assertFalse(validate(other_slot_id)[0])
+        self.assertFalse(validate(-1)[0])
+
+        with self.assertNumQueries(0):
+            is_valid, serializer = validate(self.slot_ids[1])
+        self.assertTrue(is_valid)
+        slot = serializer.validated_data['slot']
+        expected = TimeSlot.objects.get(id=self.slot_ids[1])
+        self.assertEqual(
+            (slot.id, slot.event_id, slot.start_datetime, slot.end_datetime),
+            (expected.id, expected.event_id, expected.start_datetime, expected.end_datetime),
+        )
+
+        response = self.client.post(f'/api/v1/events/{self.event.id}/final-choice', {'slot_id': slot.id}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['slot_id'], slot.id)
+
+
+class SolapiSignerTests(TestCase):
+    """Solapi 인증 헤더 서명기 검사"""
+
+    def parse(self, headers):
+        return dict(re.findall(r'(\w+)=([^,\s]+)', headers['Authorization']))
+
+    def test_signature(self):
+        signer = SolapiSigner('key', 'secret')
+        first, second = signer.headers(), signer.headers()
+        fields = self.parse(first)
+
+        expected = hmac.new(b'secret', (fields['date'] + fields['salt']).encode(), hashlib.sha256).hexdigest()
+        self.assertEqual(fields['apiKey'], 'key')
+        self.assertEqual(fields['signature'], expected)
+        # 같은 서명기로도 요청마다 새 salt로 서명
+        self.assertNotEqual(self.parse(second)['salt'], fields['salt'])
+        self.assertEqual(signer.stats['signatures'], 2)
+
+    def test_get_solapi_signer(self):
+        with override_settings(SOLAPI_API_KEY='', SOLAPI_API_SECRET=''):
+            self.assertIsNone(get_solapi_signer())
+
+        with override_settings(SOLAPI_API_KEY='key', SOLAPI_API_SECRET='secret'):
+            signer = get_solapi_signer()
+            self.assertIs(get_solapi_signer(), signer)
+
+        # 설정이 바뀌면 새 서명기
+        with override_settings(SOLAPI_API_KEY='key', SOLAPI_API_SECRET='rotated'):
+            self.assertIsNot(get_solapi_signer(), signer)
+
+
+@override_settings(
+    SOLAPI_API_KEY='key', SOLAPI_API_SECRET='secret', SOLAPI_SENDER_NUMBER='0212345678',
+    SOLAPI_BATCH_SIZE=2, SOLAPI_RATE_LIMIT=0, SOLAPI_RETRY_BACKOFF=0, SOLAPI_MAX_RETRIES=2, SOLAPI_MAX_CONCURRENCY=1,
+)
+class SmsBatchTests(TestCase):
+    """Solapi 일괄 발송: 청크 분할, 재시도 정책, 메시지 단위 실패 매핑"""
+
+    PHONES = ['010-0000-0001', '010-0000-0002', '010-0000-0003', '010-0000-0004', '010-0000-0005']
+
+    def send(self, *responses, phones=PHONES):
+        """responses: 호출 순서대로 반환할 응답(dict: 200 JSON, int: 상태 코드) 또는 발생시킬 예외"""
+        calls = []
+        queue = list(responses)
+
+        def post(provider, operation, url, json=None, **kwargs):
+            calls.append([message['to'] for message in json['messages']])
+            outcome = queue.pop(0) if queue else {}
+            if isinstance(outcome, Exception):
+                raise outcome
+            status_code = outcome if isinstance(outcome, int) else 200
+            return mock.Mock(status_code=status_code, json=lambda: outcome if isinstance(outcome, dict) else {})
+
+        with mock.patch('apps.events.sms_utils.instrumented_post', side_effect=post):
+            result = send_sms_batch(phones, '확정 안내')
+        return result, calls
+
+    @override_settings(SOLAPI_MAX_CONCURRENCY=3)
+    def test_parallel_chunks_signed_separately(self):
+        salts = []
+
+        def post(provider, operation, url, headers=None, json=None, **kwargs):
+            salts.append(re.search(r'salt=([^,\s]+)', headers['Authorization']).group(1))
+            return mock.Mock(status_code=200, json=lambda: {})
+
+        with mock.patch('apps.events.sms_utils.instrumented_post', side_effect=post):
+            result = send_sms_batch(self.PHONES, '확정 안내')
+
+        self.assertEqual(result['success_count'], 5)
+        # Solapi는 같은 salt의 재사용을 거부하므로 병렬 청크도 각각 다른 서명
+        self.assertEqual(len(salts), 3)
+        self.assertEqual(len(set(salts)), 3)
+
+    def test_chunks(self):
+        result, calls = self.send()
+        self.assertEqual([len(chunk) for chunk in calls], [2, 2, 1])
+        self.assertEqual(result['success_count'], 5)
+        self.assertEqual([item['phone'] for item in result['results']], self.PHONES)
+
+    def test_retries_server_error_and_connect_error(self):
+        connect_error = requests.exceptions.ConnectionError(
+            MaxRetryError(None, SOLAPI_SEND_MANY_URL, reason=NewConnectionError(None, 'connection refused'))
+        )
+        result, calls = self.send(500, connect_error, 429)
+
+        self.assertEqual(len(calls), 6)  # 청크 3개 + 재시도 3회
+        self.assertEqual(result['success_count'], 5)
+
+    def test_read_timeout_not_retried(self):
+        result, calls = self.send(requests.exceptions.ReadTimeout())
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result['unknown_count'], 2)
+        self.assertEqual([item.get('unknown', False) for item in result['results']], [True, True, False, False, False])
+        self.assertEqual(result['success_count'], 3)
+
+    def test_failed_messages_keyed_by_index(self):
+        result, _ = self.send(
+            {'failedMessageList': [{'to': '01000000001', 'statusMessage': '수신 거부'}]},
+            phones=['010-0000-0001', '010-0000-0001'],
+        )
+
+        self.assertEqual([item['success'] for item in result['results']], [False, True])
+        self.assertEqual(result['fail_count'], 1)
+
+
+class CalendarFeedTests(TestCase):
+    """캘린더 구독 토큰/피드 검사"""
+
+    def setUp(self):
+        self.choice = FinalChoiceFactory()
+        self.user = self.choice.event.created_by
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def feed_path(self, response):
+        return response.json()['feed_url'].split('testserver', 1)[1]
+
+    def test_token(self):
+        token = make_feed_token(self.user)
+        self.assertEqual(read_feed_token(token), (self.user.id, 0))
+        self.assertIsNone(read_feed_token(token + 'x'))
+        # 버전 도입 전 토큰은 버전 0
+        legacy = signing.Signer(salt=CALENDAR_FEED_SALT).sign(str(self.user.id))
+        self.assertEqual(read_feed_token(legacy), (self.user.id, 0))
+
+    def test_feed_conditional_request(self):
+        path = self.feed_path(self.client.get('/api/v1/events/calendar/feed'))
+
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content).decode()
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_regenerate_revokes_old_url(self):
+        old_path = self.feed_path(self.client.get('/api/v1/events/calendar/feed'))
+        legacy = signing.Signer(salt=CALENDAR_FEED_SALT).sign(str(self.user.id))
+
+        response = self.client.post('/api/v1/events/calendar/feed')
+        self.assertEqual(response.status_code, 200)
+        new_path = self.feed_path(response)
+
+        self.assertNotEqual(new_path, old_path)
+        self.assertEqual(self.client.get(old_path).status_code, 404)
+        self.assertEqual(self.client.get(f'/api/v1/events/calendar/feed/{legacy}.ics').status_code, 404)
+        self.assertEqual(self.client.get(new_path).status_code, 200)
+
+    def test_fold_and_escape(self):
+        self.assertEqual(escape_text('a,b;c\\d\ne'), 'a\\,b\\;c\\\\d\\ne')
+
+        line = 'SUMMARY:' + '가나다' * 20
+        folded = fold_line(line)
+        parts = folded.split('\r\n ')
+        self.assertEqual(''.join(parts), line)
+        self.assertTrue(all(len(part.encode('utf-8')) <= ICS_LINE_LIMIT for part in parts))
+
+    def test_feed_updates_after_event_change(self):
+        path = self.feed_path(self.client.get('/api/v1/events/calendar/feed'))
+        first = self.client.get(path)
+        b''.join(first.streaming_content)
+        self.assertIsNotNone(cache.get(vevent_cache_key(self.choice.event_id)))
+
+        event = self.choice.event
+        event.title = '바뀐 제목'
+        event.save()
+        self.assertIsNone(cache.get(vevent_cache_key(event.id)))
+
+        # 이벤트가 바뀌면 이전 ETag로 요청해도 새 본문
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('SUMMARY:바뀐 제목', b''.join(response.streaming_content).decode())
+
+    def test_inactive_user(self):
+        path = self.feed_path(self.client.get('/api/v1/events/calendar/feed'))
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(path).status_code, 404)
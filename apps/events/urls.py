@@ -4,7 +4,7 @@ from .views import (
     EventCreateView, EventDetailView, MyEventListView, EventUpdateView,
     EventSummaryView, FinalChoiceView, SendFinalChoiceEmailView, TimeRecommendationView,
     EventQRCodeView, EventShareInfoView, EventInviteEmailView, EventDashboardView,
-    CalendarExportView, CalendarICSDownloadView
+    CalendarExportView, CalendarICSDownloadView, CalendarFeedURLView, CalendarFeedView
 )
 
 app_name = 'events'
@@ -12,6 +12,8 @@ app_name = 'events'
 urlpatterns = [
     path('', EventCreateView.as_view(), name='event-create'),
     path('my/', MyEventListView.as_view(), name='my-events'),
+    path('calendar/feed', CalendarFeedURLView.as_view(), name='calendar-feed-url'),
+    path('calendar/feed/<str:token>.ics', CalendarFeedView.as_view(), name='calendar-feed'),
     path('<int:pk>/', EventUpdateView.as_view(), name='event-update'),
     path('<int:pk>/summary/', EventSummaryView.as_view(), name='event-summary'),
     path('<int:pk>/final-choice', FinalChoiceView.as_view(), name='final-choice'),
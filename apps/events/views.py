@@ -3,11 +3,15 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.conf import settings
 from .models import Event, FinalChoice, TimeSlot
-from .serializers import EventSerializer, EventDetailSerializer, MyEventListSerializer, EventUpdateSerializer, EventSummarySerializer, FinalChoiceSerializer
+from .serializers import EventSerializer, EventDetailSerializer, MyEventListSerializer, EventUpdateSerializer, EventSummarySerializer, FinalChoiceSerializer, with_participant_count
 from .pagination import EventPagination
-from .tasks import send_final_choice_email, send_final_choice_sms
+from .negotiation import QueryFormatContentNegotiation
+from .slot_format import get_slot_formatter
+from config.streaming import JSONStream, StreamingJSONResponse
+from .tasks import send_final_choice_email, send_final_choice_sms, generate_share_assets
 
 
 class EventCreateView(generics.CreateAPIView):
@@ -19,8 +23,18 @@ class EventCreateView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         event = serializer.save()
 
+        # 공유 정보/QR 이미지 미리 생성 (커밋 후 백그라운드 실행)
+        transaction.on_commit(lambda: self.schedule_share_assets(event.id))
+
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @staticmethod
+    def schedule_share_assets(event_id):
+        try:
+            generate_share_assets.delay(event_id)
+        except Exception:
+            pass  # 스케줄링 실패 시 공유 API에서 처음 요청될 때 생성
+
 
 class EventDetailView(generics.RetrieveAPIView):
     serializer_class = EventDetailSerializer
@@ -41,12 +55,13 @@ class MyEventListView(generics.ListAPIView):
     serializer_class = MyEventListSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = EventPagination
+    stateless_authentication = True  # user_id만 필요하므로 TokenUser 사용 (활성 여부는 캐시로 검사)
 
     def get_queryset(self):
-        return Event.objects.filter(
-            created_by=self.request.user,
+        return with_participant_count(Event.objects.filter(
+            created_by_id=self.request.user.id,
             is_deleted=False
-        ).order_by('-created_at')
+        )).order_by('-created_at')
 
 
 class EventUpdateView(generics.UpdateAPIView, generics.DestroyAPIView):
@@ -132,7 +147,7 @@ class FinalChoiceView(generics.GenericAPIView):
 
         # FinalChoice 조회
         try:
-            final_choice = FinalChoice.objects.get(event=event)
+            final_choice = FinalChoice.objects.select_related('slot').get(event=event)
         except FinalChoice.DoesNotExist:
             return Response(
                 {"detail": "확정된 시간이 없습니다"},
@@ -140,6 +155,7 @@ class FinalChoiceView(generics.GenericAPIView):
             )
 
         # 응답 데이터 생성
+        final_choice.event = event
         serializer = self.get_serializer(final_choice)
         response_data = serializer.data
         response_data['slot_id'] = final_choice.slot.id
@@ -242,7 +258,6 @@ class TimeRecommendationView(generics.GenericAPIView):
         """
         from apps.participants.models import Participant, ParticipantAvailability
         from .serializers import TimeRecommendationSerializer
-        import pytz
 
         event_id = self.kwargs.get('event_id')
         event = get_object_or_404(Event, id=event_id)
@@ -269,29 +284,28 @@ class TimeRecommendationView(generics.GenericAPIView):
                 'message': '아직 참가자가 없습니다'
             }, status=status.HTTP_200_OK)
 
+        # 슬롯별 가능 참가자 닉네임 (한 번의 쿼리로 조회)
+        names_by_slot = {}
+        available_rows = ParticipantAvailability.objects.filter(
+            event=event,
+            is_available=True
+        ).order_by('id').values_list('time_slot_id', 'participant__nickname')
+        for slot_id, nickname in available_rows:
+            names_by_slot.setdefault(slot_id, []).append(nickname)
+
         # 각 타임슬롯별로 가능한 참가자 수 계산
         slot_recommendations = []
-        tz = pytz.timezone(event.timezone)
+        formatter = get_slot_formatter(event)
 
         for slot in time_slots:
-            # 이 슬롯에 가능하다고 표시한 참가자들
-            available_participants = ParticipantAvailability.objects.filter(
-                time_slot=slot,
-                is_available=True
-            ).select_related('participant')
-
-            available_count = available_participants.count()
+            # 이 슬롯에 가능하다고 표시한 참가자 닉네임 리스트
+            participant_names = names_by_slot.get(slot.id, [])
+            available_count = len(participant_names)
 
             # 최소 참가자 수 필터 적용
             if min_participants and available_count < min_participants:
                 continue
 
-            # 참가자 닉네임 리스트
-            participant_names = [
-                avail.participant.nickname
-                for avail in available_participants
-            ]
-
             # 가능 비율 계산
             percentage = (available_count / total_participants * 100) if total_participants > 0 else 0
 
@@ -299,8 +313,8 @@ class TimeRecommendationView(generics.GenericAPIView):
                 'slot_id': slot.id,
                 'start_datetime': slot.start_datetime,
                 'end_datetime': slot.end_datetime,
-                'start_datetime_local': slot.start_datetime.astimezone(tz).isoformat(),
-                'end_datetime_local': slot.end_datetime.astimezone(tz).isoformat(),
+                'start_datetime_local': formatter.isoformat(slot.start_datetime),
+                'end_datetime_local': formatter.isoformat(slot.end_datetime),
                 'available_count': available_count,
                 'total_participants': total_participants,
                 'available_percentage': round(percentage, 1),
@@ -338,6 +352,7 @@ class TimeRecommendationView(generics.GenericAPIView):
 class EventQRCodeView(generics.GenericAPIView):
     """이벤트 QR 코드 생성 API"""
     permission_classes = [AllowAny]
+    content_negotiation_class = QueryFormatContentNegotiation
 
     def get(self, request, *args, **kwargs):
         """
@@ -346,44 +361,42 @@ class EventQRCodeView(generics.GenericAPIView):
         Query Parameters:
         - size: QR 코드 크기 (기본값: 10, 범위: 5-30)
         - format: 이미지 형식 (png 또는 svg, 기본값: png)
+
+        결과는 (slug, size, format) 단위로 캐시되며 ETag/If-None-Match를 지원합니다.
         """
-        import qrcode
-        from io import BytesIO
-        from django.http import HttpResponse
+        from django.http import HttpResponse, StreamingHttpResponse
+        from django.utils.cache import get_conditional_response
+        from .qr_utils import QR_FORMATS, clamp_size, qr_etag, get_cached_qr, render_qr, stream_svg_and_store
 
         event_id = self.kwargs.get('event_id')
-        event = get_object_or_404(Event, id=event_id)
+        event = get_object_or_404(Event.objects.only('id', 'slug'), id=event_id)
 
         # Query parameters
-        size = int(request.query_params.get('size', 10))
-        size = max(5, min(30, size))  # 5~30 사이로 제한
+        size = clamp_size(request.query_params.get('size', 10))  # 5~30 사이로 제한
         image_format = request.query_params.get('format', 'png').lower()
+        if image_format not in QR_FORMATS:
+            return Response({
+                'detail': '지원하지 않는 이미지 형식입니다 (png, svg)'
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-        # 공유 URL 생성
-        frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')
-        share_url = f"{frontend_url}/e/{event.slug}"
-
-        # QR 코드 생성
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=4,
-        )
-        qr.add_data(share_url)
-        qr.make(fit=True)
-
-        # 이미지 생성
-        img = qr.make_image(fill_color="black", back_color="white")
-
-        # BytesIO 버퍼에 저장
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-
-        # HTTP 응답 생성
-        response = HttpResponse(buffer, content_type='image/png')
-        response['Content-Disposition'] = f'inline; filename="event_{event.slug}_qr.png"'
+        content_type = QR_FORMATS[image_format]
+        etag = qr_etag(event.slug, size, image_format)
+
+        # 조건부 요청: 같은 이미지면 본문 없이 304 (압축 응답의 W/ ETag도 약한 비교로 일치)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            content = get_cached_qr(event.slug, size, image_format)
+            if content is not None:
+                response = HttpResponse(content, content_type=content_type)
+            elif image_format == 'svg':
+                response = StreamingHttpResponse(stream_svg_and_store(event.slug, size), content_type=content_type)
+            else:
+                response = HttpResponse(render_qr(event.slug, size, image_format), content_type=content_type)
+            response['Content-Disposition'] = f'inline; filename="event_{event.slug}_qr.{image_format}"'
+
+        # slug는 바뀌지 않으므로 이미지도 변하지 않음
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
         return response
 
 
@@ -396,74 +409,16 @@ class EventShareInfoView(generics.GenericAPIView):
         이벤트의 공유 링크, QR 코드 URL, 카카오톡/이메일 공유용 메타데이터를 반환합니다.
         """
         from .serializers import EventShareSerializer
-        from django.conf import settings
+        from .share_utils import get_share_bundle
 
         event_id = self.kwargs.get('event_id')
         event = get_object_or_404(Event, id=event_id)
 
-        # 공유 URL
-        frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')
-        share_url = f"{frontend_url}/e/{event.slug}"
+        # 이벤트 생성 시 미리 만들어 둔 공유 정보 사용
+        data = dict(get_share_bundle(event))
 
-        # QR 코드 URL
-        qr_code_url = request.build_absolute_uri(f'/api/v1/events/{event.id}/qr-code')
-
-        # 카카오톡 공유용 정보
-        kakao_title = f"📅 {event.title}"
-        kakao_description = f"{event.description[:100]}..." if len(event.description) > 100 else event.description
-
-        # 카카오톡 SDK용 템플릿 객체 (프론트엔드에서 바로 사용 가능)
-        kakao_template = {
-            "object_type": "feed",
-            "content": {
-                "title": kakao_title,
-                "description": kakao_description,
-                "image_url": "",  # 이벤트 이미지 URL 추가 가능
-                "link": {
-                    "web_url": share_url,
-                    "mobile_web_url": share_url
-                }
-            },
-            "buttons": [
-                {
-                    "title": "일정 참여하기",
-                    "link": {
-                        "web_url": share_url,
-                        "mobile_web_url": share_url
-                    }
-                }
-            ]
-        }
-
-        # 이메일 공유용 정보
-        email_subject = f"[일정 조율 초대] {event.title}"
-        email_body = f"""
-안녕하세요!
-
-'{event.title}' 일정 조율에 초대합니다.
-
-📅 기간: {event.date_start} ~ {event.date_end}
-⏰ 시간: {event.time_start.strftime('%H:%M')} ~ {event.time_end.strftime('%H:%M')}
-
-아래 링크에서 참가 가능한 시간을 선택해주세요:
-{share_url}
-
-감사합니다!
-"""
-
-        data = {
-            'event_id': event.id,
-            'event_title': event.title,
-            'event_slug': event.slug,
-            'share_url': share_url,
-            'qr_code_url': qr_code_url,
-            'kakao_title': kakao_title,
-            'kakao_description': kakao_description,
-            'kakao_image_url': None,  # 나중에 이벤트 이미지 추가 가능
-            'kakao_template': kakao_template,  # 추가: 프론트엔드에서 바로 사용 가능
-            'email_subject': email_subject,
-            'email_body': email_body,
-        }
+        # QR 코드 URL (요청 호스트 기준)
+        data['qr_code_url'] = request.build_absolute_uri(f'/api/v1/events/{event.id}/qr-code')
 
         serializer = EventShareSerializer(data)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -482,7 +437,7 @@ class EventInviteEmailView(generics.GenericAPIView):
         - message: 개인 메시지 (선택)
         """
         from .serializers import InviteEmailSerializer
-        from django.core.mail import send_mail
+        from apps.monitoring.metrics import send_mail
         from django.conf import settings
 
         event_id = self.kwargs.get('event_id')
@@ -554,6 +509,7 @@ class EventInviteEmailView(generics.GenericAPIView):
 class EventDashboardView(generics.GenericAPIView):
     """이벤트 참가 현황 대시보드 API"""
     permission_classes = [AllowAny]
+    content_negotiation_class = QueryFormatContentNegotiation
 
     def get(self, request, *args, **kwargs):
         """
@@ -566,16 +522,28 @@ class EventDashboardView(generics.GenericAPIView):
         권한: 이벤트 생성자 또는 참가자 (회원/익명 모두)
         - 회원 참가자: JWT 토큰으로 인증
         - 익명 참가자: query parameter로 participant_id와 email 제공
+
+        Query Parameters:
+        - format: 히트맵 형식 (full 또는 compact, 기본값: full)
+          compact는 슬롯마다 참가자 정보 대신 participants 목록의 인덱스 배열(available_participant_indexes)을 보냅니다.
         """
         from apps.participants.models import Participant, ParticipantAvailability
-        from .serializers import EventDashboardSerializer
-        import pytz
+        from .serializers import (
+            EventDashboardSerializer, CompactEventDashboardSerializer, HeatmapSlotSerializer, CompactHeatmapSlotSerializer,
+        )
+
+        heatmap_format = request.query_params.get('format', 'full').lower()
+        if heatmap_format not in ('full', 'compact'):
+            return Response({
+                'detail': '지원하지 않는 히트맵 형식입니다 (full, compact)'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        compact = heatmap_format == 'compact'
 
         event_id = self.kwargs.get('event_id')
         event = get_object_or_404(Event, id=event_id)
 
         # 권한 체크: 이벤트 생성자 또는 참가자만 대시보드 조회 가능
-        is_creator = request.user.is_authenticated and event.created_by == request.user
+        is_creator = request.user.is_authenticated and event.created_by_id == request.user.id
         is_participant = False
 
         if request.user.is_authenticated:
@@ -600,6 +568,18 @@ class EventDashboardView(generics.GenericAPIView):
         if not (is_creator or is_participant):
             raise PermissionDenied("이벤트 생성자 또는 참가자만 대시보드를 조회할 수 있습니다")
 
+        # 가능 시간 제출 내역 (한 번의 쿼리로 조회 후 참가자/슬롯별로 묶음)
+        available_rows = ParticipantAvailability.objects.filter(
+            event=event,
+            is_available=True
+        ).order_by('id').values_list('time_slot_id', 'participant_id', 'participant__nickname')
+
+        submitted_by_participant = {}
+        available_by_slot = {}
+        for slot_id, participant_id, nickname in available_rows:
+            submitted_by_participant[participant_id] = submitted_by_participant.get(participant_id, 0) + 1
+            available_by_slot.setdefault(slot_id, []).append((participant_id, nickname))
+
         # 1. 참가자 목록 및 제출 상태
         participants = Participant.objects.filter(event=event).order_by('-created_at')
         participant_status_list = []
@@ -608,10 +588,7 @@ class EventDashboardView(generics.GenericAPIView):
 
         for participant in participants:
             # 제출한 가능 시간 개수
-            submitted_slots = ParticipantAvailability.objects.filter(
-                participant=participant,
-                is_available=True
-            ).count()
+            submitted_slots = submitted_by_participant.get(participant.id, 0)
 
             has_submitted = submitted_slots > 0
             if has_submitted:
@@ -621,63 +598,62 @@ class EventDashboardView(generics.GenericAPIView):
                 'participant_id': participant.id,
                 'nickname': participant.nickname,
                 'email': participant.email,
-                'is_registered': participant.user is not None,
+                'is_registered': participant.user_id is not None,
                 'has_submitted': has_submitted,
                 'submitted_slots_count': submitted_slots,
                 'joined_at': participant.created_at
             })
 
         # 2. 히트맵 데이터 (타임슬롯별 가능 인원)
-        time_slots = TimeSlot.objects.filter(event=event).order_by('start_datetime')
-        heatmap_data = []
-        tz = pytz.timezone(event.timezone)
-
-        most_popular_slot = None
-        max_available = 0
-
-        for slot in time_slots:
-            # 이 슬롯에 가능하다고 표시한 참가자들
-            availabilities = ParticipantAvailability.objects.filter(
-                time_slot=slot,
-                is_available=True
-            ).select_related('participant')
-
-            available_count = availabilities.count()
-            available_participants = [
-                {
-                    'participant_id': av.participant.id,
-                    'nickname': av.participant.nickname
-                }
-                for av in availabilities
-            ]
+        time_slots = list(
+            TimeSlot.objects.filter(event=event).order_by('start_datetime').only('id', 'start_datetime', 'end_datetime')
+        )
+        formatter = get_slot_formatter(event)
+        total_participants = len(participant_status_list)
 
+        def availability_rate(available_count):
             # 가능 비율 계산
-            total_participants = participants.count()
-            availability_rate = (available_count / total_participants * 100) if total_participants > 0 else 0
+            return round(available_count / total_participants * 100, 1) if total_participants > 0 else 0
 
-            heatmap_data.append({
-                'slot_id': slot.id,
-                'start_datetime': slot.start_datetime,
-                'end_datetime': slot.end_datetime,
-                'start_datetime_local': slot.start_datetime.astimezone(tz).isoformat(),
-                'end_datetime_local': slot.end_datetime.astimezone(tz).isoformat(),
-                'available_count': available_count,
-                'available_participants': available_participants,
-                'availability_rate': round(availability_rate, 1)
-            })
+        # compact: 참가자 id → participants 목록 인덱스
+        participant_indexes = {item['participant_id']: index for index, item in enumerate(participant_status_list)}
 
-            # 가장 인기 있는 슬롯 추적
+        def heatmap_items():
+            for slot in time_slots:
+                # 이 슬롯에 가능하다고 표시한 참가자들
+                available = available_by_slot.get(slot.id, [])
+                item = {
+                    'slot_id': slot.id,
+                    'start_datetime': slot.start_datetime,
+                    'end_datetime': slot.end_datetime,
+                    'start_datetime_local': formatter.isoformat(slot.start_datetime),
+                    'end_datetime_local': formatter.isoformat(slot.end_datetime),
+                    'available_count': len(available),
+                    'availability_rate': availability_rate(len(available))
+                }
+                if compact:
+                    item['available_participant_indexes'] = [participant_indexes[pid] for pid, _ in available]
+                else:
+                    item['available_participants'] = [
+                        {'participant_id': pid, 'nickname': nickname} for pid, nickname in available
+                    ]
+                yield item
+
+        # 가장 인기 있는 슬롯 (가능 인원이 같으면 앞선 슬롯)
+        most_popular_slot = None
+        max_available = 0
+        for slot in time_slots:
+            available_count = len(available_by_slot.get(slot.id, ()))
             if available_count > max_available:
                 max_available = available_count
                 most_popular_slot = {
                     'slot_id': slot.id,
-                    'start_datetime_local': slot.start_datetime.astimezone(tz).isoformat(),
+                    'start_datetime_local': formatter.isoformat(slot.start_datetime),
                     'available_count': available_count,
-                    'availability_rate': round(availability_rate, 1)
+                    'availability_rate': availability_rate(available_count)
                 }
 
         # 3. 통계
-        total_participants = participants.count()
         pending_count = total_participants - submitted_count
         submission_rate = (submitted_count / total_participants * 100) if total_participants > 0 else 0
 
@@ -686,7 +662,7 @@ class EventDashboardView(generics.GenericAPIView):
             'submitted_participants': submitted_count,
             'pending_participants': pending_count,
             'submission_rate': round(submission_rate, 1),
-            'total_time_slots': time_slots.count(),
+            'total_time_slots': len(time_slots),
             'most_popular_slot': most_popular_slot
         }
 
@@ -696,10 +672,20 @@ class EventDashboardView(generics.GenericAPIView):
             'event_title': event.title,
             'stats': stats,
             'participants': participant_status_list,
-            'heatmap': heatmap_data
+            'heatmap': []
         }
 
-        serializer = EventDashboardSerializer(dashboard_data)
+        dashboard_serializer_class = CompactEventDashboardSerializer if compact else EventDashboardSerializer
+        heatmap_serializer_class = CompactHeatmapSlotSerializer if compact else HeatmapSlotSerializer
+
+        # 히트맵이 큰 이벤트는 전체 응답을 메모리에 만들지 않고 슬롯 단위로 스트리밍
+        if len(time_slots) + len(available_rows) >= settings.STREAMING_JSON_MIN_ITEMS:
+            data = dashboard_serializer_class(dashboard_data).data
+            data['heatmap'] = JSONStream(heatmap_serializer_class(item).data for item in heatmap_items())
+            return StreamingJSONResponse(data, status=status.HTTP_200_OK)
+
+        dashboard_data['heatmap'] = list(heatmap_items())
+        serializer = dashboard_serializer_class(dashboard_data)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -795,50 +781,150 @@ class CalendarICSDownloadView(generics.GenericAPIView):
         권한: 모든 사용자
         """
         from django.http import HttpResponse
-        from django.utils import timezone
+        from django.utils.cache import get_conditional_response
+        from .ics_utils import get_vevents, render_calendar, calendar_etag, vevent_version
 
         event_id = self.kwargs.get('event_id')
-        event = get_object_or_404(Event, id=event_id)
+        event = get_object_or_404(Event.objects.select_related('final_choice__slot'), id=event_id)
 
         # 확정된 시간 가져오기
         try:
-            final_choice = FinalChoice.objects.get(event=event)
-            final_slot = final_choice.slot
+            final_choice = event.final_choice
         except FinalChoice.DoesNotExist:
             return Response({
                 'detail': '아직 최종 시간이 확정되지 않았습니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # .ics 파일 생성 (iCalendar 형식)
-        # 날짜 형식: YYYYMMDDTHHMMSSZ (UTC)
-        start_utc = final_slot.start_datetime.strftime('%Y%m%dT%H%M%SZ')
-        end_utc = final_slot.end_datetime.strftime('%Y%m%dT%H%M%SZ')
-        now_utc = timezone.now().strftime('%Y%m%dT%H%M%SZ')
-
-        # UID 생성 (고유 식별자)
-        uid = f"event-{event.id}-finalchoice-{final_choice.id}@pizzascheduler"
-
-        # 이벤트 설명
-        description = event.description.replace('\n', '\\n') if event.description else ''
-
-        ics_content = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Pizza Scheduler//Event Calendar//KO
-CALSCALE:GREGORIAN
-METHOD:PUBLISH
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{now_utc}
-DTSTART:{start_utc}
-DTEND:{end_utc}
-SUMMARY:{event.title}
-DESCRIPTION:{description}
-STATUS:CONFIRMED
-SEQUENCE:0
-END:VEVENT
-END:VCALENDAR"""
+        etag = calendar_etag([(event.id, vevent_version(event.updated_at, final_choice.id))])
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        # .ics 파일 생성 (캐시된 VEVENT 블록 사용)
+        ics_content = render_calendar(get_vevents([event]))
 
         # HTTP 응답 생성
         response = HttpResponse(ics_content, content_type='text/calendar; charset=utf-8')
         response['Content-Disposition'] = f'attachment; filename="{event.slug}.ics"'
+        response['ETag'] = etag
+        return response
+
+
+class CalendarFeedURLView(generics.GenericAPIView):
+    """내 캘린더 구독 URL 조회/재발급 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """
+        내가 만들었거나 참가한 이벤트 중 확정된 일정을 모두 담은
+        캘린더 구독(webcal) URL을 반환합니다.
+        """
+        return Response(self.feed_urls(request.user), status=status.HTTP_200_OK)
+
+    def post(self, request, *args, **kwargs):
+        """
+        캘린더 구독 URL 재발급
+
+        구독 토큰 버전을 올려 이전에 발급한 구독 URL을 모두 무효로 만들고
+        새 URL을 반환합니다. (구독 URL이 유출되었을 때 사용)
+        """
+        from django.db.models import F
+
+        user = request.user
+        user.calendar_feed_version = F('calendar_feed_version') + 1
+        user.save(update_fields=['calendar_feed_version'])
+        user.refresh_from_db(fields=['calendar_feed_version'])
+
+        return Response(self.feed_urls(user), status=status.HTTP_200_OK)
+
+    def feed_urls(self, user):
+        from .ics_utils import make_feed_token
+
+        token = make_feed_token(user)
+        feed_url = self.request.build_absolute_uri(f'/api/v1/events/calendar/feed/{token}.ics')
+
+        return {
+            'feed_url': feed_url,
+            'webcal_url': 'webcal://' + feed_url.split('://', 1)[1],
+        }
+
+
+class CalendarFeedView(generics.GenericAPIView):
+    """사용자별 캘린더 구독 피드 (.ics) API"""
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    # 캐시 조회/렌더링 단위
+    chunk_size = 100
+
+    def get(self, request, *args, **kwargs):
+        """
+        사용자가 만든 이벤트(created_events)와 참가한 이벤트(participations) 중
+        최종 시간이 확정된 이벤트를 하나의 캘린더로 스트리밍합니다.
+
+        캘린더 앱은 구독을 자주 갱신하므로 ETag/Last-Modified 조건부 요청을 지원하고,
+        이벤트별 VEVENT 블록은 캐시된 것을 재사용합니다.
+
+        권한: 구독 URL의 서명 토큰
+        """
+        from django.db.models import Q
+        from django.http import StreamingHttpResponse, Http404
+        from django.utils.cache import get_conditional_response
+        from django.utils.http import http_date
+        from django.contrib.auth import get_user_model
+        from .ics_utils import read_feed_token, get_vevents, iter_calendar, calendar_etag, vevent_version
+
+        token = read_feed_token(self.kwargs.get('token'))
+        if token is None:
+            raise Http404
+
+        user_id, version = token
+        # 재발급으로 버전이 바뀐 토큰은 폐기된 것으로 처리
+        user = get_object_or_404(get_user_model(), id=user_id, calendar_feed_version=version, is_active=True)
+
+        events = Event.objects.filter(
+            Q(created_by_id=user.id) | Q(participants__user_id=user.id),
+            is_deleted=False,
+            final_choice__isnull=False,
+        ).distinct()
+
+        # 버전 정보만 가볍게 조회해 조건부 요청 처리
+        rows = list(
+            events.order_by('id').values_list('id', 'updated_at', 'final_choice__id', 'final_choice__created_at')
+        )
+        etag = calendar_etag([
+            (event_id, vevent_version(updated_at, final_choice_id))
+            for event_id, updated_at, final_choice_id, _ in rows
+        ])
+        last_modified = max(
+            (max(updated_at, chosen_at) for _, updated_at, _, chosen_at in rows),
+            default=None
+        )
+
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified.timestamp() if last_modified else None
+        )
+        if not_modified is not None:
+            return not_modified
+
+        event_ids = [row[0] for row in rows]
+
+        def stream():
+            for start in range(0, len(event_ids), self.chunk_size):
+                chunk = Event.objects.filter(
+                    id__in=event_ids[start:start + self.chunk_size]
+                ).select_related('final_choice__slot').order_by('id')
+                yield from get_vevents(list(chunk))
+
+        response = StreamingHttpResponse(
+            iter_calendar(stream(), name=f"{user.nickname}의 핏자 팟 일정"),
+            content_type='text/calendar; charset=utf-8'
+        )
+        response['Content-Disposition'] = 'inline; filename="pizza-events.ics"'
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        response['Cache-Control'] = 'private, max-age=300'
         return response
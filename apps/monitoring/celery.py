@@ -0,0 +1,28 @@
+import time
+from celery import Task
+from .metrics import observe_histogram, increment_counter
+
+
+class MonitoredTask(Task):
+    """
+    실행 시간과 결과를 지표로 남기는 Celery Task 기반 클래스
+
+    워커 실행뿐 아니라 뷰에서 태스크 함수를 직접 호출하는 경우(__call__)도 측정합니다.
+    태스크가 {'success': False} 를 반환하면 failure로 집계합니다.
+    """
+
+    def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        outcome = 'success'
+
+        try:
+            result = super().__call__(*args, **kwargs)
+            if isinstance(result, dict) and result.get('success') is False:
+                outcome = 'failure'
+            return result
+        except Exception:
+            outcome = 'error'
+            raise
+        finally:
+            observe_histogram('celery_task_duration_seconds', (self.name,), time.perf_counter() - started)
+            increment_counter('celery_tasks_total', (self.name, outcome))
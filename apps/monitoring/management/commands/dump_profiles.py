@@ -0,0 +1,36 @@
+import json
+from django.core.management.base import BaseCommand
+from apps.monitoring.profiling import profile_summary, reset_profiles
+
+
+class Command(BaseCommand):
+    help = '뷰별 요청 프로파일링 집계(전체 시간, DB 쿼리 수/시간, Serializer 시간)를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+        parser.add_argument('--reset', action='store_true', help='출력 후 집계 초기화')
+
+    def handle(self, *args, **options):
+        rows = profile_summary()
+
+        if options['json']:
+            self.stdout.write(json.dumps(rows, ensure_ascii=False, indent=2))
+        elif not rows:
+            self.stdout.write('수집된 프로파일이 없습니다.')
+        else:
+            def ms(value):
+                return '-' if value is None else f'{value * 1000:.1f}'
+
+            header = f"{'route':<40} {'count':>7} {'p50ms':>8} {'p95ms':>8} {'queries':>8} {'q_p95':>6} {'db_ms':>8} {'ser_ms':>8}"
+            self.stdout.write(header)
+            self.stdout.write('-' * len(header))
+            for row in rows:
+                q_p95 = '-' if row['queries_p95'] is None else f"{row['queries_p95']:.0f}"
+                self.stdout.write(
+                    f"{row['route']:<40} {row['count']:>7} {ms(row['wall_p50']):>8} {ms(row['wall_p95']):>8} "
+                    f"{row['queries_avg']:>8.1f} {q_p95:>6} {ms(row['db_avg']):>8} {ms(row['serializer_avg']):>8}"
+                )
+
+        if options['reset']:
+            reset_profiles()
+            self.stdout.write(self.style.SUCCESS('프로파일 집계를 초기화했습니다.'))
@@ -0,0 +1,135 @@
+"""
+Prometheus 형식 지표
+
+API 요청, Celery 태스크, 외부 연동(Solapi/Kakao/SMTP) 지표를 store(Redis hash)에 누적하고
+텍스트 노출 형식으로 렌더링합니다. 각 워커가 프로세스 메모리에 모은 값을 주기적으로
+같은 Redis hash에 원자적으로 누적하므로 워커별 값을 따로 합산할 필요가 없습니다.
+(노출 값은 METRICS_FLUSH_INTERVAL 만큼 늦을 수 있음)
+"""
+import logging
+import time
+import requests
+from django.core import mail
+from .store import TIME_BUCKETS, COUNT_BUCKETS, get_store, histograms, observe_many
+from .profiling import PROFILE_METRICS
+
+logger = logging.getLogger(__name__)
+
+LABEL_SEPARATOR = ','
+
+# 이름: (레이블 이름, 버킷, 설명)
+HISTOGRAMS = {
+    'http_request_duration_seconds': (('route', 'method'), TIME_BUCKETS, 'API 요청 처리 시간'),
+    'http_request_db_queries': (('route',), COUNT_BUCKETS, '요청당 DB 쿼리 수'),
+    'celery_task_duration_seconds': (('task',), TIME_BUCKETS, 'Celery 태스크 실행 시간'),
+    'external_request_duration_seconds': (('provider', 'operation'), TIME_BUCKETS, '외부 연동 요청 시간'),
+    'solapi_signing_seconds': (('provider',), TIME_BUCKETS, 'Solapi 인증 헤더 서명 시간'),
+}
+HISTOGRAMS.update({
+    name: (('route',), buckets, '샘플링된 요청 프로파일')
+    for name, buckets in PROFILE_METRICS
+})
+
+# 이름: (레이블 이름, 설명)
+COUNTERS = {
+    'http_requests_total': (('route', 'method', 'status'), 'API 요청 수'),
+    'celery_tasks_total': (('task', 'outcome'), 'Celery 태스크 실행 결과'),
+    'external_requests_total': (('provider', 'operation', 'outcome'), '외부 연동 요청 결과'),
+}
+
+
+def _label(*values):
+    return LABEL_SEPARATOR.join(str(value).replace(LABEL_SEPARATOR, '_') for value in values)
+
+
+def observe_histogram(name, labels, value):
+    _, buckets, _ = HISTOGRAMS[name]
+    observe_many(_label(*labels), [(name, value, buckets)])
+
+
+def increment_counter(name, labels, amount=1):
+    try:
+        get_store().record(name, _label(*labels), {'value': amount})
+    except Exception as e:
+        logger.warning(f"지표 저장 실패: {str(e)}")
+
+
+class ExternalCall:
+    """외부 연동 호출 측정 (응답 코드로 실패를 판단할 때는 fail() 호출)"""
+
+    def __init__(self, provider, operation):
+        self.provider = provider
+        self.operation = operation
+        self.outcome = 'success'
+
+    def fail(self):
+        self.outcome = 'failure'
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.outcome = 'timeout' if 'Timeout' in exc_type.__name__ else 'error'
+
+        observe_histogram('external_request_duration_seconds', (self.provider, self.operation), time.perf_counter() - self._started)
+        increment_counter('external_requests_total', (self.provider, self.operation, self.outcome))
+        return False
+
+
+def track_external(provider, operation):
+    return ExternalCall(provider, operation)
+
+
+def instrumented_post(provider, operation, url, **kwargs):
+    """requests.post 호출을 측정 (2xx 이외 응답은 failure로 집계)"""
+    with track_external(provider, operation) as call:
+        response = requests.post(url, **kwargs)
+        if not 200 <= response.status_code < 300:
+            call.fail()
+        return response
+
+
+def send_mail(*args, **kwargs):
+    """django.core.mail.send_mail 호출을 SMTP 지표로 측정"""
+    with track_external('smtp', 'send_mail'):
+        return mail.send_mail(*args, **kwargs)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, label, extra=None):
+    values = label.split(LABEL_SEPARATOR) if label else []
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def render_prometheus():
+    """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+    lines = []
+
+    for name, (label_names, buckets, help_text) in HISTOGRAMS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} histogram')
+        for label, histogram in sorted(histograms(name, buckets).items()):
+            cumulative = 0
+            for upper, count in histogram['buckets'].items():
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(label_names, label, ('le', upper))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(label_names, label)} {histogram['sum']}")
+            lines.append(f"{name}_count{_format_labels(label_names, label)} {histogram['count']}")
+
+    store = get_store()
+    for name, (label_names, help_text) in COUNTERS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for key, value in sorted(store.raw(name).items()):
+            label = key.split('|', 1)[0]
+            lines.append(f"{name}{_format_labels(label_names, label)} {value:g}")
+
+    return '\n'.join(lines) + '\n'
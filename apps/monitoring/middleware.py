@@ -0,0 +1,115 @@
+import random
+import time
+from django.conf import settings
+from django.db import connections
+from .profiling import PROFILE_METRICS, start_profile, end_profile, QueryTimer
+from .store import observe_many
+from .metrics import observe_histogram, increment_counter
+
+KNOWN_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+
+def route_name(request):
+    """URL 이름 기준 집계 레이블 (예: events:dashboard)"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return match.view_name or match._func_path
+
+
+class ProfilingMiddleware:
+    """
+    요청 프로파일링 미들웨어 (옵트인)
+
+    다음 중 하나일 때만 측정합니다.
+    - PROFILING_ALLOW_HEADER 가 True이고 요청에 X-Profile: 1 헤더가 있음
+      (이 경우 응답에 Server-Timing 헤더 추가)
+    - PROFILING_SAMPLE_RATE 확률로 샘플링
+
+    뷰(URL 이름)별로 전체 시간, DB 쿼리 수, DB 시간, Serializer 시간을 히스토그램으로 집계합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def should_profile(self, request):
+        if getattr(settings, 'PROFILING_ALLOW_HEADER', False) and request.headers.get('X-Profile') == '1':
+            return True, True
+
+        sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+        return sample_rate > 0 and random.random() < sample_rate, False
+
+    def __call__(self, request):
+        enabled, requested = self.should_profile(request)
+        if not enabled:
+            return self.get_response(request)
+
+        profile, token = start_profile()
+        timer = QueryTimer(profile)
+        started = time.perf_counter()
+
+        try:
+            with connections['default'].execute_wrapper(timer):
+                response = self.get_response(request)
+
+                # 지연 렌더링되는 응답도 측정 범위에 포함
+                if hasattr(response, 'render') and callable(response.render) and not getattr(response, 'is_rendered', True):
+                    response.render()
+        finally:
+            end_profile(token)
+
+        wall_time = time.perf_counter() - started
+        values = (wall_time, profile.query_count, profile.db_time, profile.serializer_time)
+
+        observe_many(route_name(request), [
+            (name, value, buckets)
+            for (name, buckets), value in zip(PROFILE_METRICS, values)
+        ])
+
+        if requested:
+            response['Server-Timing'] = (
+                f'total;dur={wall_time * 1000:.1f}, '
+                f'db;dur={profile.db_time * 1000:.1f};desc="{profile.query_count} queries", '
+                f'serializer;dur={profile.serializer_time * 1000:.1f}'
+            )
+
+        return response
+
+
+class QueryCounter:
+    """connection.execute_wrapper 용 쿼리 수 측정기"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """
+    모든 요청의 처리 시간, 응답 코드, DB 쿼리 수를 URL 이름별로 집계하는 미들웨어
+
+    /metrics 에서 Prometheus 형식으로 노출됩니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        started = time.perf_counter()
+
+        with connections['default'].execute_wrapper(counter):
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - started
+        route = route_name(request)
+        method = request.method if request.method in KNOWN_METHODS else 'OTHER'
+
+        observe_histogram('http_request_duration_seconds', (route, method), duration)
+        observe_histogram('http_request_db_queries', (route,), counter.count)
+        increment_counter('http_requests_total', (route, method, response.status_code))
+
+        return response
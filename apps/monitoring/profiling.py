@@ -0,0 +1,126 @@
+"""
+요청 단위 프로파일링
+
+요청 처리 중 DB 쿼리 수/시간과 Serializer 직렬화 시간을 contextvar에 누적합니다.
+"""
+import contextvars
+import time
+from functools import wraps
+from .store import TIME_BUCKETS, COUNT_BUCKETS, histograms, estimate_quantile, reset
+
+# 프로파일링 지표 이름과 버킷
+PROFILE_METRICS = (
+    ('profile_wall_seconds', TIME_BUCKETS),
+    ('profile_db_queries', COUNT_BUCKETS),
+    ('profile_db_seconds', TIME_BUCKETS),
+    ('profile_serializer_seconds', TIME_BUCKETS),
+)
+
+_current_profile = contextvars.ContextVar('request_profile', default=None)
+
+
+class RequestProfile:
+    __slots__ = ('query_count', 'db_time', 'serializer_time', '_serializer_depth')
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self._serializer_depth = 0
+
+
+def start_profile():
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    return profile, token
+
+
+def end_profile(token):
+    _current_profile.reset(token)
+
+
+def current_profile():
+    return _current_profile.get()
+
+
+class QueryTimer:
+    """connection.execute_wrapper 용 쿼리 수/시간 측정기"""
+
+    def __init__(self, profile):
+        self.profile = profile
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.profile.query_count += 1
+            self.profile.db_time += time.perf_counter() - started
+
+
+def _timed_data(fget):
+    @wraps(fget)
+    def data(serializer):
+        profile = _current_profile.get()
+        if profile is None:
+            return fget(serializer)
+
+        # 중첩된 Serializer.data 호출은 가장 바깥 호출만 측정
+        profile._serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return fget(serializer)
+        finally:
+            profile._serializer_depth -= 1
+            if profile._serializer_depth == 0:
+                profile.serializer_time += time.perf_counter() - started
+
+    data._profiled = True
+    return data
+
+
+def install_serializer_timing():
+    """Serializer/ListSerializer.data 접근 시간을 측정하도록 설정 (중복 설치 방지)"""
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        original = cls.__dict__['data']
+        if getattr(original.fget, '_profiled', False):
+            continue
+        cls.data = property(_timed_data(original.fget))
+
+
+def profile_summary():
+    """
+    뷰별 프로파일링 요약
+
+    Returns:
+        list: [{'route', 'count', 'wall_p50', 'wall_p95', 'wall_avg', 'queries_avg', 'queries_p95',
+                'db_avg', 'serializer_avg'}, ...] (요청 수 내림차순)
+    """
+    data = {name: histograms(name, buckets) for name, buckets in PROFILE_METRICS}
+
+    def average(histogram):
+        return histogram['sum'] / histogram['count'] if histogram and histogram['count'] else 0.0
+
+    rows = []
+    for route, wall in data['profile_wall_seconds'].items():
+        queries = data['profile_db_queries'].get(route)
+        rows.append({
+            'route': route,
+            'count': wall['count'],
+            'wall_p50': estimate_quantile(wall, 0.5),
+            'wall_p95': estimate_quantile(wall, 0.95),
+            'wall_avg': average(wall),
+            'queries_avg': average(queries),
+            'queries_p95': estimate_quantile(queries, 0.95) if queries else None,
+            'db_avg': average(data['profile_db_seconds'].get(route)),
+            'serializer_avg': average(data['profile_serializer_seconds'].get(route)),
+        })
+
+    rows.sort(key=lambda row: row['count'], reverse=True)
+    return rows
+
+
+def reset_profiles():
+    reset([name for name, _ in PROFILE_METRICS])
@@ -0,0 +1,256 @@
+"""
+지표 집계 저장소
+
+gunicorn 워커 여러 개가 같은 지표를 누적해야 하므로 기본은 Redis hash에 저장하고,
+개발/테스트용으로 프로세스 메모리 저장소를 제공합니다. (METRICS_BACKEND = 'redis' | 'local')
+
+Redis 저장소는 요청마다 Redis를 호출하지 않도록 프로세스 메모리에 모아 두었다가
+백그라운드 스레드가 METRICS_FLUSH_INTERVAL 초마다 파이프라인 한 번으로 반영합니다.
+저장 실패는 로그만 남기고 요청 처리에는 영향을 주지 않습니다.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from config.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한값
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+KEY_PREFIX = 'metrics'
+
+
+def bucket_for(value, buckets):
+    for upper in buckets:
+        if value <= upper:
+            return str(upper)
+    return '+Inf'
+
+
+def empty_histogram(buckets):
+    return {
+        'buckets': {str(upper): 0 for upper in buckets} | {'+Inf': 0},
+        'sum': 0.0,
+        'count': 0,
+    }
+
+
+class LocalMetricsStore:
+    """프로세스 메모리 저장소 (단일 프로세스 개발/테스트용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = defaultdict(lambda: defaultdict(float))
+
+    def record(self, name, label, fields):
+        with self._lock:
+            target = self._data[name]
+            for field, amount in fields.items():
+                target[f"{label}|{field}"] += amount
+
+    def record_many(self, data):
+        """{지표 이름: {"레이블|필드": 증가량}} 일괄 누적"""
+        with self._lock:
+            for name, fields in data.items():
+                target = self._data[name]
+                for key, amount in fields.items():
+                    target[key] += amount
+
+    def raw(self, name):
+        with self._lock:
+            return dict(self._data.get(name, {}))
+
+    def reset(self, names):
+        with self._lock:
+            for name in names:
+                self._data.pop(name, None)
+
+
+class RedisMetricsStore:
+    """Redis hash 저장소 (워커 간 공유, HINCRBYFLOAT로 원자적 누적)"""
+
+    def record(self, name, label, fields):
+        pipeline = get_redis().pipeline(transaction=False)
+        for field, amount in fields.items():
+            pipeline.hincrbyfloat(f"{KEY_PREFIX}:{name}", f"{label}|{field}", amount)
+        pipeline.execute()
+
+    def record_many(self, data):
+        """{지표 이름: {"레이블|필드": 증가량}} 을 파이프라인 한 번으로 누적"""
+        pipeline = get_redis().pipeline(transaction=False)
+        for name, fields in data.items():
+            for key, amount in fields.items():
+                pipeline.hincrbyfloat(f"{KEY_PREFIX}:{name}", key, amount)
+        pipeline.execute()
+
+    def raw(self, name):
+        data = get_redis().hgetall(f"{KEY_PREFIX}:{name}")
+        return {key.decode(): float(value) for key, value in data.items()}
+
+    def reset(self, names):
+        if names:
+            get_redis().delete(*[f"{KEY_PREFIX}:{name}" for name in names])
+
+
+class BufferedMetricsStore:
+    """
+    프로세스 메모리에 누적했다가 백그라운드 스레드가 주기적으로 target 저장소에 반영하는 저장소
+
+    record()는 메모리 누적만 하므로 요청 처리 중 Redis 왕복이 없습니다.
+    반영에 실패하면 누적값을 버퍼에 되돌려 다음 주기에 다시 시도하고,
+    프로세스가 비정상 종료되면 마지막 주기의 값은 유실될 수 있습니다.
+    """
+
+    def __init__(self, target, interval=None):
+        self.target = target
+        self.interval = interval
+        self._reset_state()
+        # fork된 워커(gunicorn preload, Celery prefork)는 부모의 버퍼/스레드를 이어받지 않음
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_state)
+
+    def _reset_state(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flusher = None
+
+    def _flush_interval(self):
+        if self.interval is not None:
+            return self.interval
+        return getattr(settings, 'METRICS_FLUSH_INTERVAL', 10)
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run, name='metrics-flusher', daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self._flush_interval())
+            self.flush()
+
+    def _merge(self, data):
+        for name, fields in data.items():
+            target = self._pending.setdefault(name, {})
+            for key, amount in fields.items():
+                target[key] = target.get(key, 0) + amount
+
+    def record(self, name, label, fields):
+        self._ensure_flusher()
+        with self._lock:
+            self._merge({name: {f"{label}|{field}": amount for field, amount in fields.items()}})
+
+    def flush(self):
+        """모아 둔 값을 target 저장소에 반영"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            self.target.record_many(pending)
+        except Exception as e:
+            logger.warning(f"지표 반영 실패, 다음 주기에 재시도: {str(e)}")
+            with self._lock:
+                self._merge(pending)
+
+    def raw(self, name):
+        # 이 프로세스에서 아직 반영하지 않은 값도 포함되도록 먼저 반영
+        self.flush()
+        return self.target.raw(name)
+
+    def reset(self, names):
+        with self._lock:
+            for name in names:
+                self._pending.pop(name, None)
+        self.target.reset(names)
+
+
+_local_store = LocalMetricsStore()
+_redis_store = BufferedMetricsStore(RedisMetricsStore())
+
+
+def get_store():
+    if getattr(settings, 'METRICS_BACKEND', 'redis') == 'local':
+        return _local_store
+    return _redis_store
+
+
+def observe_many(label, observations):
+    """
+    여러 히스토그램에 한 번에 값 기록
+
+    Args:
+        label: 집계 단위 (예: URL 이름)
+        observations: [(지표 이름, 값, 버킷), ...]
+    """
+    try:
+        store = get_store()
+        for name, value, buckets in observations:
+            store.record(name, label, {
+                f"b|{bucket_for(value, buckets)}": 1,
+                'sum': value,
+                'count': 1,
+            })
+    except Exception as e:
+        logger.warning(f"지표 저장 실패: {str(e)}")
+
+
+def observe(name, label, value, buckets=TIME_BUCKETS):
+    observe_many(label, [(name, value, buckets)])
+
+
+def histograms(name, buckets):
+    """
+    레이블별 히스토그램 조회
+
+    Returns:
+        dict: {label: {'buckets': {상한: 개수}, 'sum': float, 'count': int}}
+    """
+    result = {}
+    for key, value in get_store().raw(name).items():
+        label, field = key.split('|', 1)
+        histogram = result.setdefault(label, empty_histogram(buckets))
+        if field.startswith('b|'):
+            histogram['buckets'][field[2:]] = int(value)
+        elif field == 'sum':
+            histogram['sum'] = value
+        elif field == 'count':
+            histogram['count'] = int(value)
+    return result
+
+
+def reset(names):
+    get_store().reset(names)
+
+
+def estimate_quantile(histogram, quantile):
+    """버킷 개수로 분위수 추정 (버킷 내부는 선형 보간)"""
+    total = histogram['count']
+    if not total:
+        return None
+
+    rank = quantile * total
+    seen = 0
+    lower = 0.0
+    for upper, count in histogram['buckets'].items():
+        if upper == '+Inf':
+            return lower
+        upper = float(upper)
+        if count and seen + count >= rank:
+            return lower + (upper - lower) * ((rank - seen) / count)
+        seen += count
+        lower = upper
+    return lower
@@ -0,0 +1,148 @@
+import io
+from unittest import mock
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from apps.accounts.factories import UserFactory
+from .metrics import COUNTERS, HISTOGRAMS
+from .profiling import PROFILE_METRICS, profile_summary, reset_profiles
+from .store import BufferedMetricsStore, LocalMetricsStore, estimate_quantile, get_store, histograms, reset
+
+
+class BufferedMetricsStoreTests(TestCase):
+    """프로세스 메모리에 모았다가 주기적으로 반영하는 지표 저장소 검사"""
+
+    def setUp(self):
+        self.target = LocalMetricsStore()
+        self.store = BufferedMetricsStore(self.target, interval=3600)
+
+    def test_record_is_buffered_until_flush(self):
+        self.store.record('requests', 'events:dashboard', {'value': 1})
+        self.store.record('requests', 'events:dashboard', {'value': 2})
+        self.assertEqual(self.target.raw('requests'), {})
+
+        self.store.flush()
+        self.assertEqual(self.target.raw('requests'), {'events:dashboard|value': 3})
+
+        # raw()는 아직 반영하지 않은 값도 포함
+        self.store.record('requests', 'events:dashboard', {'value': 1})
+        self.assertEqual(self.store.raw('requests'), {'events:dashboard|value': 4})
+
+    def test_failed_flush_is_retried(self):
+        self.store.record('requests', 'events:dashboard', {'value': 1})
+
+        with mock.patch.object(self.target, 'record_many', side_effect=ConnectionError('redis down')), \
+                self.assertLogs('apps.monitoring.store', 'WARNING'):
+            self.store.flush()
+
+        self.store.record('requests', 'events:dashboard', {'value': 1})
+        self.store.flush()
+        self.assertEqual(self.target.raw('requests'), {'events:dashboard|value': 2})
+
+    def test_reset_drops_pending(self):
+        self.store.record('requests', 'events:dashboard', {'value': 1})
+        self.store.reset(['requests'])
+        self.assertEqual(self.store.raw('requests'), {})
+
+
+class MetricsMiddlewareTests(TestCase):
+    """요청 지표 집계와 /metrics 접근 제어 검사"""
+
+    def setUp(self):
+        reset(list(HISTOGRAMS) + list(COUNTERS))
+        self.client = APIClient()
+        self.client.force_authenticate(user=UserFactory())
+
+    def test_request_metrics(self):
+        self.client.get('/api/v1/events/my/')
+        self.client.get('/api/v1/events/my/')
+
+        self.assertEqual(get_store().raw('http_requests_total'), {'events:my-events,GET,200|value': 2})
+        duration = histograms('http_request_duration_seconds', HISTOGRAMS['http_request_duration_seconds'][1])
+        self.assertEqual(duration['events:my-events,GET']['count'], 2)
+
+    @override_settings(METRICS_BACKEND='redis')
+    def test_redis_backend_not_written_per_request(self):
+        target = LocalMetricsStore()
+        with mock.patch('apps.monitoring.store._redis_store', BufferedMetricsStore(target, interval=3600)):
+            self.client.get('/api/v1/events/my/')
+            self.assertEqual(target.raw('http_requests_total'), {})
+
+            get_store().flush()
+        self.assertEqual(target.raw('http_requests_total'), {'events:my-events,GET,200|value': 1})
+
+    @override_settings(METRICS_TOKEN='')
+    def test_metrics_denied_without_token_setting(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer ').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_with_token(self):
+        self.client.get('/api/v1/events/my/')
+
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('http_requests_total{route="events:my-events",method="GET",status="200"} 1', response.content.decode())
+
+
+class ProfilingMiddlewareTests(TestCase):
+    """요청 프로파일링(옵트인) 검사"""
+
+    url = '/api/v1/events/my/'
+
+    def setUp(self):
+        reset_profiles()
+        self.user = UserFactory()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    @override_settings(PROFILING_ALLOW_HEADER=True)
+    def test_profile_header(self):
+        response = self.client.get(self.url, HTTP_X_PROFILE='1')
+
+        self.assertRegex(response['Server-Timing'], r'total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", serializer;dur=[\d.]+')
+        [row] = profile_summary()
+        self.assertEqual(row['route'], 'events:my-events')
+        self.assertEqual(row['count'], 1)
+        self.assertGreaterEqual(row['queries_avg'], 1)
+        self.assertGreater(row['serializer_avg'], 0)
+
+    @override_settings(PROFILING_ALLOW_HEADER=False, PROFILING_SAMPLE_RATE=0.0)
+    def test_disabled_by_default(self):
+        response = self.client.get(self.url, HTTP_X_PROFILE='1')
+
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertEqual(profile_summary(), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_sampling(self):
+        response = self.client.get(self.url)
+
+        # 샘플링된 요청은 집계만 하고 응답 헤더는 추가하지 않음
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertEqual(profile_summary()[0]['count'], 1)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_summary_api_and_command(self):
+        self.client.get(self.url)
+
+        self.assertEqual(self.client.get('/api/v1/monitoring/profiles').status_code, 403)
+        self.client.force_authenticate(user=UserFactory(is_staff=True))
+        response = self.client.get('/api/v1/monitoring/profiles')
+        # 샘플링 비율 1.0이므로 앞의 프로파일 API 요청도 집계됨
+        self.assertIn('events:my-events', [row['route'] for row in response.data['routes']])
+
+        stdout = io.StringIO()
+        call_command('dump_profiles', '--reset', stdout=stdout)
+        self.assertIn('events:my-events', stdout.getvalue())
+        self.assertEqual(profile_summary(), [])
+
+    def test_estimate_quantile(self):
+        buckets = dict(PROFILE_METRICS)['profile_db_queries']
+        histogram = {'buckets': {str(upper): 0 for upper in buckets} | {'+Inf': 0}, 'sum': 0.0, 'count': 4}
+        histogram['buckets']['5'] = 4  # 2 < 값 <= 5
+
+        self.assertEqual(estimate_quantile(histogram, 0.5), 3.5)
+        self.assertIsNone(estimate_quantile({'buckets': {}, 'sum': 0.0, 'count': 0}, 0.5))
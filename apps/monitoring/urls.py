@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import ProfileSummaryView
+
+app_name = 'monitoring'
+
+urlpatterns = [
+    path('profiles', ProfileSummaryView.as_view(), name='profiles'),
+]
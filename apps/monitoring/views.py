@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from rest_framework import generics, status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from .metrics import render_prometheus
+from .profiling import profile_summary
+
+
+class ProfileSummaryView(generics.GenericAPIView):
+    """뷰별 요청 프로파일링 집계 API (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response({'routes': profile_summary()}, status=status.HTTP_200_OK)
+
+
+def metrics_view(request):
+    """
+    Prometheus 수집용 지표 (nginx에서 프록시하지 않는 내부 경로)
+
+    Authorization: Bearer {METRICS_TOKEN} 헤더가 필요하며, METRICS_TOKEN이 비어 있으면 항상 거부합니다.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if not token or not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
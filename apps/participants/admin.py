@@ -15,4 +15,4 @@ class ParticipantAvailabilityAdmin(admin.ModelAdmin):
     list_display = ['id', 'participant', 'time_slot', 'is_available', 'created_at']
     list_filter = ['is_available', 'participant__event', 'created_at']
     search_fields = ['participant__nickname']
-    readonly_fields = ['created_at']
+    readonly_fields = ['event', 'created_at']  # 저장 시 참가자의 이벤트로 채움
@@ -0,0 +1,30 @@
+from datetime import timedelta
+import factory
+from .models import Participant, ParticipantAvailability
+
+
+class ParticipantFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Participant
+
+    event = factory.SubFactory('apps.events.factories.EventFactory')
+    user = None
+    nickname = factory.Sequence(lambda n: f'참가자{n}')
+    email = factory.Faker('email')
+    phone = factory.Faker('numerify', text='010########')
+    created_at = factory.LazyAttribute(lambda o: o.event.created_at + timedelta(hours=1))
+    updated_at = factory.SelfAttribute('created_at')
+
+
+class ParticipantAvailabilityFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ParticipantAvailability
+
+    participant = factory.SubFactory(ParticipantFactory)
+    time_slot = factory.SubFactory(
+        'apps.events.factories.TimeSlotFactory',
+        event=factory.SelfAttribute('..participant.event')
+    )
+    event = factory.SelfAttribute('participant.event')
+    is_available = True
+    created_at = factory.SelfAttribute('participant.created_at')
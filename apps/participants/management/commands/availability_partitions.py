@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from apps.participants import partitions
+
+
+class Command(BaseCommand):
+    help = '가능 시간(participant_availabilities) 파티션 상태를 출력하고, 다음 구간을 미리 만들거나 오래된 구간을 분리합니다. (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ensure', action='store_true', help='다음 event_id 구간 파티션을 미리 생성')
+        parser.add_argument('--ahead', type=int, default=None, help='미리 만들 구간 수 (기본: AVAILABILITY_PARTITIONS_AHEAD)')
+        parser.add_argument('--detach', metavar='NAME', help='파티션 분리 (보관용 테이블로 남김)')
+        parser.add_argument('--drop', action='store_true', help='--detach 후 테이블 삭제')
+        parser.add_argument('--force', action='store_true', help='삭제되지 않은 이벤트가 남아 있어도 분리')
+
+    def handle(self, *args, **options):
+        if not partitions.is_supported():
+            raise CommandError('PostgreSQL에서만 사용할 수 있습니다.')
+
+        with connection.cursor() as cursor:
+            if not partitions.is_partitioned(cursor):
+                raise CommandError(f'{partitions.TABLE} 테이블이 파티셔닝되어 있지 않습니다. (migrate 필요)')
+
+        if options['ensure']:
+            created = partitions.ensure_partitions(ahead=options['ahead'])
+            self.stdout.write(self.style.SUCCESS(f"생성한 파티션: {', '.join(created) or '없음'}"))
+
+        if options['detach']:
+            try:
+                partitions.detach_partition(options['detach'], drop=options['drop'], force=options['force'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            action = '분리 후 삭제' if options['drop'] else '분리'
+            self.stdout.write(self.style.SUCCESS(f"{options['detach']} 파티션을 {action}했습니다."))
+
+        with connection.cursor() as cursor:
+            rows = partitions.list_partitions(cursor)
+
+        header = f"{'partition':<40} {'event_id range':>24} {'rows(est)':>12}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for row in rows:
+            bounds = 'DEFAULT' if row['is_default'] else f"{row['start']} ~ {row['end'] - 1}"
+            self.stdout.write(f"{row['name']:<40} {bounds:>24} {row['estimated_rows']:>12}")
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.17 on 2026-10-19 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("participants", "0004_add_phone_field"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="participant",
+            index=models.Index(
+                fields=["event", "-created_at"], name="participant_event_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="participantavailability",
+            index=models.Index(
+                condition=models.Q(("is_available", True)),
+                fields=["time_slot"],
+                include=("participant",),
+                name="availability_slot_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="participantavailability",
+            index=models.Index(
+                condition=models.Q(("is_available", True)),
+                fields=["participant"],
+                include=("time_slot",),
+                name="availability_participant_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def populate_event(apps, schema_editor):
+    ParticipantAvailability = apps.get_model('participants', 'ParticipantAvailability')
+    TimeSlot = apps.get_model('events', 'TimeSlot')
+
+    ParticipantAvailability.objects.filter(event__isnull=True).update(
+        event_id=Subquery(TimeSlot.objects.filter(pk=OuterRef('time_slot_id')).values('event_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0006_hot_query_indexes"),
+        ("participants", "0005_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="participantavailability",
+            name="event",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="availabilities",
+                to="events.event",
+            ),
+        ),
+        migrations.RunPython(populate_event, migrations.RunPython.noop),
+    ]
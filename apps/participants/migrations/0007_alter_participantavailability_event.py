@@ -0,0 +1,34 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("participants", "0006_participantavailability_event"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="participantavailability",
+            name="event",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="availabilities",
+                to="events.event",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="participantavailability",
+            name="availability_slot_idx",
+        ),
+        migrations.AddIndex(
+            model_name="participantavailability",
+            index=models.Index(
+                condition=models.Q(("is_available", True)),
+                fields=["event", "time_slot"],
+                include=("participant",),
+                name="availability_event_slot_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+from apps.participants.partitions import partition_availability_table, unpartition_availability_table
+
+
+def partition(apps, schema_editor):
+    # PostgreSQL이 아니면 아무 작업도 하지 않음
+    partition_availability_table(schema_editor.connection)
+
+
+def unpartition(apps, schema_editor):
+    unpartition_availability_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("participants", "0007_alter_participantavailability_event"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
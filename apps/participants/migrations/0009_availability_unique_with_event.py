@@ -0,0 +1,55 @@
+from django.db import migrations
+from apps.participants.partitions import TABLE, is_partitioned, is_supported
+
+OLD_UNIQUE = {('participant', 'time_slot')}
+NEW_UNIQUE = {('participant', 'time_slot', 'event')}
+
+
+def _already_applied(schema_editor):
+    # 파티션 테이블은 0008에서 UNIQUE (participant_id, time_slot_id, event_id)로 다시 만들어짐
+    if not is_supported(schema_editor.connection):
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        return is_partitioned(cursor, TABLE)
+
+
+def add_event_to_unique(apps, schema_editor):
+    if _already_applied(schema_editor):
+        return
+    model = apps.get_model('participants', 'ParticipantAvailability')
+    schema_editor.alter_unique_together(model, OLD_UNIQUE, NEW_UNIQUE)
+
+
+def remove_event_from_unique(apps, schema_editor):
+    if _already_applied(schema_editor):
+        return
+    model = apps.get_model('participants', 'ParticipantAvailability')
+    schema_editor.alter_unique_together(model, NEW_UNIQUE, OLD_UNIQUE)
+
+
+class Migration(migrations.Migration):
+    """
+    Django 상태의 UNIQUE 제약을 실제 DB와 맞춤
+
+    PostgreSQL 파티셔닝(0008)은 UNIQUE에 파티션 키 event_id를 추가하므로
+    상태만 (participant, time_slot, event)로 바꾸고, 그 외 DB에서는 같은 제약으로 변경합니다.
+    이후 unique_together 변경 시 Django가 컬럼 기준으로 제약을 찾을 수 있습니다.
+    """
+
+    dependencies = [
+        ("participants", "0008_partition_availabilities"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_event_to_unique, remove_event_from_unique),
+            ],
+            state_operations=[
+                migrations.AlterUniqueTogether(
+                    name="participantavailability",
+                    unique_together={("participant", "time_slot", "event")},
+                ),
+            ],
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.conf import settings
 from apps.events.models import Event, TimeSlot
@@ -23,20 +24,55 @@ class Participant(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['event', 'nickname'], name='unique_event_nickname')
         ]
+        indexes = [
+            # 참가자 목록 (event, -created_at)
+            models.Index(fields=['event', '-created_at'], name='participant_event_recent_idx'),
+        ]
 
 
 class ParticipantAvailability(models.Model):
     participant = models.ForeignKey(Participant, on_delete=models.CASCADE, related_name='availabilities')
     time_slot = models.ForeignKey(TimeSlot, on_delete=models.CASCADE, related_name='availabilities')
+    # 파티션 키 (participant.event_id와 같은 값, PostgreSQL에서는 event_id 범위로 파티셔닝)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='availabilities')
     is_available = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"{self.participant.nickname} - {self.time_slot} ({'O' if self.is_available else 'X'})"
 
+    def clean(self):
+        # 다른 이벤트의 슬롯은 선택할 수 없음
+        if self.participant_id and self.time_slot_id and self.time_slot.event_id != self.participant.event_id:
+            raise ValidationError({'time_slot': '참가자의 이벤트에 속한 타임슬롯이 아닙니다.'})
+
+    def save(self, *args, **kwargs):
+        # 파티션 키는 항상 참가자의 이벤트 (bulk_create는 save()를 거치지 않으므로 event_id를 직접 지정)
+        self.event_id = self.participant.event_id
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'participant_availabilities'
         verbose_name = 'Participant Availability'
         verbose_name_plural = 'Participant Availabilities'
         ordering = ['time_slot__start_datetime']
-        unique_together = ['participant', 'time_slot']
+        # event는 participant에 따라 정해지므로 (participant, time_slot) 유일성과 같음
+        # 파티션 테이블의 UNIQUE 제약은 파티션 키를 포함해야 해서 event를 함께 둠
+        # PostgreSQL 파티셔닝 후 PK는 (id, event_id)이며 Django 상태에는 id만 PK로 남음 (partitions.py 참고)
+        unique_together = ['participant', 'time_slot', 'event']
+        indexes = [
+            # 이벤트/슬롯별 가능 참가자 (히트맵/추천/요약), participant_id 포함으로 index-only scan
+            models.Index(
+                fields=['event', 'time_slot'],
+                include=['participant'],
+                condition=models.Q(is_available=True),
+                name='availability_event_slot_idx',
+            ),
+            # 참가자별 가능 슬롯 (가능 시간 조회/제출 현황)
+            models.Index(
+                fields=['participant'],
+                include=['time_slot'],
+                condition=models.Q(is_available=True),
+                name='availability_participant_idx',
+            ),
+        ]
@@ -0,0 +1,292 @@
+"""
+participant_availabilities 파티셔닝 (PostgreSQL 전용)
+
+event_id 범위 파티셔닝을 사용합니다.
+- 이벤트 id는 생성 순서대로 증가하므로 범위 = 생성 시기 구간이 되어, 오래된 구간을 통째로 분리(DETACH)할 수 있음
+- event_id 조건이 있는 이벤트 단위 집계는 해당 이벤트가 속한 파티션 하나만 조회
+- 범위를 벗어난 event_id는 DEFAULT 파티션에 저장 (ensure_partitions가 미리 파티션을 만들어 비워 둠)
+
+PostgreSQL이 아니면 모든 함수가 아무 작업도 하지 않습니다.
+"""
+import logging
+import re
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+TABLE = 'participant_availabilities'
+PARTITION_KEY = 'event_id'
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+_BOUND_PATTERN = re.compile(r"FROM \('?(\d+)'?\) TO \('?(\d+)'?\)")
+
+
+def get_partition_size():
+    return getattr(settings, 'AVAILABILITY_PARTITION_SIZE', 50000)
+
+
+def partition_name(index):
+    return f'{TABLE}_p{index:04d}'
+
+
+def is_supported(conn=None):
+    return (conn or connection).vendor == 'postgresql'
+
+
+def is_partitioned(cursor, table=TABLE):
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+        [table]
+    )
+    return cursor.fetchone() is not None
+
+
+def list_partitions(cursor):
+    """
+    Returns:
+        list: [{'name', 'start', 'end', 'is_default', 'estimated_rows'}, ...] (start 순)
+    """
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = %s
+        """,
+        [TABLE]
+    )
+
+    partitions = []
+    for name, bound, rows in cursor.fetchall():
+        match = _BOUND_PATTERN.search(bound or '')
+        partitions.append({
+            'name': name,
+            'start': int(match.group(1)) if match else None,
+            'end': int(match.group(2)) if match else None,
+            'is_default': bound == 'DEFAULT',
+            'estimated_rows': max(rows, 0),
+        })
+
+    return sorted(partitions, key=lambda p: (p['is_default'], p['start'] or 0))
+
+
+def _create_partition(cursor, index, size):
+    """
+    [index*size, (index+1)*size) 범위 파티션 생성
+
+    DEFAULT 파티션에 해당 범위의 행이 있으면 새 파티션으로 옮깁니다.
+    """
+    name = partition_name(index)
+    start, end = index * size, (index + 1) * size
+
+    cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s)", [start, end])
+    has_default_rows = cursor.fetchone()[0]
+
+    if has_default_rows:
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+
+    cursor.execute(f"CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM ({start}) TO ({end})")
+
+    if has_default_rows:
+        cursor.execute(
+            f"INSERT INTO {TABLE} SELECT * FROM {DEFAULT_PARTITION} WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s",
+            [start, end]
+        )
+        cursor.execute(f"DELETE FROM {DEFAULT_PARTITION} WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s", [start, end])
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+
+    return name
+
+
+def _create_partitions(cursor, size, ahead, detached=()):
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM events")
+    max_event_id = cursor.fetchone()[0]
+    last_index = max_event_id // size + ahead
+
+    existing = {p['name'] for p in list_partitions(cursor)} | set(detached)
+    created = []
+    for index in range(last_index + 1):
+        if partition_name(index) not in existing:
+            created.append(_create_partition(cursor, index, size))
+    return created
+
+
+def ensure_partitions(ahead=None):
+    """
+    현재 최대 이벤트 id 이후 ahead개 구간까지 파티션을 미리 생성
+
+    분리(detach)한 구간은 다시 만들지 않습니다.
+
+    Returns:
+        list: 새로 만든 파티션 이름 (파티셔닝되지 않은 DB면 빈 목록)
+    """
+    if not is_supported():
+        return []
+
+    if ahead is None:
+        ahead = getattr(settings, 'AVAILABILITY_PARTITIONS_AHEAD', 2)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not is_partitioned(cursor):
+            return []
+
+        # 분리된 파티션 이전 구간은 다시 만들지 않음
+        partitions = [p for p in list_partitions(cursor) if not p['is_default']]
+        first_index = partitions[0]['start'] // get_partition_size() if partitions else 0
+        detached = [partition_name(index) for index in range(first_index)]
+
+        created = _create_partitions(cursor, get_partition_size(), ahead, detached)
+
+    if created:
+        logger.info(f"가능 시간 파티션 생성: {created}")
+    return created
+
+
+def detach_partition(name, drop=False, force=False):
+    """
+    오래된 파티션 분리 (DETACH는 메타데이터 변경이라 행 수와 관계없이 빠름)
+
+    분리한 테이블은 이벤트 삭제를 막지 않도록 외래 키를 제거하고 보관하며, drop=True면 삭제합니다.
+
+    Args:
+        name: 파티션 이름
+        drop: 분리 후 테이블 삭제
+        force: 삭제되지 않은 이벤트가 구간에 남아 있어도 분리
+
+    Raises:
+        ValueError: 존재하지 않는 파티션, DEFAULT 파티션, 활성 이벤트가 남은 구간
+    """
+    if not is_supported():
+        raise ValueError('PostgreSQL에서만 지원합니다.')
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        partition = next((p for p in list_partitions(cursor) if p['name'] == name), None)
+        if partition is None:
+            raise ValueError(f'파티션을 찾을 수 없습니다: {name}')
+        if partition['is_default']:
+            raise ValueError('DEFAULT 파티션은 분리할 수 없습니다.')
+
+        if not force:
+            cursor.execute(
+                "SELECT COUNT(*) FROM events WHERE id >= %s AND id < %s AND NOT is_deleted",
+                [partition['start'], partition['end']]
+            )
+            active = cursor.fetchone()[0]
+            if active:
+                raise ValueError(f'삭제되지 않은 이벤트 {active}개가 남아 있습니다. (--force 로 강제 분리)')
+
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+
+        if drop:
+            cursor.execute(f"DROP TABLE {name}")
+        else:
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+                [name]
+            )
+            for (constraint,) in cursor.fetchall():
+                cursor.execute(f"ALTER TABLE {name} DROP CONSTRAINT {constraint}")
+
+    logger.info(f"가능 시간 파티션 분리: {name} (drop={drop})")
+    return partition
+
+
+def _table_definitions(cursor, table):
+    """테이블의 제약 조건과 (제약 조건에 속하지 않은) 인덱스 정의 조회"""
+    cursor.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid), conindid FROM pg_constraint WHERE conrelid = %s::regclass",
+        [table]
+    )
+    constraints = cursor.fetchall()
+    constraint_indexes = [row[3] for row in constraints if row[3]]
+
+    cursor.execute(
+        "SELECT pg_get_indexdef(indexrelid) FROM pg_index WHERE indrelid = %s::regclass AND NOT (indexrelid = ANY(%s::oid[]))",
+        [table, constraint_indexes]
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+
+    return constraints, indexes
+
+
+def _rebuild_table(cursor, partitioned, size, ahead):
+    """
+    TABLE을 새로 만들어 행을 옮기고 제약 조건/인덱스를 같은 이름으로 다시 생성
+
+    파티션 테이블의 PK/UNIQUE 제약은 파티션 키를 포함해야 하므로 event_id를 추가하고,
+    일반 테이블로 되돌릴 때는 제거합니다.
+
+    Django 상태와의 차이:
+    - UNIQUE: 모델 unique_together가 (participant, time_slot, event)이므로 일치 (0009 마이그레이션)
+    - PK: DB는 (id, event_id), Django 상태는 id. id 필드를 바꾸는 마이그레이션은 이 함수로
+      일반 테이블로 되돌린 뒤 적용하고 다시 파티셔닝해야 합니다.
+    """
+    old_table = f'{TABLE}_old'
+    sequence = f'{TABLE}_id_seq'
+
+    constraints, indexes = _table_definitions(cursor, TABLE)
+
+    cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {old_table}")
+    partition_clause = f" PARTITION BY RANGE ({PARTITION_KEY})" if partitioned else ''
+    cursor.execute(f"CREATE TABLE {TABLE} (LIKE {old_table} INCLUDING DEFAULTS){partition_clause}")
+
+    # 기존 시퀀스는 이전 테이블과 함께 삭제되므로 새 시퀀스를 만들어 이어서 사용
+    cursor.execute(f"CREATE SEQUENCE {sequence}_new OWNED BY {TABLE}.id")
+    cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{sequence}_new')")
+
+    if partitioned:
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+        _create_partitions(cursor, size, ahead)
+
+    cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {old_table}")
+    cursor.execute(f"SELECT setval('{sequence}_new', COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {TABLE}")
+
+    cursor.execute(f"DROP TABLE {old_table} CASCADE")
+    cursor.execute(f"ALTER SEQUENCE {sequence}_new RENAME TO {sequence}")
+
+    # 제약 조건: PK, UNIQUE 먼저 (인덱스 생성), 외래 키는 마지막
+    for name, kind, definition, _ in sorted(constraints, key=lambda row: row[1] == 'f'):
+        if kind in ('p', 'u'):
+            columns = definition[definition.index('(') + 1:definition.rindex(')')]
+            columns = [column.strip() for column in columns.split(',') if column.strip() != PARTITION_KEY]
+            if partitioned:
+                columns.append(PARTITION_KEY)
+            keyword = 'PRIMARY KEY' if kind == 'p' else 'UNIQUE'
+            definition = f"{keyword} ({', '.join(columns)})"
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}")
+
+    for definition in indexes:
+        cursor.execute(definition)
+
+
+def partition_availability_table(conn=None, size=None, ahead=2):
+    """
+    기존 participant_availabilities를 event_id 범위 파티션 테이블로 변환하고 행을 옮김
+
+    Returns:
+        bool: 변환 여부 (PostgreSQL이 아니거나 이미 파티셔닝되어 있으면 False)
+    """
+    conn = conn or connection
+    if not is_supported(conn):
+        return False
+
+    with conn.cursor() as cursor:
+        if is_partitioned(cursor):
+            return False
+        _rebuild_table(cursor, partitioned=True, size=size or get_partition_size(), ahead=ahead)
+    return True
+
+
+def unpartition_availability_table(conn=None):
+    """파티션 테이블을 일반 테이블로 되돌림 (분리된 파티션의 행은 포함되지 않음)"""
+    conn = conn or connection
+    if not is_supported(conn):
+        return False
+
+    with conn.cursor() as cursor:
+        if not is_partitioned(cursor):
+            return False
+        _rebuild_table(cursor, partitioned=False, size=None, ahead=None)
+    return True
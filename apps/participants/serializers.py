@@ -1,6 +1,7 @@
 from rest_framework import serializers
+from django.db import transaction
 from .models import Participant, ParticipantAvailability
-from apps.events.models import TimeSlot
+from apps.events.slot_grid import get_slot_grid
 
 
 class ParticipantListSerializer(serializers.ModelSerializer):
@@ -44,20 +45,47 @@ class ParticipantSerializer(serializers.ModelSerializer):
 
 
 class SubmitAvailabilitySerializer(serializers.Serializer):
+    """
+    가능 시간 제출 (아래 세 형식 중 하나)
+
+    - available_slot_ids: 타임슬롯 ID 리스트
+    - available_slot_ranges: 슬롯 그리드(이벤트 슬롯을 시작 시각 순으로 나열, 0부터) 기준 [시작, 끝] 구간 리스트 (끝 포함)
+    - available_slot_bitmap: 슬롯 그리드 순서대로 가능 '1', 불가 '0'인 문자열 (길이 = 슬롯 수)
+    """
+    SLOT_FIELDS = ('available_slot_ids', 'available_slot_ranges', 'available_slot_bitmap')
+
     available_slot_ids = serializers.ListField(
         child=serializers.IntegerField(),
         allow_empty=True,
+        required=False,
         help_text="참여 가능한 타임슬롯 ID 리스트"
     )
+    available_slot_ranges = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField(min_value=0), min_length=2, max_length=2),
+        allow_empty=True,
+        required=False,
+        help_text="슬롯 그리드 기준 [시작 인덱스, 끝 인덱스] 구간 리스트 (끝 포함)"
+    )
+    available_slot_bitmap = serializers.CharField(
+        allow_blank=True,
+        trim_whitespace=False,
+        required=False,
+        help_text="슬롯 그리드 순서대로 가능=1, 불가=0 문자열"
+    )
 
-    def validate_available_slot_ids(self, value):
+    def get_participant(self):
         participant = self.context.get('participant')
         if not participant:
             raise serializers.ValidationError("참가자 정보가 필요합니다.")
+        return participant
+
+    def get_grid(self):
+        return get_slot_grid(self.get_participant().event)
 
-        # 해당 이벤트의 타임슬롯인지 확인
-        event_slot_ids = set(participant.event.time_slots.values_list('id', flat=True))
-        invalid_slots = set(value) - event_slot_ids
+    def validate_available_slot_ids(self, value):
+        # 해당 이벤트의 타임슬롯인지 확인 (캐시한 슬롯 그리드 기준)
+        grid = self.get_grid()
+        invalid_slots = {slot_id for slot_id in value if slot_id not in grid}
 
         if invalid_slots:
             raise serializers.ValidationError(
@@ -66,28 +94,72 @@ class SubmitAvailabilitySerializer(serializers.Serializer):
 
         return value
 
-    def save(self):
-        participant = self.context.get('participant')
-        available_slot_ids = self.validated_data['available_slot_ids']
+    def validate_available_slot_ranges(self, value):
+        grid_size = len(self.get_grid())
+        for start, end in value:
+            if start > end:
+                raise serializers.ValidationError(f"구간의 시작이 끝보다 큽니다: [{start}, {end}]")
+            if end >= grid_size:
+                raise serializers.ValidationError(
+                    f"구간이 슬롯 범위(0~{grid_size - 1})를 벗어납니다: [{start}, {end}]"
+                )
+        return value
 
-        # 기존 availabilities 모두 삭제
-        ParticipantAvailability.objects.filter(participant=participant).delete()
+    def validate_available_slot_bitmap(self, value):
+        grid_size = len(self.get_grid())
+        if len(value) != grid_size:
+            raise serializers.ValidationError(f"비트맵 길이가 슬롯 수({grid_size})와 다릅니다: {len(value)}")
+        if value.strip('01'):
+            raise serializers.ValidationError("비트맵은 0과 1로만 구성되어야 합니다.")
+        return value
 
-        # 새로운 availabilities 생성
-        availabilities = [
-            ParticipantAvailability(
-                participant=participant,
-                time_slot_id=slot_id,
-                is_available=True
+    def validate(self, attrs):
+        provided = [field for field in self.SLOT_FIELDS if field in attrs]
+        if len(provided) != 1:
+            raise serializers.ValidationError(
+                "available_slot_ids, available_slot_ranges, available_slot_bitmap 중 하나만 입력해주세요."
             )
-            for slot_id in available_slot_ids
-        ]
 
-        ParticipantAvailability.objects.bulk_create(availabilities)
+        # 구간/비트맵은 슬롯 그리드 순서의 슬롯 ID로 변환
+        if 'available_slot_ranges' in attrs:
+            attrs['available_slot_ids'] = self.get_grid().ids_for_ranges(attrs.pop('available_slot_ranges'))
+        elif 'available_slot_bitmap' in attrs:
+            attrs['available_slot_ids'] = self.get_grid().ids_for_bitmap(attrs.pop('available_slot_bitmap'))
+        else:
+            attrs['available_slot_ids'] = list(dict.fromkeys(attrs['available_slot_ids']))
+
+        return attrs
+
+    def save(self):
+        participant = self.context.get('participant')
+        available_slot_ids = self.validated_data['available_slot_ids']
+        desired = set(available_slot_ids)
+
+        with transaction.atomic():
+            # 기존 내역과 비교해 바뀐 슬롯만 삭제/추가 (event_id 조건으로 해당 파티션만 조회)
+            existing = ParticipantAvailability.objects.filter(event_id=participant.event_id, participant=participant)
+            current = dict(existing.values_list('time_slot_id', 'is_available'))
+
+            removed = [slot_id for slot_id, is_available in current.items() if not is_available or slot_id not in desired]
+            if removed:
+                existing.filter(time_slot_id__in=removed).delete()
+
+            # 같은 참가자의 동시 제출이 같은 슬롯을 추가해도 UNIQUE (participant, time_slot) 충돌은 무시
+            kept = {slot_id for slot_id, is_available in current.items() if is_available and slot_id in desired}
+            ParticipantAvailability.objects.bulk_create([
+                ParticipantAvailability(
+                    participant=participant,
+                    time_slot_id=slot_id,
+                    event_id=participant.event_id,
+                    is_available=True
+                )
+                for slot_id in available_slot_ids
+                if slot_id not in kept
+            ], ignore_conflicts=True)
 
         return {
             'participant_id': participant.id,
-            'event_id': participant.event.id,
+            'event_id': participant.event_id,
             'submitted_count': len(available_slot_ids),
             'available_slot_ids': available_slot_ids
         }
@@ -103,6 +175,7 @@ class AvailabilityRetrieveSerializer(serializers.Serializer):
     def to_representation(self, participant):
         # 참가자의 가능한 타임슬롯 조회
         available_slots = ParticipantAvailability.objects.filter(
+            event_id=participant.event_id,
             participant=participant,
             is_available=True
         ).values_list('time_slot_id', flat=True)
@@ -110,7 +183,7 @@ class AvailabilityRetrieveSerializer(serializers.Serializer):
         return {
             'participant_id': participant.id,
             'participant_nickname': participant.nickname,
-            'event_id': participant.event.id,
+            'event_id': participant.event_id,
             'available_slot_ids': list(available_slots),
             'total_available': len(available_slots)
         }
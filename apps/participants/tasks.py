@@ -0,0 +1,19 @@
+from celery import shared_task
+from .partitions import ensure_partitions
+
+
+@shared_task
+def ensure_availability_partitions():
+    # 새 이벤트가 DEFAULT 파티션에 쌓이지 않도록 다음 event_id 구간 파티션을 미리 만드는 Celery task
+    try:
+        created = ensure_partitions()
+        return {
+            'success': True,
+            'created_partitions': created,
+            'message': f'{len(created)}개의 파티션을 생성했습니다.'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'파티션 생성 중 오류가 발생했습니다: {str(e)}'
+        }
@@ -1,3 +1,190 @@
+from unittest import mock
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.events.benchmark import Scale, seed_event
+from apps.events.tests import QueryCountTestCase, SMALL
+from .models import ParticipantAvailability
+from .serializers import SubmitAvailabilitySerializer
 
-# Create your tests here.
+
+class ParticipantQueryCountTests(QueryCountTestCase):
+
+    def test_participant_list(self):
+        def request(client, user, event, *_):
+            client.force_authenticate(user=user)
+            return client.get(f'/api/v1/events/{event.id}/participants')
+
+        self.assertConstantQueries(request, max_queries=2)
+
+    def test_availability_retrieve(self):
+        self.assertConstantQueries(
+            lambda client, user, event, participants, slot_ids: client.get(
+                f'/api/v1/participants/{participants[0].id}/availabilities/'
+            ),
+            max_queries=2,
+        )
+
+    def test_availability_submit(self):
+        self.assertConstantQueries(
+            lambda client, user, event, participants, slot_ids: client.post(
+                f'/api/v1/participants/{participants[0].id}/availabilities/',
+                {'available_slot_ids': slot_ids[::2]},
+                format='json',
+            ),
+            max_queries=7,  # 기존 내역 비교 + 트랜잭션(테스트에서는 SAVEPOINT/RELEASE) 포함
+        )
+
+
+class AvailabilitySubmitTests(TestCase):
+
+    def test_submit_stores_event_id(self):
+        # 파티션 키(event_id)가 참가자의 이벤트로 채워져야 함
+        _, event, participants, slot_ids = seed_event(SMALL)
+        response = APIClient().post(
+            f'/api/v1/participants/{participants[0].id}/availabilities/',
+            {'available_slot_ids': slot_ids},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        stored = ParticipantAvailability.objects.filter(participant=participants[0])
+        self.assertEqual(stored.count(), len(slot_ids))
+        self.assertFalse(stored.exclude(event_id=event.id).exists())
+
+    def submit(self, participant, data):
+        return APIClient().post(f'/api/v1/participants/{participant.id}/availabilities/', data, format='json')
+
+    def test_ranges_and_bitmap_match_slot_ids(self):
+        _, event, participants, _ = seed_event(SMALL)
+        grid = list(event.time_slots.order_by('start_datetime').values_list('id', flat=True))
+        expected = grid[0:2] + grid[3:4]
+
+        for data in (
+            {'available_slot_ids': expected},
+            {'available_slot_ranges': [[0, 1], [1, 1], [3, 3]]},
+            {'available_slot_bitmap': '1101'.ljust(len(grid), '0')},
+        ):
+            response = self.submit(participants[0], data)
+            self.assertEqual(response.status_code, 200, response.data)
+            self.assertEqual(response.data['available_slot_ids'], expected)
+            stored = ParticipantAvailability.objects.filter(participant=participants[0])
+            self.assertEqual(sorted(stored.values_list('time_slot_id', flat=True)), sorted(expected))
+
+    def test_resubmit_keeps_unchanged_rows(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        self.submit(participants[0], {'available_slot_ids': slot_ids[:2]})
+        kept = ParticipantAvailability.objects.get(participant=participants[0], time_slot_id=slot_ids[0])
+
+        self.submit(participants[0], {'available_slot_ids': [slot_ids[0], slot_ids[2]]})
+        stored = ParticipantAvailability.objects.filter(participant=participants[0])
+        self.assertEqual(sorted(stored.values_list('time_slot_id', flat=True)), [slot_ids[0], slot_ids[2]])
+        self.assertTrue(stored.filter(pk=kept.pk).exists())
+
+    def test_concurrent_submit_does_not_conflict(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        participant = participants[0]
+        ParticipantAvailability.objects.filter(participant=participant).delete()
+        serializer = SubmitAvailabilitySerializer(
+            data={'available_slot_ids': slot_ids[:2]}, context={'participant': participant}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        values_list = QuerySet.values_list
+
+        def read_then_race(queryset, *fields, **kwargs):
+            # 기존 내역을 읽은 직후 다른 요청이 같은 슬롯을 먼저 저장
+            rows = list(values_list(queryset, *fields, **kwargs))
+            ParticipantAvailability.objects.create(participant=participant, time_slot_id=slot_ids[0], event=event)
+            return rows
+
+        with mock.patch.object(QuerySet, 'values_list', autospec=True, side_effect=read_then_race):
+            serializer.save()
+
+        stored = ParticipantAvailability.objects.filter(participant=participant)
+        self.assertEqual(sorted(stored.values_list('time_slot_id', flat=True)), sorted(slot_ids[:2]))
+
+    def test_slot_ids_validated_without_loading_slots(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        self.submit(participants[0], {'available_slot_ids': slot_ids[:1]})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.submit(participants[0], {'available_slot_ids': slot_ids[1:]})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if 'FROM "time_slots"' in query['sql']])
+
+        self.assertEqual(self.submit(participants[0], {'available_slot_ids': [-1]}).status_code, 400)
+
+    def test_invalid_grid_input(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        for data in (
+            {'available_slot_ranges': [[0, len(slot_ids)]]},
+            {'available_slot_ranges': [[2, 1]]},
+            {'available_slot_bitmap': '1'},
+            {'available_slot_bitmap': 'x' * len(slot_ids)},
+            {'available_slot_ids': slot_ids[:1], 'available_slot_bitmap': '1' * len(slot_ids)},
+            {},
+        ):
+            self.assertEqual(self.submit(participants[0], data).status_code, 400, data)
+
+
+class ParticipantAvailabilityModelTests(TestCase):
+
+    def test_event_derived_from_participant(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        ParticipantAvailability.objects.filter(participant=participants[0]).delete()
+
+        availability = ParticipantAvailability.objects.create(participant=participants[0], time_slot_id=slot_ids[0])
+        self.assertEqual(availability.event_id, event.id)
+
+    def test_clean_rejects_other_event_slot(self):
+        _, event, participants, slot_ids = seed_event(SMALL)
+        _, other_event, _, other_slot_ids = seed_event(Scale(days=1, participants=1, seed=3))
+
+        availability = ParticipantAvailability(participant=participants[0], time_slot_id=other_slot_ids[0])
+        with self.assertRaises(ValidationError):
+            availability.clean()
+        ParticipantAvailability(participant=participants[0], time_slot_id=slot_ids[0]).clean()
+
+
+class ParticipantPaginationTests(TestCase):
+
+    def test_cursor_pages_match_page_numbers(self):
+        user, event, *_ = seed_event(Scale(days=1, participants=25, seed=4))
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = f'/api/v1/events/{event.id}/participants'
+
+        by_page = []
+        for page in (1, 2, 3):
+            by_page += [item['id'] for item in client.get(url, {'page': page, 'size': 10}).data['items']]
+
+        by_cursor = []
+        cursor = ''
+        while cursor is not None:
+            data = client.get(url, {'cursor': cursor, 'size': 10}).data
+            self.assertIsNone(data['total'])
+            by_cursor += [item['id'] for item in data['items']]
+            cursor = data['next_cursor']
+
+        self.assertEqual(len(by_cursor), 25)
+        self.assertEqual(sorted(by_cursor), sorted(by_page))
+        self.assertEqual(client.get(url, {'cursor': '', 'with_total': 'true'}).data['total'], 25)
+        self.assertEqual(client.get(url, {'cursor': 'invalid'}).status_code, 404)
+
+    def test_total_is_approximate_above_limit(self):
+        user, event, *_ = seed_event(Scale(days=1, participants=25, seed=5))
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = f'/api/v1/events/{event.id}/participants'
+
+        data = client.get(url, {'size': 10}).data
+        self.assertEqual((data['total'], data['total_is_exact']), (25, True))
+
+        with self.settings(PAGINATION_EXACT_COUNT_LIMIT=10):
+            data = client.get(url, {'page': 3, 'size': 10}).data
+            self.assertFalse(data['total_is_exact'])
+            self.assertEqual(len(data['items']), 5)
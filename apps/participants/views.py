@@ -73,6 +73,7 @@ class ParticipantListView(generics.ListAPIView):
     serializer_class = ParticipantListSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = ParticipantPagination
+    stateless_authentication = True  # user_id만 필요하므로 TokenUser 사용 (활성 여부는 캐시로 검사)
 
     def get_queryset(self):
         event_id = self.kwargs.get('event_id')
@@ -114,12 +115,13 @@ class AvailabilityView(generics.GenericAPIView):
     def post(self, request, *args, **kwargs):
         """가능 시간 저장"""
         participant_id = self.kwargs.get('participant_id')
-        participant = get_object_or_404(Participant, id=participant_id)
+        # 슬롯 그리드 캐시 버전 확인에 이벤트가 필요하므로 함께 조회
+        participant = get_object_or_404(Participant.objects.select_related('event'), id=participant_id)
 
         # 권한 체크: 로그인한 사용자는 본인의 참가자만, 익명은 누구나 가능
         if request.user.is_authenticated:
             # 로그인한 경우, 본인의 참가자인지 확인
-            if participant.user and participant.user != request.user:
+            if participant.user_id and participant.user_id != request.user.id:
                 raise PermissionDenied("이 참가자의 가능 시간을 제출할 권한이 없습니다.")
 
         serializer = SubmitAvailabilitySerializer(
@@ -0,0 +1,61 @@
+"""
+캐시 접근 헬퍼
+
+Redis 장애가 API 장애로 번지지 않도록 캐시 오류를 로그로 남기고 캐시 미스로 처리합니다.
+"""
+import logging
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def cache_get(key, default=None):
+    try:
+        return cache.get(key, default)
+    except Exception as e:
+        logger.warning(f"캐시 조회 실패 ({key}): {str(e)}")
+        return default
+
+
+def cache_get_many(keys):
+    try:
+        return cache.get_many(keys)
+    except Exception as e:
+        logger.warning(f"캐시 일괄 조회 실패: {str(e)}")
+        return {}
+
+
+def cache_set(key, value, timeout=None):
+    try:
+        cache.set(key, value, timeout)
+        return True
+    except Exception as e:
+        logger.warning(f"캐시 저장 실패 ({key}): {str(e)}")
+        return False
+
+
+def cache_set_many(data, timeout=None):
+    try:
+        cache.set_many(data, timeout)
+        return True
+    except Exception as e:
+        logger.warning(f"캐시 일괄 저장 실패: {str(e)}")
+        return False
+
+
+def cache_delete(key):
+    try:
+        cache.delete(key)
+        return True
+    except Exception as e:
+        logger.warning(f"캐시 삭제 실패 ({key}): {str(e)}")
+        return False
+
+
+def cache_delete_many(keys):
+    try:
+        cache.delete_many(keys)
+        return True
+    except Exception as e:
+        logger.warning(f"캐시 일괄 삭제 실패: {str(e)}")
+        return False
@@ -5,7 +5,7 @@ from celery import Celery
 django_env = os.environ.get('DJANGO_ENVIRONMENT', 'development')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'config.settings.{django_env}')
 
-app = Celery('pizza')
+app = Celery('pizza', task_cls='apps.monitoring.celery:MonitoredTask')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
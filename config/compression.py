@@ -0,0 +1,120 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip으로 압축합니다.
+- JSON/텍스트 응답만, COMPRESSION_MIN_SIZE(기본 1KB) 이상일 때만 압축 (스트리밍 응답은 항상)
+- Accept-Encoding 해석(q값, *, identity)은 choose_encoding()에서만 하고,
+  gzip이 선택된 경우에만 Django GZipMiddleware 그대로 사용 (BREACH 완화용 랜덤 패딩, ETag 약화, 스트리밍 처리)
+- brotli는 같은 규칙으로 처리하며, 응답마다 압축기를 새로 만들어 청크 단위로 압축
+  (brotli에는 랜덤 패딩을 넣지 않음)
+"""
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'image/svg+xml')
+
+# 텍스트/JSON 응답에 적합한 압축률 대비 속도 (0~11)
+BROTLI_QUALITY = 5
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더 → {인코딩: q값}
+
+    'gzip, br;q=0.9, *;q=0' → {'gzip': 1.0, 'br': 0.9, '*': 0.0}
+    """
+    encodings = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[coding] = q
+    return encodings
+
+
+def choose_encoding(header, allow_brotli=True):
+    """
+    사용할 인코딩 ('br', 'gzip', None)
+
+    q값이 높은 쪽을 고르고, 같으면 압축률이 좋은 brotli를 우선합니다.
+    q=0인 인코딩은 고르지 않으며, 고를 수 있는 인코딩이 없으면 None(압축하지 않음)입니다.
+    """
+    encodings = parse_accept_encoding(header)
+    wildcard = encodings.get('*', 0.0)
+
+    candidates = ['br', 'gzip'] if brotli is not None and allow_brotli else ['gzip']
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = encodings.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def _brotli_stream(sequence):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '')
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+
+        min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        # 비동기 스트리밍 응답은 brotli로 감싸지 않으므로 gzip만 후보로 선택
+        encoding = choose_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''),
+            allow_brotli=not (response.streaming and response.is_async),
+        )
+        if encoding is None:
+            patch_vary_headers(response, ('Accept-Encoding',))
+            return response
+        if encoding == 'gzip':
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        if response.streaming:
+            response.streaming_content = _brotli_stream(response.streaming_content)
+            del response.headers['Content-Length']
+        else:
+            compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+
+        return response
@@ -20,6 +20,7 @@ def custom_exception_handler(exc, context):
             'Invalid token.': '유효하지 않은 토큰입니다',
             'Given token not valid for any token type': '유효하지 않은 토큰입니다',
             'Token is invalid or expired': '토큰이 만료되었거나 유효하지 않습니다',
+            'Token is blacklisted': '폐기된 토큰입니다',
             'User not found': '사용자를 찾을 수 없습니다',
             'No active account found with the given credentials': '해당 계정을 찾을 수 없습니다',
             'Method not allowed.': '허용되지 않은 메서드입니다',
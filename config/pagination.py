@@ -0,0 +1,173 @@
+"""
+목록 API 페이지네이션
+
+기본은 기존과 같은 페이지 번호 방식(page, size)이고,
+cursor 파라미터가 있으면 (created_at, id) 키셋 방식으로 다음 페이지를 조회합니다.
+
+- 키셋 방식은 OFFSET 없이 인덱스에서 마지막 위치 다음 행부터 읽으므로 페이지 깊이와 관계없이 일정한 속도
+- 전체 개수(COUNT)는 with_total=true일 때만 계산
+- 응답 형식(items, total, page, size)은 유지하고 next_cursor를 추가 (키셋 방식의 page는 null)
+
+전체 개수는 PAGINATION_EXACT_COUNT_LIMIT 이하면 정확히 세고, 넘으면 근사값을 사용합니다. (total_is_exact로 구분)
+- PostgreSQL: 플래너 통계(EXPLAIN) 추정치
+- 그 외 DB: 정확한 개수를 PAGINATION_COUNT_CACHE_TIMEOUT초 동안 캐시
+"""
+import base64
+import hashlib
+import json
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from .cache_utils import cache_get, cache_set
+
+
+def _planner_estimate(queryset):
+    """PostgreSQL 플래너가 추정한 결과 행 수"""
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _cached_count(queryset):
+    key = 'pagination:count:' + hashlib.md5(str(queryset.order_by().query).encode()).hexdigest()
+    count = cache_get(key)
+    if count is None:
+        count = queryset.count()
+        cache_set(key, count, getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 60))
+    return count
+
+
+def estimate_count(queryset):
+    """
+    전체 개수 (작은 결과는 정확히, 큰 결과는 근사값)
+
+    LIMIT을 건 COUNT로 기준 이하인지 먼저 확인하므로 결과가 커도 정확한 개수를 세지 않습니다.
+
+    Returns:
+        tuple: (개수, 정확한 값 여부)
+    """
+    limit = getattr(settings, 'PAGINATION_EXACT_COUNT_LIMIT', 1000)
+    bounded = queryset.order_by()[:limit + 1].count()
+    if bounded <= limit:
+        return bounded, True
+
+    if connections[queryset.db].vendor == 'postgresql':
+        # 추정치가 실제보다 작게 나와도 기준보다는 크다는 것이 확인됨
+        return max(_planner_estimate(queryset), limit + 1), False
+
+    return _cached_count(queryset), False
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    count에 estimate_count를 사용하는 Paginator
+
+    근사값이면 실제 행이 더 있을 수 있으므로 마지막 페이지 범위를 제한하지 않습니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_is_exact = True
+
+    @property
+    def count(self):
+        if not hasattr(self, '_count'):
+            self._count, self.count_is_exact = estimate_count(self.object_list)
+        return self._count
+
+    def validate_number(self, number):
+        self.count
+        if self.count_is_exact:
+            return super().validate_number(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('페이지 번호가 정수가 아닙니다.')
+        if number < 1:
+            raise EmptyPage('페이지 번호는 1 이상이어야 합니다.')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_is_exact:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+
+
+class KeysetPageNumberPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
+    page_size_query_param = 'size'
+    page_query_param = 'page'
+    max_page_size = 100
+
+    cursor_query_param = 'cursor'
+    total_query_param = 'with_total'
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.size = self.get_page_size(request)
+        if request.query_params.get(self.total_query_param) == 'true':
+            self.total, self.total_is_exact = estimate_count(queryset)
+        else:
+            self.total, self.total_is_exact = None, None
+
+        queryset = queryset.order_by('-created_at', '-id')
+        cursor = self.decode_cursor(request.query_params[self.cursor_query_param])
+        if cursor:
+            created_at, pk = cursor
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+        rows = list(queryset[:self.size + 1])
+        has_next = len(rows) > self.size
+        rows = rows[:self.size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if has_next else None
+        return rows
+
+    def encode_cursor(self, obj):
+        payload = json.dumps([obj.created_at.isoformat(), obj.pk])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, value):
+        """빈 값이면 첫 페이지(None)"""
+        if not value:
+            return None
+        try:
+            payload = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+            created_at, pk = json.loads(payload)
+            created_at = parse_datetime(created_at)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None or not isinstance(pk, int):
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+    def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return Response({
+                'items': data,
+                'total': self.total,
+                'total_is_exact': self.total_is_exact,
+                'page': None,
+                'size': self.size,
+                'next_cursor': self.next_cursor,
+            })
+
+        return Response({
+            'items': data,
+            'total': self.page.paginator.count,
+            'total_is_exact': self.page.paginator.count_is_exact,
+            'page': self.page.number,
+            'size': self.page.paginator.per_page
+        })
@@ -0,0 +1,32 @@
+"""
+JSON 파서
+
+orjson이 설치되어 있으면 orjson으로 파싱하고, 없으면 DRF JSONParser(표준 json)를 그대로 사용합니다.
+orjson은 UTF-8만 받고 NaN/Infinity를 거부하므로 UTF-8 요청 + STRICT_JSON일 때만 사용합니다.
+"""
+import codecs
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from .renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,21 @@
+"""
+Redis 클라이언트
+
+Django 캐시 API로 표현하기 어려운 자료구조(hash 등)가 필요할 때 사용합니다.
+"""
+import redis
+from django.conf import settings
+
+_client = None
+
+
+def get_redis():
+    global _client
+
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_CACHE_URL,
+            socket_timeout=2,
+            socket_connect_timeout=2,
+        )
+    return _client
@@ -0,0 +1,46 @@
+"""
+JSON 렌더러
+
+orjson이 설치되어 있으면 orjson으로 직렬화하고, 없으면 DRF JSONRenderer(표준 json)를 그대로 사용합니다.
+출력은 DRF JSONRenderer와 같습니다.
+- datetime/date/time, Decimal, QuerySet 등은 DRF JSONEncoder 규칙으로 변환 (UTC는 'Z', time은 밀리초까지)
+- 한글은 이스케이프하지 않은 UTF-8, 공백 없는 구분자 (UNICODE_JSON, COMPACT_JSON 기본값)
+- U+2028, U+2029는 JavaScript 호환을 위해 이스케이프
+indent 요청, UNICODE_JSON/COMPACT_JSON 비활성화, orjson이 처리할 수 없는 값(64비트를 넘는 정수 등)은 표준 json으로 처리합니다.
+(NaN/Infinity는 표준 json의 STRICT_JSON 오류 대신 null로 출력)
+"""
+from rest_framework.utils import encoders
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = encoders.JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or not (self.ensure_ascii is False and self.compact):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
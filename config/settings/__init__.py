@@ -5,5 +5,7 @@ env = os.environ.get('DJANGO_ENVIRONMENT', 'development')
 
 if env == 'production':
     from .production import *
+elif env == 'test':
+    from .test import *
 else:
     from .development import *
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 from datetime import timedelta
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -35,9 +36,13 @@ INSTALLED_APPS = [
     'apps.events',
     'apps.participants',
     'apps.availability',
+    'apps.monitoring',
 ]
 
 MIDDLEWARE = [
+    'apps.monitoring.middleware.MetricsMiddleware',
+    'apps.monitoring.middleware.ProfilingMiddleware',
+    'config.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -123,7 +128,12 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'config.renderers.FastJSONRenderer',  # orjson 사용 (미설치 시 표준 json)
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'config.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'EXCEPTION_HANDLER': 'config.exception_handler.custom_exception_handler',
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -134,8 +144,8 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
-    'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    'BLACKLIST_AFTER_ROTATION': True,  # 회전된 토큰은 Redis 레지스트리에 폐기 기록 (apps.accounts.token_registry)
+    'UPDATE_LAST_LOGIN': False,  # last_login은 apps.accounts.login_tracker가 모아서 일괄 저장
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -152,6 +162,42 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
+CELERY_BEAT_SCHEDULE = {
+    'flush-last-login': {
+        'task': 'apps.accounts.tasks.flush_last_login',
+        'schedule': 60.0,
+    },
+    'ensure-availability-partitions': {
+        'task': 'apps.participants.tasks.ensure_availability_partitions',
+        'schedule': timedelta(hours=6),
+    },
+    'archive-events': {
+        'task': 'apps.events.tasks.archive_events',
+        'schedule': crontab(hour=4, minute=0),  # 트래픽이 적은 새벽
+    },
+}
+
+# 가능 시간 테이블 파티셔닝 (PostgreSQL): event_id 구간 크기, 미리 만들어 둘 구간 수
+AVAILABILITY_PARTITION_SIZE = int(os.environ.get('AVAILABILITY_PARTITION_SIZE', 50000))
+AVAILABILITY_PARTITIONS_AHEAD = int(os.environ.get('AVAILABILITY_PARTITIONS_AHEAD', 2))
+
+# 목록 전체 개수: 이 개수를 넘으면 근사값 사용 (PostgreSQL 플래너 추정치, 그 외 DB는 캐시한 개수)
+PAGINATION_EXACT_COUNT_LIMIT = 1000
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+# 응답 압축 (config.compression.CompressionMiddleware): 이 크기(bytes) 미만의 응답은 압축하지 않음
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+# 대시보드 스트리밍 응답: 슬롯 수 + 가능 시간 제출 수가 이 값 이상이면 히트맵을 스트리밍으로 전송
+STREAMING_JSON_MIN_ITEMS = int(os.environ.get('STREAMING_JSON_MIN_ITEMS', 10000))
+
+# 이벤트 보관: 삭제 후 / 종료일 이후 보관까지의 일수, 스냅샷 배치 크기, 삭제 청크 크기, 1회 최대 처리 수
+# (최종 시간이 확정된 이벤트는 캘린더 구독 피드에 남도록 기간 만료로 보관하지 않음)
+ARCHIVE_DELETED_AFTER_DAYS = int(os.environ.get('ARCHIVE_DELETED_AFTER_DAYS', 7))
+ARCHIVE_EXPIRED_AFTER_DAYS = int(os.environ.get('ARCHIVE_EXPIRED_AFTER_DAYS', 180))
+ARCHIVE_BATCH_SIZE = 100
+ARCHIVE_DELETE_CHUNK_SIZE = 5000
+ARCHIVE_MAX_EVENTS_PER_RUN = 5000
 
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -216,3 +262,53 @@ KAKAO_REST_API_KEY = os.environ.get('KAKAO_REST_API_KEY', '')
 SOLAPI_API_KEY = os.environ.get('SOLAPI_API_KEY', '')
 SOLAPI_API_SECRET = os.environ.get('SOLAPI_API_SECRET', '')
 SOLAPI_SENDER_NUMBER = os.environ.get('SOLAPI_SENDER_NUMBER', '')  # 발신번호 (사전 등록 필요)
+
+# Solapi 일괄 발송 (send-many) 설정
+SOLAPI_BATCH_SIZE = int(os.environ.get('SOLAPI_BATCH_SIZE', 500))  # 요청당 최대 메시지 수
+SOLAPI_MAX_CONCURRENCY = int(os.environ.get('SOLAPI_MAX_CONCURRENCY', 4))  # 동시 요청 수
+SOLAPI_RATE_LIMIT = float(os.environ.get('SOLAPI_RATE_LIMIT', 10))  # 초당 요청 수 (0이면 제한 없음)
+SOLAPI_MAX_RETRIES = int(os.environ.get('SOLAPI_MAX_RETRIES', 2))  # 실패한 청크 재시도 횟수
+SOLAPI_RETRY_BACKOFF = float(os.environ.get('SOLAPI_RETRY_BACKOFF', 1.0))  # 재시도 대기 시간 (초, 지수 증가)
+SOLAPI_REQUEST_TIMEOUT = int(os.environ.get('SOLAPI_REQUEST_TIMEOUT', 30))
+
+# Cache (Redis)
+REDIS_CACHE_URL = os.environ.get('REDIS_CACHE_URL', 'redis://localhost:6379/1')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+        'KEY_PREFIX': 'pizza',
+        'TIMEOUT': 300,
+    }
+}
+
+# QR 코드 렌더링 캐시 유지 시간 (초)
+QR_CACHE_TIMEOUT = int(os.environ.get('QR_CACHE_TIMEOUT', 30 * 24 * 3600))
+
+# 미리 생성한 공유 정보 캐시 유지 시간 (초)
+SHARE_ASSETS_CACHE_TIMEOUT = int(os.environ.get('SHARE_ASSETS_CACHE_TIMEOUT', 7 * 24 * 3600))
+
+# 캘린더(.ics) VEVENT 블록 캐시 유지 시간 (초)
+ICS_CACHE_TIMEOUT = int(os.environ.get('ICS_CACHE_TIMEOUT', 7 * 24 * 3600))
+
+# 이벤트 슬롯 그리드(시작 시각 순 슬롯 id) 캐시 유지 시간 (초)
+SLOT_GRID_CACHE_TIMEOUT = int(os.environ.get('SLOT_GRID_CACHE_TIMEOUT', 24 * 3600))
+
+# 인증 사용자 캐시 (초)
+AUTH_USER_CACHE_TTL = int(os.environ.get('AUTH_USER_CACHE_TTL', 300))  # Redis
+AUTH_USER_LOCAL_CACHE_TTL = int(os.environ.get('AUTH_USER_LOCAL_CACHE_TTL', 5))  # 프로세스 메모리
+
+# last_login 일괄 저장 배치 크기
+LAST_LOGIN_FLUSH_BATCH_SIZE = int(os.environ.get('LAST_LOGIN_FLUSH_BATCH_SIZE', 500))
+
+# 지표 저장소 ('redis': gunicorn 워커 간 공유, 'local': 프로세스 메모리)
+METRICS_BACKEND = os.environ.get('METRICS_BACKEND', 'redis')
+# 'redis' 저장소: 프로세스 메모리에 모은 지표를 Redis에 반영하는 주기 (초)
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 10))
+
+# /metrics 접근 토큰 (비어 있으면 접근 거부, nginx에서는 프록시하지 않음)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# 요청 프로파일링 (apps.monitoring.middleware.ProfilingMiddleware)
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0.0))  # 0.0 ~ 1.0
+PROFILING_ALLOW_HEADER = os.environ.get('PROFILING_ALLOW_HEADER', 'False').lower() == 'true'  # X-Profile: 1
@@ -10,7 +10,7 @@ EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.Em
 
 # DRF: Add browsable API in development
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
-    'rest_framework.renderers.JSONRenderer',
+    'config.renderers.FastJSONRenderer',
     'rest_framework.renderers.BrowsableAPIRenderer',
 ]
 
@@ -19,7 +19,14 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 # Add debug toolbar
 INSTALLED_APPS += ['debug_toolbar']
-MIDDLEWARE.insert(0, 'debug_toolbar.middleware.DebugToolbarMiddleware')
+# 응답 압축 미들웨어보다 뒤에 두어야 압축 전 응답을 수정할 수 있음
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('config.compression.CompressionMiddleware') + 1,
+    'debug_toolbar.middleware.DebugToolbarMiddleware'
+)
+
+# 개발 환경에서는 X-Profile 헤더로 프로파일링 허용
+PROFILING_ALLOW_HEADER = True
 
 INTERNAL_IPS = [
     '127.0.0.1',
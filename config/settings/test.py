@@ -0,0 +1,31 @@
+from .base import *
+import os
+
+# 테스트 환경: 기본은 SQLite, TEST_DB=postgres 이면 base의 PostgreSQL 설정 사용
+if os.environ.get('TEST_DB', 'sqlite') != 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+    # SQLite는 커버링 인덱스(INCLUDE)를 지원하지 않아 포함 컬럼 없이 생성됨
+    SILENCED_SYSTEM_CHECKS = ['models.W040']
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = False
+
+# 지표/프로파일링은 프로세스 메모리에 기록
+METRICS_BACKEND = 'local'
+PROFILING_SAMPLE_RATE = 0.0
@@ -0,0 +1,70 @@
+"""
+스트리밍 JSON 응답
+
+큰 목록을 전부 dict로 만들고 한 번에 직렬화하면 (dict 목록 + Serializer 결과 + 응답 bytes) 메모리가 크게 늘어납니다.
+JSONStream으로 감싼 목록은 항목을 하나씩 만들어 바로 직렬화하고, 응답은 STREAM_CHUNK_SIZE 단위로 내보냅니다.
+항목 직렬화는 FastJSONRenderer를 사용하므로 일반 응답과 같은 JSON이 만들어집니다.
+"""
+from django.http import StreamingHttpResponse
+from .renderers import FastJSONRenderer
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class JSONStream:
+    """지연 생성되는 JSON 배열 (iterable은 한 번만 순회)"""
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+
+
+def _contains_stream(data):
+    if isinstance(data, JSONStream):
+        return True
+    return isinstance(data, dict) and any(_contains_stream(value) for value in data.values())
+
+
+def iter_json(data, renderer=None):
+    """data를 JSON bytes 조각으로 직렬화 (dict 안의 JSONStream은 항목 단위로)"""
+    renderer = renderer or FastJSONRenderer()
+
+    if isinstance(data, JSONStream):
+        yield b'['
+        first = True
+        for item in data.iterable:
+            if not first:
+                yield b','
+            first = False
+            yield from iter_json(item, renderer)
+        yield b']'
+    elif _contains_stream(data):
+        yield b'{'
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                yield b','
+            yield renderer.render(str(key))
+            yield b':'
+            yield from iter_json(value, renderer)
+        yield b'}'
+    elif data is None:
+        yield b'null'
+    else:
+        yield renderer.render(data)
+
+
+def _buffered(chunks, size):
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+
+    def __init__(self, data, status=200, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(_buffered(iter_json(data), STREAM_CHUNK_SIZE), status=status, **kwargs)
@@ -2,17 +2,22 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from apps.monitoring.views import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/auth/', include('apps.accounts.urls')),
     path('api/v1/events/', include('apps.events.urls')),
     path('api/v1/participants/', include('apps.participants.urls')),
+    path('api/v1/monitoring/', include('apps.monitoring.urls')),
 
     # API Documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+
+    # Prometheus 지표 (내부 수집용)
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # Add debug toolbar in development